@@ -1,12 +1,15 @@
+import io
 import os
 import sys
 import json
 import time
+import codecs
 import random
 import asyncio
 import logging
 import argparse
-import pyfiglet
+import contextlib
+import contextvars
 from pathlib import Path
 from typing import Optional, Tuple, List, Dict, Any, Callable
 from functools import wraps
@@ -21,7 +24,7 @@ from pyquotex.utils.processor import (
     get_color,
     aggregate_candle
 )
-from pyquotex.config import credentials
+from pyquotex.config import credentials, resource_path
 from pyquotex.stable_api import Quotex
 
 __author__ = "Cleiton Leonel Creton"
@@ -29,6 +32,8 @@ __version__ = "1.0.3"
 
 USER_AGENT = "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/119.0"
 
+DAEMON_SOCKET = resource_path("pyquotex.sock")
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -95,7 +100,7 @@ def ensure_connection(max_attempts: int = 5):
                 result = await func(self, *args, **kwargs)
                 return result
             finally:
-                if self.client and await self.client.check_connect():
+                if not self.persistent and self.client and await self.client.check_connect():
                     await self.client.close()
                     logger.debug("Connection closed after operation.")
 
@@ -107,8 +112,9 @@ def ensure_connection(max_attempts: int = 5):
 class PyQuotexCLI:
     """PyQuotex CLI application for trading operations."""
 
-    def __init__(self):
+    def __init__(self, persistent: bool = False):
         self.client: Optional[Quotex] = None
+        self.persistent = persistent
         self.setup_client()
 
     def setup_client(self):
@@ -126,35 +132,24 @@ class PyQuotexCLI:
             raise
 
     async def _connect_with_retry(self, attempts: int = 5) -> Tuple[bool, str]:
-        """Internal method to attempt connection with retry logic."""
+        """Internal method to attempt connection with retry logic.
+
+        The retries, backoff and re-login on a rejected token are done by
+        :meth:`Quotex.connect` itself.
+        """
         logger.info("Attempting to connect to Quotex API...")
-        check, reason = await self.client.connect()
+        check, reason = await self.client.connect(attempts=attempts)
 
         if not check:
-            for attempt_num in range(1, attempts + 1):
-                logger.warning(f"Connection failed. Attempt {attempt_num} of {attempts}.")
-
-                session_file = Path("session.json")
-                if session_file.exists():
-                    session_file.unlink()
-                    logger.debug("Obsolete session file removed.")
-
-                await asyncio.sleep(2)
-                check, reason = await self.client.connect()
-
-                if check:
-                    logger.info("Reconnected successfully!")
-                    break
-
-            if not check:
-                logger.error(f"Failed to connect after {attempts} attempts: {reason}")
-                return False, reason
+            logger.error(f"Failed to connect after {attempts} attempts: {reason}")
+            return False, reason
 
         logger.info(f"Connected successfully: {reason}")
         return check, reason
 
     def display_banner(self):
         """Displays the application banner, including the private version ad."""
+        import pyfiglet
         custom_font = pyfiglet.Figlet(font="ansi_shadow")
         ascii_art = custom_font.renderText("PyQuotex")
 
@@ -279,7 +274,7 @@ class PyQuotexCLI:
         print(f"📊 Trade executed (ID: {buy_info.get('id', 'N/A')}), waiting for result...")
         logger.info(f"Waiting for trade result ID: {buy_info.get('id', 'N/A')}...")
 
-        if await self.client.check_win(buy_info["id"]):
+        if await self.client.check_win(buy_info["id"], countdown=True):
             profit = self.client.get_profit()
             logger.info(f"WIN! Profit: {profit}")
             print(f"🎉 WIN! Profit: R$ {profit:.2f}")
@@ -448,8 +443,8 @@ class PyQuotexCLI:
             logger.info("Real-time price monitoring interrupted by user.")
             print("\n✅ Real-time monitoring stopped.")
         finally:
-            await self.client.stop_realtime_price(asset_name)
-            logger.info(f"Real-time price subscription for {asset_name} stopped.")
+            await self.client.stop_realtime_price(asset, 60)
+            logger.info(f"Real-time price subscription for {asset} stopped.")
 
     @ensure_connection()
     async def get_signal_data(self) -> None:
@@ -477,6 +472,207 @@ class PyQuotexCLI:
             pass
 
 
+_command_output = contextvars.ContextVar("command_output", default=None)
+
+
+class CommandStdout(io.TextIOBase):
+    """Stdout that sends the output of a daemon command to its client."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, text: str) -> int:
+        writer = _command_output.get()
+        if writer is None:
+            return self.stream.write(text)
+        if not writer.is_closing():
+            writer.write(text.encode("utf-8"))
+        return len(text)
+
+    @property
+    def encoding(self):
+        return self.stream.encoding
+
+    def flush(self) -> None:
+        if _command_output.get() is None:
+            self.stream.flush()
+
+
+class CLIDaemon:
+    """Keeps one authenticated CLI session and serves commands over a Unix socket."""
+
+    def __init__(self, cli: PyQuotexCLI, socket_path: Path):
+        self.cli = cli
+        self.socket_path = Path(socket_path)
+        # Commands share one client, its current asset and its streams
+        self.lock = asyncio.Lock()
+
+    async def serve(self) -> None:
+        """Connects once, then runs the commands sent by thin clients until stopped."""
+        if not hasattr(asyncio, "start_unix_server"):
+            raise RuntimeError("Daemon mode requires Unix domain sockets.")
+
+        if await is_daemon_running(self.socket_path):
+            raise RuntimeError(f"A daemon is already listening on {self.socket_path}.")
+
+        check, reason = await self.cli._connect_with_retry()
+        if not check:
+            raise ConnectionError(f"Failed to connect: {reason}")
+
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+        self.socket_path.parent.mkdir(exist_ok=True, parents=True)
+
+        stdout = sys.stdout
+        sys.stdout = CommandStdout(stdout)
+        # Created owner-only; a chmod after the bind leaves a window open
+        umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(self.handle, path=str(self.socket_path))
+        finally:
+            os.umask(umask)
+        logger.info(f"Daemon listening on {self.socket_path}")
+        print(f"🟢 Daemon listening on {self.socket_path}")
+        print("Press Ctrl+C to stop the daemon...")
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            sys.stdout = stdout
+            with contextlib.suppress(FileNotFoundError):
+                self.socket_path.unlink()
+            await self.cli.client.close()
+            logger.info("Daemon stopped.")
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Runs one command and streams its output until it ends or the client leaves.
+
+        Commands run one at a time; a client that arrives while another
+        command runs waits for it to finish.
+        """
+        line = await reader.readline()
+        if not line:
+            writer.close()
+            return
+
+        try:
+            request = json.loads(line)
+            args = argparse.Namespace(**request)
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Invalid daemon request: {e}")
+            writer.write(f"❌ Invalid request: {e}\n".encode("utf-8"))
+            writer.close()
+            return
+
+        logger.info(f"Daemon command: {args.command}")
+        _command_output.set(writer)
+        command = asyncio.create_task(self._run_exclusive(args))
+        hangup = asyncio.create_task(reader.read())
+
+        await asyncio.wait({command, hangup}, return_when=asyncio.FIRST_COMPLETED)
+        if not command.done():
+            logger.info(f"Client left, stopping command: {args.command}")
+            command.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await command
+        hangup.cancel()
+
+        with contextlib.suppress(ConnectionError):
+            await writer.drain()
+        writer.close()
+
+    async def _run_exclusive(self, args: argparse.Namespace) -> None:
+        if self.lock.locked():
+            print("⏳ Another command is running, waiting for it to finish...")
+        async with self.lock:
+            await run_command(self.cli, args)
+
+
+async def is_daemon_running(socket_path: Path) -> bool:
+    """Checks whether a daemon accepts connections on the socket."""
+    if not hasattr(asyncio, "open_unix_connection") or not Path(socket_path).exists():
+        return False
+    try:
+        _, writer = await asyncio.open_unix_connection(str(socket_path))
+    except OSError:
+        return False
+    writer.close()
+    return True
+
+
+async def send_to_daemon(args: argparse.Namespace, socket_path: Path) -> bool:
+    """Forwards a command to a running daemon and prints its output.
+
+    Returns False when no daemon is listening, so the command can run locally.
+    """
+    if not hasattr(asyncio, "open_unix_connection") or not Path(socket_path).exists():
+        return False
+    try:
+        reader, writer = await asyncio.open_unix_connection(str(socket_path))
+    except OSError:
+        return False
+
+    request = {
+        key: value for key, value in vars(args).items()
+        if key not in ("verbose", "quiet", "socket", "no_daemon")
+    }
+    writer.write(json.dumps(request).encode("utf-8") + b"\n")
+    await writer.drain()
+
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    try:
+        while chunk := await reader.read(4096):
+            sys.stdout.write(decoder.decode(chunk))
+            sys.stdout.flush()
+    finally:
+        writer.close()
+    return True
+
+
+async def run_command(cli: PyQuotexCLI, args: argparse.Namespace) -> bool:
+    """Runs one parsed subcommand. Returns False if the command is unknown."""
+    try:
+        if args.command == "test-connection":
+            await cli.test_connection()
+        elif args.command == "get-balance":
+            await cli.get_balance()
+        elif args.command == "get-profile":
+            await cli.get_profile()
+        elif args.command == "buy-simple":
+            await cli.buy_simple(args.amount, args.asset, args.direction, args.duration)
+        elif args.command == "buy-and-check":
+            await cli.buy_and_check_win(args.amount, args.asset, args.direction, args.duration)
+        elif args.command == "get-candles":
+            await cli.get_candles(args.asset, args.period, args.offset)
+        elif args.command == "assets-status":
+            await cli.get_assets_status()
+        elif args.command == "payment-info":
+            await cli.get_payment_info()
+        elif args.command == "balance-refill":
+            await cli.balance_refill(args.amount)
+        elif args.command == "realtime-price":
+            await cli.get_realtime_price(args.asset)
+        elif args.command == "signals":
+            await cli.get_signal_data()
+        else:
+            return False
+
+    except KeyboardInterrupt:
+        logger.info("CLI operation interrupted by user.")
+        print("\n✅ Operation interrupted by user.")
+    except ConnectionError as e:
+        logger.error(f"Connection error during command execution: {e}")
+        print(f"❌ Connection error: {e}")
+    except RuntimeError as e:
+        logger.error(f"Runtime error: {e}")
+        print(f"❌ Error: {e}")
+    except Exception as e:
+        logger.critical(f"Unexpected error occurred during command execution: {e}", exc_info=True)
+        print(f"❌ Unexpected error: {e}")
+    return True
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Creates and configures the command line argument parser."""
     parser = argparse.ArgumentParser(
@@ -490,6 +686,7 @@ Usage examples:
   python app.py get-candles --asset GBPUSD --period 300
   python app.py realtime-price --asset EURJPY_otc
   python app.py signals
+  python app.py daemon                  # keep one session open for the commands above
         """
     )
 
@@ -511,6 +708,18 @@ Usage examples:
         help="Suppress most output except errors."
     )
 
+    parser.add_argument(
+        "--socket",
+        default=str(DAEMON_SOCKET),
+        help="Unix socket of the daemon (default: %(default)s)."
+    )
+
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Run the command in this process even if a daemon is running."
+    )
+
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
     subparsers.add_parser("test-connection", help="Test connection to Quotex API.")
@@ -551,6 +760,8 @@ Usage examples:
 
     subparsers.add_parser("signals", help="Monitor trading signal data.")
 
+    subparsers.add_parser("daemon", help="Keep one authenticated session and serve commands over --socket.")
+
     return parser
 
 
@@ -566,50 +777,28 @@ async def main():
     else:
         logging.getLogger().setLevel(logging.INFO)
 
-    cli = PyQuotexCLI()
+    socket_path = Path(args.socket)
+
+    if args.command and args.command != "daemon" and not args.no_daemon:
+        if await send_to_daemon(args, socket_path):
+            return
+
+    cli = PyQuotexCLI(persistent=args.command == "daemon")
 
     if not args.quiet:
         cli.display_banner()
         await asyncio.sleep(1)
 
-    try:
-        if args.command == "test-connection":
-            await cli.test_connection()
-        elif args.command == "get-balance":
-            await cli.get_balance()
-        elif args.command == "get-profile":
-            await cli.get_profile()
-        elif args.command == "buy-simple":
-            await cli.buy_simple(args.amount, args.asset, args.direction, args.duration)
-        elif args.command == "buy-and-check":
-            await cli.buy_and_check_win(args.amount, args.asset, args.direction, args.duration)
-        elif args.command == "get-candles":
-            await cli.get_candles(args.asset, args.period, args.offset)
-        elif args.command == "assets-status":
-            await cli.get_assets_status()
-        elif args.command == "payment-info":
-            await cli.get_payment_info()
-        elif args.command == "balance-refill":
-            await cli.balance_refill(args.amount)
-        elif args.command == "realtime-price":
-            await cli.get_realtime_price(args.asset)
-        elif args.command == "signals":
-            await cli.get_signal_data()
-        else:
-            parser.print_help()
-
-    except KeyboardInterrupt:
-        logger.info("CLI operation interrupted by user.")
-        print("\n✅ Operation interrupted by user.")
-    except ConnectionError as e:
-        logger.error(f"Connection error during command execution: {e}")
-        print(f"❌ Connection error: {e}")
-    except RuntimeError as e:
-        logger.error(f"Runtime error: {e}")
-        print(f"❌ Error: {e}")
-    except Exception as e:
-        logger.critical(f"Unexpected error occurred during command execution: {e}", exc_info=True)
-        print(f"❌ Unexpected error: {e}")
+    if args.command == "daemon":
+        try:
+            await CLIDaemon(cli, socket_path).serve()
+        except (ConnectionError, RuntimeError) as e:
+            logger.error(f"Daemon error: {e}")
+            print(f"❌ Daemon error: {e}")
+        return
+
+    if not await run_command(cli, args):
+        parser.print_help()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,76 @@
+"""Startup budget benchmark for the Quotex client.
+
+Imports ``pyquotex.stable_api`` in fresh interpreters, reports the median
+import time and exits with status 1 when it exceeds the budget or when a
+module that must be loaded on first use only was imported eagerly.
+
+Usage:
+  python benchmarks/startup.py
+  python benchmarks/startup.py --budget-ms 200 --runs 15
+"""
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules only needed by login, indicators and the CLI banner
+DEFERRED_MODULES = ["bs4", "numpy", "pyfiglet"]
+
+PROBE = """
+import sys, time, json
+start = time.perf_counter()
+import pyquotex.stable_api
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({
+    "ms": elapsed,
+    "loaded": [m for m in %r if m in sys.modules]
+}))
+""" % DEFERRED_MODULES
+
+
+def measure(runs: int) -> tuple[list[float], set[str]]:
+    timings = []
+    loaded = set()
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        timings.append(result["ms"])
+        loaded.update(result["loaded"])
+    return timings, loaded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="PyQuotex startup budget benchmark.")
+    parser.add_argument("--budget-ms", type=float, default=300, help="Allowed median import time.")
+    parser.add_argument("--runs", type=int, default=7, help="Number of fresh interpreters to time.")
+    args = parser.parse_args()
+
+    timings, loaded = measure(args.runs)
+    median = statistics.median(timings)
+    print(f"import pyquotex.stable_api: median {median:.1f} ms "
+          f"(min {min(timings):.1f}, max {max(timings):.1f}, runs {args.runs})")
+
+    failed = False
+    if median > args.budget_ms:
+        print(f"FAIL: median exceeds the {args.budget_ms:.0f} ms budget")
+        failed = True
+    if loaded:
+        print(f"FAIL: deferred modules imported at startup: {', '.join(sorted(loaded))}")
+        failed = True
+    if not failed:
+        print("OK: within startup budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
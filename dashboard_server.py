@@ -7,6 +7,7 @@ from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from pyquotex.stable_api import Quotex
 from pyquotex.config import credentials
+from pyquotex.utils.processor import merge_candles
 from datetime import datetime, timedelta
 
 app = FastAPI(title="PyQuotex Ultimate Real-Time 600-Candle Engine")
@@ -36,6 +37,7 @@ async def get_client():
                 return None
             
             client = Quotex(email=email, password=password)
+            client.on_backfill = on_backfill
             try:
                 check, reason = await client.connect()
                 if not check:
@@ -50,6 +52,12 @@ async def get_client():
             client = None
     return client
 
+def on_backfill(asset, period, candles):
+    """Merges candles fetched after a reconnect into the live buffer."""
+    if period != 60 or asset not in live_buffers:
+        return
+    live_buffers[asset] = merge_candles(live_buffers[asset] + candles)[-600:]
+
 async def init_asset_buffer(q_client, asset):
     """Fetches initial 600 candles from history."""
     try:
@@ -6,10 +6,12 @@ import os
 from datetime import datetime
 from pyquotex.stable_api import Quotex
 from pyquotex.config import credentials
+from pyquotex.utils.processor import merge_candles
 
 class MasterDataCollector:
     def __init__(self, email, password, timeframe=60, history_count=600):
         self.client = Quotex(email=email, password=password)
+        self.client.on_backfill = self.on_backfill
         self.timeframe = timeframe
         self.history_count = history_count
         self.markets = {} # {asset_name: [candles]}
@@ -24,6 +26,13 @@ class MasterDataCollector:
         print("Connected to Quotex successfully.")
         return True
 
+    def on_backfill(self, asset, period, candles):
+        # Fill the hole left by a websocket reconnect with the fetched candles
+        if period != self.timeframe or asset not in self.markets:
+            return
+        history = merge_candles(self.markets[asset] + candles)
+        self.markets[asset] = history[-self.history_count:]
+
     async def initialize_assets(self):
         print("Fetching open assets...")
         instruments = await self.client.get_instruments()
@@ -51,14 +60,9 @@ class MasterDataCollector:
 
     async def subscribe_all(self, assets):
         print(f"Subscribing to live updates for {len(assets)} assets...")
-        # Small batches to avoid disconnect
-        batch_size = 10
-        for i in range(0, len(assets), batch_size):
-            batch = assets[i:i + batch_size]
-            for asset in batch:
-                self.client.api.subscribe_realtime_candle(asset, self.timeframe)
-            print(f"  Subscribed to batch {i//batch_size + 1}")
-            await asyncio.sleep(0.5)
+        # Paced by the client's subscribe budget to avoid disconnects
+        await self.client.subscribe_streams(assets, self.timeframe)
+        print(f"  Subscribed to {len(assets)} assets")
 
     async def run_live_processor(self):
         print("\n--- Live Data Collector Active ---")
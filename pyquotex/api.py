@@ -7,16 +7,18 @@ import ssl
 import asyncio
 import urllib3
 import requests
-import certifi
 import logging
+import functools
 import platform
 import threading
+from pathlib import Path
 from . import global_value
+from .session import SessionManager
 from .http.login import Login
 from .http.logout import Logout
 from .http.settings import Settings
 from .http.history import GetHistory
-from .http.navigator import Browser
+from .http.navigator import Browser, run_blocking
 from .ws.channels.ssid import Ssid
 from .ws.channels.buy import Buy
 from .ws.channels.candles import GetCandles
@@ -25,24 +27,34 @@ from .ws.objects.timesync import TimeSync
 from .ws.objects.candles import Candles
 from .ws.objects.profile import Profile
 from .ws.objects.listinfodata import ListInfoData
+from .ws.objects.connection import ConnectionState
+from .ws.objects.orders import PendingOrders
+from .ws.objects.deals import DealResults
+from .ws.objects.history import HistoryResponses
+from .ws.limiter import RateLimiter
 from .ws.client import WebsocketClient
 from collections import defaultdict
 
 urllib3.disable_warnings()
 logger = logging.getLogger(__name__)
 
-cert_path = certifi.where()
-os.environ['SSL_CERT_FILE'] = cert_path
-os.environ['WEBSOCKET_CLIENT_CA_BUNDLE'] = cert_path
-cacert = os.environ.get('WEBSOCKET_CLIENT_CA_BUNDLE')
 
-ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-ssl_context.check_hostname = False
-ssl_context.verify_mode = ssl.CERT_NONE
-ssl_context.options |= ssl.OP_NO_TLSv1 | ssl.OP_NO_TLSv1_1 | ssl.OP_NO_TLSv1_2
-ssl_context.minimum_version = ssl.TLSVersion.TLSv1_3
+@functools.lru_cache(maxsize=None)
+def get_ssl_context():
+    """Build the websocket TLS context on first use instead of at import."""
+    import certifi
+    cert_path = certifi.where()
+    os.environ['SSL_CERT_FILE'] = cert_path
+    os.environ['WEBSOCKET_CLIENT_CA_BUNDLE'] = cert_path
 
-ssl_context.load_verify_locations(cert_path)
+    ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    ssl_context.check_hostname = False
+    ssl_context.verify_mode = ssl.CERT_NONE
+    ssl_context.options |= ssl.OP_NO_TLSv1 | ssl.OP_NO_TLSv1_1 | ssl.OP_NO_TLSv1_2
+    ssl_context.minimum_version = ssl.TLSVersion.TLSv1_3
+
+    ssl_context.load_verify_locations(cert_path)
+    return ssl_context
 
 
 def nested_dict(n, type):
@@ -117,10 +129,20 @@ class QuotexAPI(object):
         self.candle_v2_data = {}
         self.realtime_price = {}
         self.realtime_price_data = []
+        self.last_tick_time = {}
+        self.backfilled_candles = {}
         self.realtime_candles = {}
+        self.candle_aggregators = {}
         self.realtime_sentiment = {}
         self.top_list_leader = {}
         self.session_data = {}
+        self.session_manager = SessionManager(Path(f"{resource_path}/session.json"))
+        self.connection_state = ConnectionState()
+        self.pending_orders = PendingOrders()
+        self.prepared_orders = {}
+        self.deal_results = DealResults()
+        self.history_responses = HistoryResponses()
+        self.rate_limiter = RateLimiter()
         self.browser = Browser()
         self.browser.set_headers()
         self.settings = Settings(self)
@@ -134,8 +156,8 @@ class QuotexAPI(object):
         return self.websocket_client.wss
 
     def subscribe_realtime_candle(self, asset, period):
-        self.realtime_price[asset] = []
-        self.realtime_candles[asset] = {}
+        self.realtime_price.setdefault(asset, [])
+        self.realtime_candles.setdefault(asset, {})
         payload = {
             "asset": asset,
             "period": period
@@ -159,7 +181,7 @@ class QuotexAPI(object):
         data = f'42["depth/unfollow", {json.dumps(asset)}]'
         return self.send_websocket_request(data)
 
-    def settings_apply(
+    def settings_payload(
             self,
             asset,
             duration,
@@ -169,7 +191,7 @@ class QuotexAPI(object):
             percent_mode=False,
             percent_deal=1
     ):
-        payload = {
+        return {
             "chartId": "graph",
             "settings": {
                 "chartId": "graph",
@@ -195,6 +217,26 @@ class QuotexAPI(object):
                 "downColor": "#FF6251"
             }
         }
+
+    def settings_apply(
+            self,
+            asset,
+            duration,
+            is_fast_option=False,
+            end_time=None,
+            deal=5,
+            percent_mode=False,
+            percent_deal=1
+    ):
+        payload = self.settings_payload(
+            asset,
+            duration,
+            is_fast_option,
+            end_time,
+            deal,
+            percent_mode,
+            percent_deal
+        )
         data = f'42["settings/store",{json.dumps(payload)}]'
         self.send_websocket_request(data)
 
@@ -239,7 +281,6 @@ class QuotexAPI(object):
             "amount": amount
         }
         data = f'42["pending/create",{json.dumps(payload)}]'
-        print(data)
         # 42["pending/create",{"openType":0,"asset":"AUDCAD_otc","openTime":"2025-04-01T20:09:00.000Z","timeframe":60,"command":"call","amount":50}]
         # 42["pending/create",{"openType":0,"asset":"EURUSD_otc","openTime":"2025-04-01T20:11:00.000Z","timeframe":60,"command":"call","amount":5}]
         self.send_websocket_request(data)
@@ -399,7 +440,7 @@ class QuotexAPI(object):
         return response
 
     async def get_profile(self):
-        user_settings = self.settings.get_settings()
+        user_settings = await run_blocking(self.settings.get_settings)
         self.profile.nick_name = user_settings.get("data")["nickname"]
         self.profile.profile_id = user_settings.get("data")["id"]
         self.profile.demo_balance = float(user_settings.get("data").get("demoBalance", 0))
@@ -426,13 +467,18 @@ class QuotexAPI(object):
         :param str data: The websocket request data.
         :param bool no_force_send: Default None.
         """
+        self.rate_limiter.send(data, functools.partial(self._send_frame, no_force_send=no_force_send))
+
+    def _send_frame(self, data, no_force_send=True):
         while (global_value.ssl_Mutual_exclusion
                or global_value.ssl_Mutual_exclusion_write) and no_force_send:
             pass
         global_value.ssl_Mutual_exclusion_write = True
-        self.websocket.send(data)
+        try:
+            self.websocket.send(data)
+        finally:
+            global_value.ssl_Mutual_exclusion_write = False
         logger.debug(data)
-        global_value.ssl_Mutual_exclusion_write = False
 
     async def authenticate(self):
         print("Connecting User Account ...")
@@ -456,9 +502,11 @@ class QuotexAPI(object):
         global_value.check_websocket_if_connect = None
         global_value.check_websocket_if_error = False
         global_value.websocket_error_reason = None
+        global_value.check_accepted_connection = 0
         if not global_value.SSID:
             await self.authenticate()
         self.websocket_client = WebsocketClient(self)
+        ssl_context = get_ssl_context()
         payload = {
             "suppress_origin": True,    # CloudFlare handshake status 403 forbidden fix
             "ping_interval": 24,
@@ -469,10 +517,12 @@ class QuotexAPI(object):
             "sslopt": {
                 "check_hostname": False,
                 "cert_reqs": ssl.CERT_NONE,
-                "ca_certs": cacert,
+                "ca_certs": os.environ.get('WEBSOCKET_CLIENT_CA_BUNDLE'),
                 "context": ssl_context
             },
-            "reconnect": 5
+            # Reconnects are left to ReconnectSupervisor, which also
+            # restores the session, replays streams and backfills
+            "reconnect": 0
         }
         if platform.system() == "Linux":
             payload["sslopt"]["ssl_version"] = ssl.PROTOCOL_TLS
@@ -539,10 +589,12 @@ class QuotexAPI(object):
         await self.start_websocket()
 
     async def close(self):
+        # Frames still paced for this socket would go nowhere
+        self.rate_limiter.clear()
         if self.websocket_client:
             self.websocket.close()
             await asyncio.sleep(1)
-            self.websocket_thread.join()
+            await asyncio.to_thread(self.websocket_thread.join, 10)
         return True
 
     def websocket_alive(self):
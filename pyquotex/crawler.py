@@ -0,0 +1,240 @@
+"""Module for the resumable Quotex candle history crawler."""
+import os
+import json
+import time
+import asyncio
+import logging
+from pathlib import Path
+from .utils.processor import calculate_candles, merge_candles, find_gaps
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ("time", "open", "close", "high", "low", "ticks")
+
+
+def split_range(start, end, chunk_size):
+    """Split a time range into chunks aligned to the chunk size.
+
+    :param start: The start timestamp.
+    :param end: The end timestamp.
+    :param int chunk_size: The chunk length in seconds.
+    :returns: ``(chunk_start, chunk_end)`` pairs, oldest first.
+    """
+    first = int(start // chunk_size * chunk_size)
+    return [(chunk_start, chunk_start + chunk_size) for chunk_start in range(first, int(end), chunk_size)]
+
+
+def response_candles(message, period):
+    """Get the candles of a ``history/list/v2`` response.
+
+    :param dict message: The response.
+    :param int period: The candle period in seconds.
+    :returns: The candles sorted by time.
+    """
+    candles = [
+        dict(zip(COLUMNS, candle)) if isinstance(candle, list) else candle
+        for candle in message.get("candles") or []
+    ]
+    return merge_candles(candles + calculate_candles(message.get("history") or [], period))
+
+
+class HistoryCrawler(object):
+    """Class to download long candle histories for many assets.
+
+    The range is split in chunks per asset. Assets are crawled
+    concurrently within the history budget of the client's rate
+    limiter, and the chunks of one asset are fetched one after the other
+    so each response can be matched to its request. Every finished chunk is written as a ``.npz`` file
+    of columns and recorded in a JSON checkpoint, so an interrupted job
+    resumes where it stopped.
+    """
+
+    def __init__(
+            self,
+            client,
+            directory,
+            period=60,
+            chunk_size=86400,
+            concurrency=8,
+            timeout=20,
+            retries=3,
+            max_empty_chunks=3
+    ):
+        """
+        :param client: The instance of :class:`Quotex
+            <pyquotex.stable_api.Quotex>`.
+        :param directory: Where the chunks and the checkpoint are written.
+        :param int period: The candle period in seconds.
+        :param int chunk_size: The chunk length in seconds.
+        :param int concurrency: How many assets to crawl at the same time.
+        :param timeout: Seconds to wait for each history response.
+        :param int retries: Attempts per request before leaving the chunk
+            for the next run.
+        :param int max_empty_chunks: Consecutive empty chunks after which
+            the history of an asset is taken as exhausted.
+        """
+        self.client = client
+        self.directory = Path(directory)
+        self.period = period
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.max_empty_chunks = max_empty_chunks
+        self.checkpoint_path = self.directory / "checkpoint.json"
+        self.checkpoint = self._load_checkpoint()
+
+    def _load_checkpoint(self):
+        if self.checkpoint_path.exists():
+            checkpoint = json.loads(self.checkpoint_path.read_text())
+            if checkpoint.get("period") != self.period or checkpoint.get("chunk_size") != self.chunk_size:
+                raise ValueError(f"{self.checkpoint_path} belongs to a crawl with other period or chunk size.")
+            return checkpoint
+        return {"period": self.period, "chunk_size": self.chunk_size, "done": {}, "gaps": {}}
+
+    def _save_checkpoint(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.checkpoint_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.checkpoint))
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def pending_chunks(self, asset, start, end):
+        """Method to get the chunks of an asset still to crawl.
+
+        :returns: ``(chunk_start, chunk_end)`` pairs, newest first.
+        """
+        done = set(self.checkpoint["done"].get(asset, []))
+        chunks = [chunk for chunk in split_range(start, end, self.chunk_size) if chunk[0] not in done]
+        return chunks[::-1]
+
+    async def run(self, assets, start, end=None):
+        """Crawl the history of several assets.
+
+        :param list assets: The assets to crawl.
+        :param start: The start timestamp.
+        :param end: (optional) The end timestamp; defaults to now.
+        :returns: The number of chunks written per asset in this run.
+        """
+        if end is None:
+            end = time.time()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def crawl(asset):
+            async with semaphore:
+                return await self._crawl_asset(asset, self.pending_chunks(asset, start, end))
+
+        written = await asyncio.gather(*(crawl(asset) for asset in assets))
+        return dict(zip(assets, written))
+
+    async def _crawl_asset(self, asset, chunks):
+        written = 0
+        empty = 0
+        if not chunks:
+            return written
+        self.client.subscriptions.acquire(asset, self.period, owner=self)
+        try:
+            for chunk_start, chunk_end in chunks:
+                candles = await self._crawl_chunk(asset, chunk_start, chunk_end)
+                if candles is None:
+                    logger.warning(f"Crawl of {asset} stopped at chunk {chunk_start}; it resumes there next run.")
+                    break
+                self._write_chunk(asset, chunk_start, candles)
+                written += 1
+                # The chunk that is still forming is fetched again next run
+                if chunk_end <= time.time() - self.period:
+                    gaps = find_gaps(candles, self.period, chunk_start, chunk_end - self.period)
+                    self.checkpoint["done"].setdefault(asset, []).append(chunk_start)
+                    if gaps:
+                        self.checkpoint["gaps"].setdefault(asset, {})[str(chunk_start)] = gaps
+                    self._save_checkpoint()
+                # Market closures give a few empty chunks in a row, the
+                # start of the history an endless run of them
+                empty = 0 if candles else empty + 1
+                if empty >= self.max_empty_chunks:
+                    logger.info(f"No history for {asset} before {chunk_end}.")
+                    break
+        finally:
+            self.client.subscriptions.release(asset, self.period, owner=self)
+        return written
+
+    async def _crawl_chunk(self, asset, chunk_start, chunk_end):
+        """Walk one chunk backwards from its end.
+
+        :returns: The candles of the chunk, or None if a request failed.
+        """
+        candles = []
+        end = chunk_end
+        while end > chunk_start:
+            block = await self._request(asset, end, end - chunk_start)
+            if block is None:
+                return None
+            block = [candle for candle in block if chunk_start <= candle["time"] < chunk_end]
+            oldest = min((candle["time"] for candle in block), default=end)
+            candles.extend(block)
+            if oldest >= end:
+                break
+            end = oldest
+        return merge_candles(candles)
+
+    async def _request(self, asset, end, offset):
+        api = self.client.api
+        for attempt in range(self.retries):
+            await api.rate_limiter.wait("history")
+            index, future = api.history_responses.add(asset, end)
+            api.get_candles(asset, index, end, offset, self.period)
+            try:
+                message = await asyncio.wait_for(future, self.timeout)
+            except asyncio.TimeoutError:
+                api.history_responses.discard(asset, index)
+                logger.debug(f"History request for {asset} at {end} timed out (attempt {attempt + 1}).")
+                continue
+            return response_candles(message, self.period)
+        return None
+
+    def _chunk_path(self, asset, chunk_start):
+        return self.directory / asset / f"{chunk_start}.npz"
+
+    def _write_chunk(self, asset, chunk_start, candles):
+        import numpy as np
+        path = self._chunk_path(asset, chunk_start)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        columns = {
+            column: np.array([candle.get(column, 0) for candle in candles],
+                             dtype=np.int64 if column in ("time", "ticks") else np.float64)
+            for column in COLUMNS
+        }
+        tmp_path = path.with_name(f"{chunk_start}.tmp.npz")
+        np.savez(tmp_path, **columns)
+        os.replace(tmp_path, path)
+
+    def load(self, asset, start=None, end=None):
+        """Method to read the crawled candles of an asset.
+
+        :param str asset: The asset.
+        :param start: (optional) The start timestamp.
+        :param end: (optional) The end timestamp.
+        :returns: A dict of numpy arrays, one per column, sorted by time.
+        """
+        import numpy as np
+        parts = {column: [] for column in COLUMNS}
+        paths = [path for path in self.directory.joinpath(asset).glob("*.npz") if path.stem.isdigit()]
+        for path in sorted(paths, key=lambda p: int(p.stem)):
+            chunk_start = int(path.stem)
+            if end is not None and chunk_start > end:
+                continue
+            if start is not None and chunk_start + self.chunk_size <= start:
+                continue
+            with np.load(path) as data:
+                for column in COLUMNS:
+                    parts[column].append(data[column])
+        columns = {
+            column: np.concatenate(values) if values else np.empty(0)
+            for column, values in parts.items()
+        }
+        times = columns["time"]
+        mask = np.ones(times.shape, dtype=bool)
+        if start is not None:
+            mask &= times >= start
+        if end is not None:
+            mask &= times <= end
+        return {column: values[mask] for column, values in columns.items()}
@@ -39,24 +39,24 @@ def get_expiration_time_quotex(timestamp: int, duration: int) -> int:
     Returns:
         int: Expiration UNIX timestamp.
     """
-    now = datetime.fromtimestamp(timestamp)
+    timestamp = int(timestamp)
+    local_seconds = timestamp + time.localtime(timestamp).tm_gmtoff
 
     # For durations < 60s (only valid for market orders or OTC)
     if duration < 60:
-        shift = 1 if now.second >= 30 else 0
-        exp_time = now.replace(second=0, microsecond=0) + timedelta(minutes=shift + 1)
-        return int(date_to_timestamp(exp_time))
+        second = local_seconds % 60
+        shift = 1 if second >= 30 else 0
+        return timestamp - second + (shift + 1) * 60
 
     # For durations >= 60s (valid for buy_pending and scheduled trades)
-    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    seconds_since_midnight = int((now - midnight).total_seconds())
+    seconds_since_midnight = local_seconds % 86400
+    midnight = timestamp - seconds_since_midnight
 
     remainder = seconds_since_midnight % duration
     step = 2 if remainder > (duration / 2) else 1
     next_valid = ((seconds_since_midnight // duration) + step) * duration
 
-    expiration_time = midnight + timedelta(seconds=next_valid)
-    return int(expiration_time.timestamp())
+    return midnight + next_valid
 
 
 def get_next_timeframe(timestamp, time_zone, timeframe: int, open_time: str = None) -> str:
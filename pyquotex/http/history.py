@@ -1,6 +1,7 @@
 """Module for Quotex http history resource."""
 
 from ..http.resource import Resource
+from ..http.navigator import run_blocking
 
 
 class GetHistory(Resource):
@@ -24,7 +25,7 @@ class GetHistory(Resource):
             "content-type": "application/json",
             "accept": "application/json",
         }
-        response = self._get(headers=headers)
+        response = await run_blocking(self._get, headers=headers)
         if response:
             return response.json()
         return {}
@@ -1,9 +1,47 @@
-import re
 import json
 import sys
+import time
 import asyncio
+import logging
 from pathlib import Path
-from pyquotex.http.navigator import Browser
+from pyquotex.http.navigator import Browser, run_blocking, http_executor
+
+logger = logging.getLogger(__name__)
+
+SETTINGS_MARKER = b"window.settings"
+
+
+def extract_window_settings(content):
+    """Extract the `window.settings` object from a page without a DOM.
+
+    Scans the raw bytes for each assignment and decodes only the JSON
+    object that follows it. The first object carrying a token wins,
+    otherwise the first one that decodes.
+
+    :param bytes content: The page body.
+    :returns: The settings dict, or None when not found.
+    """
+    decoder = json.JSONDecoder()
+    fallback = None
+    position = content.find(SETTINGS_MARKER)
+    while position >= 0:
+        cursor = position + len(SETTINGS_MARKER)
+        position = content.find(SETTINGS_MARKER, cursor)
+        brace = content.find(b"{", cursor)
+        if brace < 0 or content[cursor:brace].strip() != b"=":
+            continue
+        end = position if position >= 0 else len(content)
+        try:
+            data, _ = decoder.raw_decode(content[brace:end].decode("utf-8", "replace"))
+        except ValueError:
+            continue
+        if not isinstance(data, dict):
+            continue
+        if "token" in data:
+            return data
+        if fallback is None:
+            fallback = data
+    return fallback
 
 
 class Login(Browser):
@@ -16,6 +54,11 @@ class Login(Browser):
     alternative_domains = ['qxbroker.com', 'quotex.io', 'market-qx.trade', 'quotex-broker.com']
     base_url = alternative_domains[0]
     https_base_url = f'https://{base_url}'
+    # Last working domain as (domain, timestamp), tried first while fresh
+    last_domain = None
+    domain_cache_ttl = 6 * 3600
+    # Seconds the last working domain is probed alone before the others join
+    cached_head_start = 1.0
 
     def __init__(self, api, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -31,34 +74,119 @@ class Login(Browser):
         }
         self.full_url = f"{self.https_base_url}/{api.lang}"
 
-    def get_token(self):
-        """Attempts to fetch the CSRF token from multiple domains if blocked."""
-        for domain in self.alternative_domains:
+    def _probe_domain(self, domain):
+        """Fetch the sign-in page of a domain on a session of its own.
+
+        Runs in an executor thread and leaves the login untouched; the
+        caller applies the winning probe with :meth:`_use_domain`.
+
+        :param str domain: The candidate domain.
+        :returns: A tuple of the probe session and the CSRF token.
+        """
+        logger.debug(f"Bypass: Trying {domain}...")
+        browser = Browser()
+        browser.headers = dict(self.headers)
+        target_url = f"https://{domain}/{self.api.lang}/sign-in/"
+        resp = browser.send_request("GET", target_url, timeout=15)
+
+        if not resp or resp.status_code != 200:
+            code = resp.status_code if resp is not None else "No Response"
+            browser.close()
+            raise ConnectionError(f"returned status {code}")
+
+        match = browser.get_soup().find("input", {"name": "_token"})
+        if not match:
+            browser.close()
+            raise ConnectionError("Cloudflare challenge detected (No token found)")
+
+        return browser, match.get("value")
+
+    @staticmethod
+    def _discard_probe(probe):
+        """Close the session of a probe that lost the race once it finishes."""
+        if probe.cancelled() or probe.exception() is not None:
+            return
+        browser, _ = probe.result()
+        browser.close()
+
+    def _use_domain(self, domain, browser):
+        """Switch the login to a domain whose probe succeeded."""
+        Login.base_url = domain
+        Login.https_base_url = f'https://{domain}'
+        self.base_url = domain
+        self.https_base_url = f'https://{domain}'
+        self.full_url = f"{self.https_base_url}/{self.api.lang}"
+        self.cookies.update(browser.cookies)
+        browser.close()
+        Login.last_domain = (domain, time.time())
+        try:
+            self.domain_cache_file.write_text(
+                json.dumps({"domain": domain, "time": time.time()})
+            )
+        except OSError:
+            pass
+
+    def _cached_domain(self):
+        """Return the last working domain if it is younger than the TTL."""
+        domain, checked_at = Login.last_domain or (None, 0)
+        if not domain and self.domain_cache_file.exists():
             try:
-                print(f"Bypass: Trying {domain}...")
-                self.base_url = domain
-                self.https_base_url = f'https://{domain}'
-                self.full_url = f"{self.https_base_url}/{self.api.lang}"
-                
-                # Try the direct sign-in page
-                target_url = f"{self.full_url}/sign-in/"
-                resp = self.send_request("GET", target_url, timeout=15)
-                
-                if resp and resp.status_code == 200:
-                    html = self.get_soup()
-                    match = html.find("input", {"name": "_token"})
-                    if match:
-                        token = match.get("value")
-                        print(f"SUCCESS: Bypass worked on {domain}")
-                        return token
-                    else:
-                        print(f"WARN: Cloudflare challenge detected on {domain} (No token found)")
-                else:
-                    code = resp.status_code if resp else "No Response"
-                    print(f"FAIL: {domain} returned status {code}")
-            except Exception as e:
-                print(f"ERR: {domain} failed - {str(e)}")
-                continue
+                cache = json.loads(self.domain_cache_file.read_text())
+                domain, checked_at = cache.get("domain"), cache.get("time", 0)
+            except (OSError, ValueError):
+                return None
+        if domain in self.alternative_domains and time.time() - checked_at < self.domain_cache_ttl:
+            return domain
+        return None
+
+    @property
+    def domain_cache_file(self):
+        return Path(f"{self.api.resource_path}/domain.json")
+
+    async def get_token(self):
+        """Fetches the CSRF token, racing all domains in case some are blocked.
+
+        The last working domain gets a head start of
+        ``cached_head_start`` seconds; unless it has succeeded by then,
+        every other domain joins the race and the first token wins. Probe
+        threads cannot be interrupted, so the losers are left to finish
+        and their sessions are closed when they do.
+        """
+        cached = self._cached_domain()
+        probes = {}
+        waiters = {}
+
+        def start(domain):
+            probes[domain] = http_executor.submit(self._probe_domain, domain)
+            waiters[asyncio.wrap_future(probes[domain])] = domain
+
+        try:
+            if cached:
+                start(cached)
+                await asyncio.wait(waiters, timeout=self.cached_head_start)
+            if not any(probe.done() and probe.exception() is None for probe in probes.values()):
+                for domain in self.alternative_domains:
+                    if domain != cached:
+                        start(domain)
+            while waiters:
+                done, _ = await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+                for waiter in done:
+                    domain = waiters.pop(waiter)
+                    try:
+                        browser, token = waiter.result()
+                    except Exception as e:
+                        logger.warning(f"ERR: {domain} failed - {str(e)}")
+                        continue
+                    del probes[domain]
+                    self._use_domain(domain, browser)
+                    logger.info(f"SUCCESS: Bypass worked on {domain}")
+                    return token
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+            for probe in probes.values():
+                probe.cancel()
+                probe.add_done_callback(self._discard_probe)
         return None
 
     async def awaiting_pin(self, data, input_message):
@@ -101,7 +229,7 @@ class Login(Browser):
 
         data["code"] = code
         await asyncio.sleep(1)
-        self.send_request(
+        await self.send_request_async(
             method="POST",
             url=f"{self.full_url}/sign-in/modal",
             data=data
@@ -113,51 +241,17 @@ class Login(Browser):
             url=f"{self.full_url}/trade"
         )
         if self.response:
-            # More robust search for window.settings
-            soup = self.get_soup()
-            scripts = soup.find_all("script")
-            settings_script = None
-            for s in scripts:
-                txt = s.get_text()
-                if txt and "window.settings =" in txt:
-                    if '"token"' in txt or "'token'" in txt:
-                        settings_script = txt
-                        break
-                    elif not settings_script:
-                        settings_script = txt
-            
-            if not settings_script:
+            data = extract_window_settings(self.response.content)
+            if not data:
                 return None, None
 
-            # Extract JSON from script
-            match = re.search(r"window\.settings\s*=\s*(\{.*?\});", settings_script, re.DOTALL)
-            if not match:
-                # Try without trailing semicolon if it's missing or different
-                match = re.search(r"window\.settings\s*=\s*(\{.*\})", settings_script, re.DOTALL)
-            
-            if match:
-                match_str = match.group(1)
-                try:
-                    data = json.loads(match_str)
-                    self.cookies = self.get_cookies()
-                    self.ssid = data.get("token")
-                    self.api.session_data["cookies"] = self.cookies
-                    self.api.session_data["token"] = self.ssid
-                    self.api.session_data["user_agent"] = self.headers["User-Agent"]
-                    output_file = Path(f"{self.api.resource_path}/session.json")
-                    output_file.parent.mkdir(exist_ok=True, parents=True)
-                    output_file.write_text(
-                        json.dumps({
-                            "cookies": self.cookies,
-                            "token": self.ssid,
-                            "user_agent": self.headers["User-Agent"]
-                        }, indent=4)
-                    )
-                    return self.response, data
-                except json.JSONDecodeError as e:
-                    return None, None
-            else:
-                return None, None
+            self.cookies = self.get_cookies()
+            self.ssid = data.get("token")
+            self.api.session_data["cookies"] = self.cookies
+            self.api.session_data["token"] = self.ssid
+            self.api.session_data["user_agent"] = self.headers["User-Agent"]
+            self.api.session_manager.save(self.api.session_data, issued=True)
+            return self.response, data
 
         return None, None
 
@@ -171,7 +265,7 @@ class Login(Browser):
         """Send get request for Quotex API login http resource.
         :returns: The instance of :class:`requests.Response`.
         """
-        self.response = self.send_request(
+        self.response = await self.send_request_async(
             method="POST",
             url=f"{self.full_url}/sign-in/",
             data=data
@@ -214,7 +308,7 @@ class Login(Browser):
         :returns: The instance of :class:`requests.Response`.
         """
         data = {
-            "_token": self.get_token(),
+            "_token": await self.get_token(),
             "email": username,
             "password": password,
             "remember": 1,
@@ -225,6 +319,6 @@ class Login(Browser):
             print(msg)
             exit(0)
 
-        self.get_profile()
+        await run_blocking(self.get_profile)
 
         return status, msg
@@ -1,6 +1,7 @@
 """Module for Quotex http login resource."""
 
 from ..http.resource import Resource
+from ..http.navigator import run_blocking
 
 
 class Logout(Resource):
@@ -21,4 +22,4 @@ class Logout(Resource):
         headers = {
             "referer": f"{self.api.https_url}/{self.api.lang}/trade"
         }
-        return self._get(headers=headers)
+        return await run_blocking(self._get, headers=headers)
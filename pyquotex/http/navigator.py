@@ -1,9 +1,12 @@
 import ssl
+import asyncio
 import logging
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from requests import Session
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from bs4 import BeautifulSoup
 
 retry_strategy = Retry(
     total=3,
@@ -12,6 +15,21 @@ retry_strategy = Retry(
     allowed_methods=["HEAD", "POST", "PUT", "GET", "OPTIONS"]
 )
 
+# Bounded pool the blocking requests calls are offloaded to, so HTTP
+# latency and retry backoff never stall the event loop.
+HTTP_MAX_WORKERS = 8
+http_executor = ThreadPoolExecutor(
+    max_workers=HTTP_MAX_WORKERS,
+    thread_name_prefix="pyquotex-http"
+)
+
+# Host pools kept alive per adapter and connections kept per host pool.
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = HTTP_MAX_WORKERS
+
+_shared_adapters = {}
+_shared_adapters_lock = threading.Lock()
+
 logger = logging.getLogger("Browser")
 logger.setLevel(logging.INFO)
 handler = logging.StreamHandler()
@@ -19,6 +37,15 @@ handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
 logger.addHandler(handler)
 
 
+async def run_blocking(func, *args, **kwargs):
+    """Run a blocking HTTP call in the shared executor and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        http_executor,
+        functools.partial(func, *args, **kwargs)
+    )
+
+
 class CipherSuiteAdapter(HTTPAdapter):
     __attrs__ = [
         'ssl_context',
@@ -77,10 +104,36 @@ class CipherSuiteAdapter(HTTPAdapter):
         return super().proxy_manager_for(*args, **kwargs)
 
 
+def get_shared_adapter(**kwargs):
+    """Return the process-wide adapter for the given TLS settings.
+
+    Every Browser with the same settings mounts the same adapter, so all
+    HTTP resources share one keep-alive pool per host and reuse TLS
+    sessions instead of handshaking for each new Browser.
+    """
+    key = tuple(sorted(
+        (name, id(value) if name == "ssl_context" and value else value)
+        for name, value in kwargs.items()
+    ))
+    with _shared_adapters_lock:
+        adapter = _shared_adapters.get(key)
+        if adapter is None:
+            adapter = CipherSuiteAdapter(
+                max_retries=retry_strategy,
+                pool_connections=POOL_CONNECTIONS,
+                pool_maxsize=POOL_MAXSIZE,
+                **kwargs
+            )
+            _shared_adapters[key] = adapter
+    return adapter
+
+
 class Browser(Session):
 
     def __init__(self, *args, **kwargs):
         self.response = None
+        self._soup = None
+        self._soup_response = None
         self.default_headers = None
         self.ecdhCurve = kwargs.pop('ecdhCurve', 'prime256v1')
         self.cipherSuite = kwargs.pop('cipherSuite', 'DEFAULT@SECLEVEL=1')
@@ -96,13 +149,12 @@ class Browser(Session):
 
         self.mount(
             'https://',
-            CipherSuiteAdapter(
+            get_shared_adapter(
                 ecdhCurve=self.ecdhCurve,
                 cipherSuite=self.cipherSuite,
                 server_hostname=self.server_hostname,
                 source_address=self.source_address,
-                ssl_context=self.ssl_context,
-                max_retries=retry_strategy
+                ssl_context=self.ssl_context
             )
         )
 
@@ -112,6 +164,13 @@ class Browser(Session):
     def __enter__(self):
         return self
 
+    def close(self):
+        """Close the session while keeping the shared pools alive."""
+        shared = list(_shared_adapters.values())
+        for adapter in self.adapters.values():
+            if adapter not in shared:
+                adapter.close()
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
@@ -137,10 +196,22 @@ class Browser(Session):
     def get_cookies(self):
         return '; '.join(f'{i.name}={i.value}' for i in self.cookies)
 
+    def warm_up(self, url):
+        """Open a pooled TLS connection to the host of url ahead of use."""
+        try:
+            self.request("HEAD", url, timeout=10, allow_redirects=False)
+        except Exception as e:
+            logger.debug(f"Warm-up of {url} failed: {e}")
+
     def get_soup(self):
+        """Return the parsed document of the last response, parsing it once."""
         if not self.response:
             raise RuntimeError("No response stored. Use send_request() first.")
-        return BeautifulSoup(self.response.content, "html.parser")
+        if self._soup_response is not self.response:
+            from bs4 import BeautifulSoup
+            self._soup = BeautifulSoup(self.response.content, "html.parser")
+            self._soup_response = self.response
+        return self._soup
 
     def get_json(self):
         if not self.response:
@@ -175,3 +246,12 @@ class Browser(Session):
             logger.debug(f"Body (preview): {content_preview} [...]")
 
         return self.response
+
+    async def send_request_async(self, method, url, headers=None, **kwargs):
+        return await run_blocking(
+            self.send_request,
+            method,
+            url,
+            headers=headers,
+            **kwargs
+        )
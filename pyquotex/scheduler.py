@@ -0,0 +1,227 @@
+"""Module for Quotex scheduled order execution."""
+import time
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def next_boundary(server_timestamp, period):
+    """Get the open time of the next candle.
+
+    :param server_timestamp: The current server timestamp.
+    :param int period: The candle period in seconds.
+    :returns: The server timestamp of the next candle boundary.
+    """
+    return (int(server_timestamp) // period + 1) * period
+
+
+class ScheduledOrder(object):
+    """Class for an order waiting to be sent at a server timestamp.
+
+    Await the instance to get the ``(status, result)`` of the order.
+    """
+
+    def __init__(self, amount, asset, direction, duration, target, prepared):
+        """
+        :param amount: The amount to invest.
+        :param str asset: The asset to trade.
+        :param str direction: The direction, call or put.
+        :param int duration: The duration in seconds.
+        :param target: The server timestamp to send the order at.
+        :param prepared: The :class:`PreparedOrder
+            <pyquotex.ws.channels.buy.PreparedOrder>` of the order.
+        """
+        self.amount = amount
+        self.asset = asset
+        self.direction = direction
+        self.duration = duration
+        self.target = target
+        self.prepared = prepared
+        self.request_id = None
+        self.sent_at = None
+        self.future = asyncio.get_running_loop().create_future()
+
+    @property
+    def jitter(self):
+        """Property to get how late the order was sent.
+
+        :returns: The server time of the send minus the target in
+            seconds, or None if it was not sent yet.
+        """
+        if self.sent_at is None:
+            return None
+        return self.sent_at - self.target
+
+    def cancelled(self):
+        return self.future.cancelled()
+
+    def __await__(self):
+        return self.future.__await__()
+
+
+class OrderScheduler(object):
+    """Class to send orders exactly at candle boundaries.
+
+    Orders are prepared when they are scheduled. Shortly before the
+    target they are staged: the settings frames go out and the order
+    frames are rendered, so only the order frames are left to send. The
+    target time is awaited on the monotonic clock, corrected by the
+    server clock offset just before the end, and the last few
+    milliseconds are spent in a busy-wait so the frames leave as close to
+    the target as possible. Orders sharing a target are sent back-to-back.
+    """
+
+    def __init__(self, client, spin_window=0.02, timeout=10, stage_lead=0.5):
+        """
+        :param client: The instance of :class:`Quotex
+            <pyquotex.stable_api.Quotex>`.
+        :param spin_window: Seconds before the target to stop sleeping
+            and busy-wait instead.
+        :param timeout: Seconds to wait for the order responses.
+        :param stage_lead: Seconds before the target to send the
+            settings frames and render the order frames.
+        """
+        self.client = client
+        self.spin_window = spin_window
+        self.timeout = timeout
+        self.stage_lead = stage_lead
+        self._groups = {}
+        self._tasks = {}
+
+    def schedule(
+            self,
+            amount,
+            asset,
+            direction,
+            duration,
+            at=None,
+            period=None,
+            time_mode="TIME"
+    ):
+        """Method to schedule an order.
+
+        :param amount: The amount to invest.
+        :param str asset: The asset to trade.
+        :param str direction: The direction, call or put.
+        :param int duration: The duration in seconds.
+        :param at: (optional) The server timestamp to send the order at.
+        :param int period: (optional) Candle period whose next open is the
+            target when ``at`` is not given; defaults to ``duration``.
+        :param str time_mode: Time mode to buy.
+        :returns: The instance of :class:`ScheduledOrder`.
+        """
+        api = self.client.api
+        if at is None:
+            at = next_boundary(api.timesync.server_time(), period or duration)
+        if at <= api.timesync.server_time():
+            raise ValueError(f"The target time {at} has already passed.")
+
+        prepared = self.client.prepare_order(asset, direction, duration, time_mode)
+        order = ScheduledOrder(amount, asset, direction, duration, at, prepared)
+        self._groups.setdefault(at, []).append(order)
+        if at not in self._tasks:
+            self._tasks[at] = asyncio.create_task(self._run(at))
+        return order
+
+    def cancel(self, order):
+        """Method to drop an order that has not been staged yet.
+
+        :returns: True if the order was removed.
+        """
+        group = self._groups.get(order.target)
+        if not group or order not in group:
+            return False
+        group.remove(order)
+        order.future.cancel()
+        return True
+
+    async def close(self):
+        for task in self._tasks.values():
+            task.cancel()
+        for group in self._groups.values():
+            for order in group:
+                order.future.cancel()
+        self._tasks.clear()
+        self._groups.clear()
+
+    def _remaining(self, target):
+        return target - self.client.api.timesync.server_time()
+
+    async def _sleep_until(self, target, margin):
+        remaining = self._remaining(target)
+        if remaining > margin:
+            await asyncio.sleep(remaining - margin)
+
+    def _spin_until(self, target):
+        # The offset may have moved while sleeping, so aim again on the
+        # monotonic clock, which cannot jump under us
+        deadline = time.monotonic() + self._remaining(target)
+        while time.monotonic() < deadline:
+            pass
+
+    async def _run(self, target):
+        taken, staged = [], []
+        try:
+            await self._sleep_until(target, self.stage_lead)
+            self._stage(target, taken, staged)
+            await self._sleep_until(target, self.spin_window)
+            self._spin_until(target)
+            # Orders scheduled after staging go right behind the others
+            self._stage(target, taken, staged)
+            self._fire(staged)
+            await self._collect(target, staged)
+        finally:
+            self._tasks.pop(target, None)
+            pending = self.client.api.pending_orders
+            for order in taken:
+                if order.sent_at is None and order.request_id is not None:
+                    pending.discard(order.request_id)
+                # close() no longer sees taken orders, so whatever stopped
+                # this run must not leave their awaiters hanging
+                if not order.future.done():
+                    order.future.cancel()
+
+    def _stage(self, target, taken, staged):
+        """Send the settings frames of a target's orders and render their order frames.
+
+        :param list taken: Extended with the orders taken off the schedule.
+        :param list staged: Extended with ``(order, future, frame)`` per
+            staged order.
+        """
+        api = self.client.api
+        pending = api.pending_orders
+        timestamp = int(target)
+        orders = [order for order in self._groups.pop(target, []) if not order.cancelled()]
+        taken.extend(orders)
+        for order in orders:
+            order.request_id = pending.next_request_id()
+            settings, frame = order.prepared.frames(api, order.amount, order.request_id, timestamp)
+            api.send_websocket_request(settings)
+            staged.append((order, pending.add(order.request_id, order.asset), frame))
+        if orders:
+            api.send_websocket_request('42["tick"]')
+
+    def _fire(self, staged):
+        api = self.client.api
+        for order, _, frame in staged:
+            api.send_websocket_request(frame)
+            order.sent_at = api.timesync.server_time()
+
+    async def _collect(self, target, staged):
+        pending = self.client.api.pending_orders
+        for order, _, _ in staged:
+            logger.info(f"Scheduled order {order.asset} {order.direction} sent "
+                        f"{order.jitter * 1000:+.1f} ms from target {target}.")
+
+        if not staged:
+            return
+        done, _ = await asyncio.wait([future for _, future, _ in staged], timeout=self.timeout)
+        for order, future, _ in staged:
+            if future in done:
+                result = future.result()
+            else:
+                pending.discard(order.request_id)
+                result = (False, "timeout")
+            if not order.future.done():
+                order.future.set_result(result)
@@ -0,0 +1,209 @@
+"""Module for Quotex session persistence."""
+import os
+import json
+import time
+import logging
+import threading
+import contextlib
+from pathlib import Path
+import requests
+from .http.navigator import run_blocking
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+
+def _lock_file(handle):
+    if fcntl:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        return
+    while True:
+        try:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            time.sleep(0.1)
+
+
+def _unlock_file(handle):
+    if fcntl:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+    else:
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class SessionManager(object):
+    """Class to persist, validate and refresh the Quotex login session.
+
+    The session file is shared between processes: every read and write
+    holds an exclusive lock on a sibling ``.lock`` file, and a process
+    logging in keeps that lock so others reuse its token instead of
+    logging in themselves.
+    """
+
+    def __init__(
+            self,
+            path,
+            user_agent=None,
+            token_ttl=24 * 3600,
+            validate_interval=600,
+            refresh_margin=3600
+    ):
+        """
+        :param path: The path of the session file.
+        :param str user_agent: Default user agent for a new session.
+        :param token_ttl: Seconds a token is trusted after it was issued.
+        :param validate_interval: Seconds a successful validation is trusted.
+        :param refresh_margin: Seconds before expiry to log in again.
+        """
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(f"{self.path.name}.lock")
+        self.user_agent = user_agent
+        self.token_ttl = token_ttl
+        self.validate_interval = validate_interval
+        self.refresh_margin = refresh_margin
+        self.session_data = {
+            "cookies": None,
+            "token": None,
+            "user_agent": user_agent
+        }
+        self._thread_lock = threading.RLock()
+        self._lock_handle = None
+        self._lock_depth = 0
+
+    def _acquire(self):
+        with self._thread_lock:
+            if self._lock_depth == 0:
+                self.lock_path.parent.mkdir(exist_ok=True, parents=True)
+                self._lock_handle = open(self.lock_path, "a+")
+                _lock_file(self._lock_handle)
+            self._lock_depth += 1
+
+    def _release(self):
+        with self._thread_lock:
+            self._lock_depth -= 1
+            if self._lock_depth == 0:
+                _unlock_file(self._lock_handle)
+                self._lock_handle.close()
+                self._lock_handle = None
+
+    @contextlib.contextmanager
+    def locked(self):
+        """Hold the cross-process lock; re-entrant within this manager."""
+        self._acquire()
+        try:
+            yield self
+        finally:
+            self._release()
+
+    @contextlib.asynccontextmanager
+    async def locked_async(self):
+        """Async form of :meth:`locked` that waits for the lock off the loop."""
+        await run_blocking(self._acquire)
+        try:
+            yield self
+        finally:
+            self._release()
+
+    def load(self):
+        """Read the session file, creating an empty session if missing.
+
+        :returns: The session dict, updated in place.
+        """
+        with self.locked():
+            if self.path.is_file():
+                try:
+                    data = json.loads(self.path.read_text())
+                except ValueError:
+                    data = {}
+            else:
+                data = {}
+            if not data.get("user_agent"):
+                data["user_agent"] = self.user_agent
+            self.session_data.clear()
+            self.session_data.update({"cookies": None, "token": None})
+            self.session_data.update(data)
+            if not self.path.is_file():
+                self._write()
+        return self.session_data
+
+    def save(self, session_data=None, issued=False):
+        """Write the session file atomically.
+
+        :param dict session_data: (optional) Values to merge in first.
+        :param bool issued: Whether the token was just issued by a login.
+        """
+        with self.locked():
+            if session_data is not None and session_data is not self.session_data:
+                self.session_data.update(session_data)
+            if issued:
+                self.session_data["issued_at"] = time.time()
+                self.session_data["validated_at"] = time.time()
+            self._write()
+        return self.session_data
+
+    def _write(self):
+        self.path.parent.mkdir(exist_ok=True, parents=True)
+        temp_path = self.path.with_name(f"{self.path.name}.tmp")
+        temp_path.write_text(json.dumps(self.session_data, indent=4))
+        os.replace(temp_path, self.path)
+
+    def invalidate(self):
+        """Forget the token so the next connect logs in again."""
+        self.session_data["token"] = None
+        self.session_data.pop("issued_at", None)
+        self.session_data.pop("validated_at", None)
+        self.save()
+
+    @property
+    def token_age(self):
+        issued_at = self.session_data.get("issued_at")
+        return time.time() - issued_at if issued_at else None
+
+    @property
+    def is_expired(self):
+        age = self.token_age
+        return age is not None and age > self.token_ttl
+
+    @property
+    def is_expiring(self):
+        age = self.token_age
+        return age is not None and age > self.token_ttl - self.refresh_margin
+
+    async def validate(self, api, force=False):
+        """Check the stored token cheaply, without the HTML login flow.
+
+        A recent validation is trusted; otherwise the cabinet digest is
+        requested with the stored cookies. Network failures leave the
+        token in place and let the websocket authorization decide.
+
+        :param api: The instance of :class:`QuotexAPI
+            <pyquotex.api.QuotexAPI>`.
+        :param bool force: Skip the recent validation shortcut.
+        :returns: True if the token can be used.
+        """
+        if not self.session_data.get("token") or self.is_expired:
+            return False
+        validated_at = self.session_data.get("validated_at") or 0
+        if not force and time.time() - validated_at < self.validate_interval:
+            return True
+        try:
+            user_settings = await run_blocking(api.settings.get_settings)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            logger.debug(f"Session validation skipped: {e}")
+            return True
+        except Exception as e:
+            logger.debug(f"Session validation failed: {e}")
+            return False
+        if not isinstance(user_settings, dict) or not user_settings.get("data"):
+            return False
+        self.session_data["validated_at"] = time.time()
+        self.save()
+        return True
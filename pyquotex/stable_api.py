@@ -5,21 +5,31 @@ from datetime import datetime
 from . import expiration
 from . import global_value
 from .api import QuotexAPI
+from .http.navigator import run_blocking
+from .ws.supervisor import ReconnectSupervisor
+from .ws.objects.connection import AUTHORIZED, REJECTED, CLOSED
+from .ws.limiter import RateLimiter
 from .utils.services import truncate
 from .utils.processor import (
     calculate_candles,
     process_candles_v2,
     merge_candles,
     process_tick,
-    aggregate_candle
+    aggregate_candle,
+    TimeframeAggregator,
+    merge_candles_with_gaps,
+    fill_gaps_from_ticks
 )
+from .session import SessionManager
+from .scheduler import OrderScheduler
+from .subscriptions import SubscriptionManager
+from .crawler import HistoryCrawler
+from .ws.objects.deals import DealResults
+from .utils.candle_cache import CandleCache
 from .config import (
-    load_session,
-    update_session,
     resource_path,
     credentials
 )
-from .utils.indicators import TechnicalIndicators
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +45,8 @@ class Quotex:
             root_path=".",
             user_data_dir="browser",
             asset_default="EURUSD",
-            period_default=60
+            period_default=60,
+            auto_reconnect=True
     ):
         self.size = [
             5,
@@ -71,9 +82,24 @@ class Quotex:
         self.websocket_client = None
         self.websocket_thread = None
         self.debug_ws_enable = False
+        self.auto_reconnect = auto_reconnect
+        self.supervisor = None
+        self.on_backfill = None
+        self.on_state_change = None
+        self.profile_refresh_interval = 300
+        self.profile_task = None
+        self.profile_updated_at = None
+        self.time_sync_task = None
+        self.session_task = None
+        self.scheduler = OrderScheduler(self)
+        self.subscriptions = SubscriptionManager(self)
+        self.deal_results = DealResults()
+        self.candle_cache = CandleCache()
+        self.candle_aggregators = {}
+        self.rate_limiter = RateLimiter()
         self.resource_path = resource_path(root_path)
-        session = load_session(user_agent)
-        self.session_data = session
+        self.session_manager = SessionManager(self.resource_path / "session.json", user_agent)
+        self.session_data = self.session_manager.load()
         if not email or not password:
             self.email, self.password = credentials()
 
@@ -84,13 +110,31 @@ class Quotex:
         """
         return self.websocket_client.wss
 
-    @staticmethod
-    async def check_connect():
-        await asyncio.sleep(2)
-        if global_value.check_accepted_connection == 1:
-            return True
+    async def check_connect(self, timeout: float = 0):
+        """Check whether the websocket session is authorized.
 
-        return False
+        Args:
+            timeout (float): Seconds to wait for authorization to settle.
+                The default of 0 answers instantly from the current state.
+
+        Returns:
+            bool: True if the session is authorized.
+        """
+        if self.api is None:
+            return False
+        state = self.api.connection_state
+        if timeout and not state.is_authorized:
+            await state.wait_for((AUTHORIZED, REJECTED), timeout)
+        return state.is_authorized
+
+    def _state_changed(self, state):
+        if state == CLOSED:
+            self.rate_limiter.penalize("disconnect")
+        callback = self.on_state_change
+        if callback:
+            result = callback(state)
+            if asyncio.iscoroutine(result):
+                asyncio.ensure_future(result)
 
     def set_session(self, user_agent: str, cookies: str = None, ssid: str = None):
         session = {
@@ -98,15 +142,10 @@ class Quotex:
             "token": ssid,
             "user_agent": user_agent
         }
-        self.session_data = update_session(session)
+        self.session_data = self.session_manager.save(session)
 
     async def re_subscribe_stream(self):
-        try:
-            for ac in self.subscribe_candle:
-                sp = ac.split(",")
-                await self.start_candles_one_stream(sp[0], sp[1])
-        except:
-            pass
+        self.subscriptions.replay()
         try:
             for ac in self.subscribe_candle_all_size:
                 await self.start_candles_all_size_stream(ac)
@@ -158,13 +197,16 @@ class Quotex:
 
         return self.codes_asset
 
-    async def get_candles(self, asset, end_from_time, offset, period, progressive=False):
+    async def get_candles(self, asset, end_from_time, offset, period, progressive=False, cached=False):
+        if cached and not progressive:
+            return await self.get_cached_candles(asset, end_from_time, offset, period)
         if end_from_time is None:
             end_from_time = time.time()
         index = expiration.get_timestamp()
         self.api.candles.candles_data = None
         self.api.current_asset = asset
-        self.start_candles_stream(asset, period)
+        await self.api.rate_limiter.wait("history")
+        self.subscriptions.ensure(asset, period)
         self.api.get_candles(asset, index, end_from_time, offset, period)
         start_history_wait = time.time()
         while True:
@@ -183,9 +225,92 @@ class Quotex:
 
         return candles
 
-    async def get_candles_v3(self, asset, count, period):
+    async def get_cached_candles(self, asset, end_from_time, offset, period):
+        """
+        Get candles through the history cache.
+
+        Only the candles from the last cached one onwards are requested when
+        the cache already covers the start of the range, and nothing at all
+        if the range ends before the last fetch plus the refresh interval.
+
+        Args:
+            asset (str): Asset name.
+            end_from_time (float): End of the range, defaults to now.
+            offset (int): Length of the range in seconds.
+            period (int): Candle period in seconds.
+
+        Returns:
+            list: The candles in the range.
+        """
+        if end_from_time is None:
+            end_from_time = time.time()
+        start = end_from_time - offset
+        series = self.candle_cache.get(asset, period)
+
+        if series is None or not series.covers(start) or series.last_time is None:
+            self.candle_cache.misses += 1
+            candles = await self.get_candles(asset, end_from_time, offset, period)
+            if candles:
+                candles, gaps = await self.repair_candles(asset, candles, period)
+                if gaps:
+                    logger.warning(f"{asset} ({period}s) candles still missing for {gaps}.")
+                self.candle_cache.store(asset, period, candles, start, end_from_time)
+            return candles
+
+        self.candle_cache.hits += 1
+        if end_from_time > series.fetched_until + self.candle_cache.refresh_interval:
+            tail_offset = int(end_from_time - series.last_time) + period
+            tail = await self.get_candles(asset, end_from_time, tail_offset, period)
+            self.candle_cache.store(asset, period, tail, end=end_from_time)
+        return series.slice(start, end_from_time)
+
+    async def repair_candles(self, asset, candles, period, start=None, end=None, max_requests=10):
+        """
+        Merge candles and fill the missing intervals.
+
+        Gaps are rebuilt from the archived realtime ticks of the asset when
+        they cover the whole interval; the rest is requested with one
+        history/load per gap covering only the missing window. Gaps the
+        server returns nothing for, such as market closures, are recorded
+        in the candle cache and not requested again.
+
+        Args:
+            asset (str): Asset name.
+            candles (list): Candles, possibly unsorted or with duplicates.
+            period (int): Candle period in seconds.
+            start (float, optional): Expected time of the first candle.
+            end (float, optional): Expected time of the last candle.
+            max_requests (int, optional): Most gaps to request from the server.
+
+        Returns:
+            tuple: The repaired candles and the gaps still missing as
+            ``(gap_start, gap_end)`` pairs, e.g. market closures.
+        """
+        candles, gaps = merge_candles_with_gaps(candles, period, start, end)
+        if not gaps:
+            return candles, gaps
+
+        candles, gaps = fill_gaps_from_ticks(candles, gaps, self.api.realtime_price.get(asset), period)
+        gaps = [gap for gap in gaps if not self.candle_cache.known_empty(asset, period, *gap)]
+        for gap_start, gap_end in gaps[:max_requests]:
+            block = await self.get_candles(asset, gap_end, gap_end - gap_start, period)
+            block = [c for c in block or [] if gap_start <= c["time"] < gap_end]
+            # A closed range stays empty; the forming candle may still come
+            if not block and gap_end <= time.time() - period:
+                self.candle_cache.mark_empty(asset, period, gap_start, gap_end)
+            candles += block
+
+        candles, gaps = merge_candles_with_gaps(candles, period, start, end)
+        if gaps:
+            logger.debug(f"Unrepaired {asset} ({period}s) gaps: {gaps}")
+        return candles, gaps
+
+    async def get_candles_v3(self, asset, count, period, repair=False):
         """
         Fetch a specific number of candles (e.g., 600) by making multiple requests.
+
+        Short blocks can leave holes between the requests; pass
+        ``repair=True`` to fill them through ``repair_candles``.
         """
         all_candles = []
         end_from_time = time.time()
@@ -209,19 +334,42 @@ class Quotex:
             
             if len(new_candles) < 100: # If block is too small, we reached the end of history
                 break
-            
-            # Rate limit/safety sleep
-            await asyncio.sleep(0.2)
-            
+
+        if repair:
+            all_candles, _ = await self.repair_candles(asset, all_candles, period)
         return all_candles[-count:] if len(all_candles) > count else all_candles
 
+    async def crawl_history(self, assets, start, end=None, period=60, directory=None, **kwargs):
+        """
+        Download candle history for many assets into resumable on-disk storage.
+
+        Args:
+            assets (list): Assets to crawl, e.g. every OTC asset.
+            start (float): Start timestamp of the range.
+            end (float, optional): End timestamp; defaults to now.
+            period (int, optional): Candle period in seconds. Defaults to 60.
+            directory (str, optional): Output directory; defaults to
+                ``history/<period>`` under the resource path.
+            **kwargs: Chunk size, concurrency, timeout and retries for
+                :class:`HistoryCrawler <pyquotex.crawler.HistoryCrawler>`.
+
+        Returns:
+            HistoryCrawler: The crawler, whose ``load(asset)`` reads the columns back.
+        """
+        if directory is None:
+            directory = self.resource_path / "history" / str(period)
+        crawler = HistoryCrawler(self, directory, period, **kwargs)
+        written = await crawler.run(assets, start, end)
+        logger.info(f"Crawled {sum(written.values())} chunks for {len(assets)} assets.")
+        return crawler
+
     async def get_history_line(self, asset, end_from_time, offset):
         if end_from_time is None:
             end_from_time = time.time()
         index = expiration.get_timestamp()
         self.api.current_asset = asset
         self.api.historical_candles = None
-        self.start_candles_stream(asset)
+        self.subscriptions.ensure(asset)
         self.api.get_history_line(self.codes_asset[asset], index, end_from_time, offset)
         while True:
             while self.check_connect and self.api.historical_candles is None:
@@ -232,7 +380,8 @@ class Quotex:
 
     async def get_candle_v2(self, asset, period):
         self.api.candle_v2_data[asset] = None
-        self.start_candles_stream(asset, period)
+        self.api.current_asset = asset
+        self.subscriptions.ensure(asset, period)
         while self.api.candle_v2_data[asset] is None:
             await asyncio.sleep(0.2)
         candles = self.prepare_candles(asset, period)
@@ -255,7 +404,59 @@ class Quotex:
 
         return new_candles
 
-    async def connect(self):
+    async def connect(self, attempts: int = 5, base_delay: float = 1, max_delay: float = 30):
+        """Connect and authorize the websocket session.
+
+        A rejected token is discarded and a new one obtained by logging in
+        before the next attempt; attempts are spaced by exponential backoff.
+
+        Args:
+            attempts (int): Connection attempts before giving up.
+            base_delay (float): First backoff delay in seconds.
+            max_delay (float): Upper bound for the backoff delay in seconds.
+
+        Returns:
+            tuple: (True, reason) once authorized, (False, reason) otherwise.
+        """
+        if self.supervisor:
+            await self.supervisor.stop()
+            self.supervisor = None
+
+        check, reason = False, "Websocket session not authorized."
+        for attempt in range(attempts):
+            if attempt:
+                await asyncio.sleep(min(base_delay * 2 ** (attempt - 1), max_delay))
+            check, reason = await self._open_connection()
+            if await self.check_connect(timeout=10):
+                break
+            if self.api.connection_state.state == REJECTED:
+                logger.debug("Session token rejected, logging in again.")
+                reason = "Websocket Token Rejected."
+                self.session_manager.invalidate()
+                await self.refresh_session()
+            logger.warning(f"Connect attempt {attempt + 1} of {attempts} failed: {reason}")
+        else:
+            return False, reason
+
+        if self.auto_reconnect:
+            self.supervisor = ReconnectSupervisor(self)
+            self.supervisor.start()
+
+        if self.time_sync_task is None or self.time_sync_task.done():
+            self.time_sync_task = asyncio.create_task(self.start_time_sync())
+
+        if self.session_task is None or self.session_task.done():
+            self.session_task = asyncio.create_task(self.start_session_refresh())
+
+        return check, reason
+
+    async def _open_connection(self):
+        profile = None
+        if self.api is not None:
+            # Only the old transport goes; scheduled orders and the
+            # background tasks carry over to the new API instance
+            await self.api.close()
+            profile = self.api.profile
         self.api = QuotexAPI(
             "market-qx.trade",
             self.email,
@@ -264,27 +465,53 @@ class Quotex:
             resource_path=self.resource_path,
             user_data_dir=self.user_data_dir
         )
-        await self.close()
+        asyncio.ensure_future(run_blocking(self.api.browser.warm_up, self.api.https_url))
         self.api.trace_ws = self.debug_ws_enable
         self.api.session_data = self.session_data
+        self.api.session_manager = self.session_manager
+        self.api.deal_results = self.deal_results
+        self.api.candle_aggregators = self.candle_aggregators
+        self.api.rate_limiter = self.rate_limiter
+        if profile is not None:
+            self.api.profile = profile
         self.api.current_asset = self.asset_default
         self.api.current_period = self.period_default
+        loop = asyncio.get_running_loop()
+        self.api.connection_state.listeners.append(
+            lambda state: loop.call_soon_threadsafe(self._state_changed, state)
+        )
+        if not await self.session_manager.validate(self.api):
+            await self.refresh_session()
         global_value.SSID = self.session_data.get("token")
 
-        if not self.session_data.get("token"):
-            await self.api.authenticate()
-
-        check, reason = await self.api.connect(self.account_is_demo)
-
-        if not await self.check_connect():
-            logger.debug("Reconnecting on websocket")
-            return await self.connect()
-
-        return check, reason
+        return await self.api.connect(self.account_is_demo)
 
     async def reconnect(self):
         await self.api.authenticate()
 
+    async def refresh_session(self):
+        """Log in again, unless another process already renewed the token."""
+        token = self.session_data.get("token")
+        async with self.session_manager.locked_async():
+            self.session_manager.load()
+            if (self.session_data.get("token") != token
+                    and await self.session_manager.validate(self.api)):
+                global_value.SSID = self.session_data.get("token")
+                return
+            await self.api.authenticate()
+
+    async def start_session_refresh(self):
+        """Validate the session periodically and renew it before it expires."""
+        while True:
+            await asyncio.sleep(self.session_manager.validate_interval)
+            try:
+                if (self.session_manager.is_expiring
+                        or not await self.session_manager.validate(self.api)):
+                    await self.refresh_session()
+            except (Exception, SystemExit) as e:
+                # authenticate() exits the process on a failed login
+                logger.warning(f"Session refresh failed: {e}")
+
     def set_account_mode(self, balance_mode="PRACTICE"):
         """Set active account `real` or `practice`"""
         if balance_mode.upper() == "REAL":
@@ -344,15 +571,50 @@ class Quotex:
                 - 14400: 4 horas
                 - 86400: 1 día
         """
+        result = await self.calculate_indicators(asset, [(indicator, params)], history_size, timeframe)
+        if "error" in result:
+            return result
+        return next(iter(result.values()))
+
+    async def calculate_indicators(
+            self, asset: str,
+            specs: list,
+            history_size: int = 3600,
+            timeframe: int = 60
+    ) -> dict:
+        """
+        Calcula varios indicadores técnicos con una sola descarga de velas
+
+        Las velas se piden una vez, los arrays se construyen una vez y los
+        cálculos intermedios comunes (EMAs, SMAs, True Range) se comparten
+        entre los indicadores.
+
+        Args:
+            asset (str): Nombre del activo (ej: "EURUSD")
+            specs (list): Indicadores a calcular, p. ej.
+                ["RSI", ("EMA", {"period": 50}), {"name": "MACD", "label": "macd"}]
+            history_size (int): Tamaño del histórico en segundos
+            timeframe (int): Temporalidad en segundos, como en `calculate_indicator`
+
+        Returns:
+            dict: Por etiqueta (la dada, el nombre o nombre_parámetros), el mismo
+            resultado que devolvería `calculate_indicator`
+        """
         # Validar timeframe
         valid_timeframes = [60, 300, 900, 1800, 3600, 7200, 14400, 86400]
         if timeframe not in valid_timeframes:
             return {"error": f"Timeframe no válido. Valores permitidos: {valid_timeframes}"}
 
+        from .utils.indicators import TechnicalIndicators, get_indicator, normalize_specs
+        try:
+            specs = normalize_specs(specs)
+        except ValueError as e:
+            return {"error": str(e)}
+
         # Ajustar history_size para asegurar suficientes velas según el timeframe
         adjusted_history = max(history_size, timeframe * 50)  # Asegurar al menos 50 velas
 
-        candles = await self.get_candles(asset, time.time(), adjusted_history, timeframe)
+        candles = await self.get_candles(asset, time.time(), adjusted_history, timeframe, cached=True)
 
         if not candles:
             return {"error": f"No hay datos disponibles para el activo {asset}"}
@@ -362,110 +624,82 @@ class Quotex:
         lows = [float(candle["low"]) for candle in candles]
         timestamps = [candle["time"] for candle in candles]
 
-        indicators = TechnicalIndicators()
-        indicator = indicator.upper()
-
         try:
-            # RSI
-            if indicator == "RSI":
-                period = params.get("period", 14)
-                values = indicators.calculate_rsi(prices, period)
-                return {
-                    "rsi": values,
-                    "current": values[-1] if values else None,
-                    "history_size": len(values),
-                    "timeframe": timeframe,
-                    "timestamps": timestamps[-len(values):] if values else []
-                }
-
-            # MACD
-            elif indicator == "MACD":
-                fast_period = params.get("fast_period", 12)
-                slow_period = params.get("slow_period", 26)
-                signal_period = params.get("signal_period", 9)
-                macd_data = indicators.calculate_macd(prices, fast_period, slow_period, signal_period)
-                macd_data["timeframe"] = timeframe
-                macd_data["timestamps"] = timestamps[-len(macd_data["macd"]):] if macd_data["macd"] else []
-                return macd_data
-
-            # SMA
-            elif indicator == "SMA":
-                period = params.get("period", 20)
-                values = indicators.calculate_sma(prices, period)
-                return {
-                    "sma": values,
-                    "current": values[-1] if values else None,
-                    "history_size": len(values),
-                    "timeframe": timeframe,
-                    "timestamps": timestamps[-len(values):] if values else []
-                }
+            values = TechnicalIndicators.calculate_many(specs, prices, highs, lows)
+        except Exception as e:
+            return {"error": f"Error calculando el indicador: {str(e)}"}
 
-            # EMA
-            elif indicator == "EMA":
-                period = params.get("period", 20)
-                values = indicators.calculate_ema(prices, period)
-                return {
-                    "ema": values,
-                    "current": values[-1] if values else None,
-                    "history_size": len(values),
+        results = {}
+        for label, name, _ in specs:
+            data = values[label]
+            if isinstance(data, list):
+                results[label] = {
+                    get_indicator(name).primary: data,
+                    "current": data[-1] if data else None,
+                    "history_size": len(data),
                     "timeframe": timeframe,
-                    "timestamps": timestamps[-len(values):] if values else []
+                    "timestamps": timestamps[-len(data):] if data else []
                 }
+            else:
+                primary = data[get_indicator(name).primary]
+                data["timeframe"] = timeframe
+                data["timestamps"] = timestamps[-len(primary):] if primary else []
+                results[label] = data
+        return results
 
-            # BOLLINGER
-            elif indicator == "BOLLINGER":
-                period = params.get("period", 20)
-                num_std = params.get("std", 2)
-                bb_data = indicators.calculate_bollinger_bands(prices, period, num_std)
-                bb_data["timeframe"] = timeframe
-                bb_data["timestamps"] = timestamps[-len(bb_data["middle"]):] if bb_data["middle"] else []
-                return bb_data
-
-            # STOCHASTIC
-            elif indicator == "STOCHASTIC":
-                k_period = params.get("k_period", 14)
-                d_period = params.get("d_period", 3)
-                stoch_data = indicators.calculate_stochastic(prices, highs, lows, k_period, d_period)
-                stoch_data["timeframe"] = timeframe
-                stoch_data["timestamps"] = timestamps[-len(stoch_data["k"]):] if stoch_data["k"] else []
-                return stoch_data
-
-            # ATR
-            elif indicator == "ATR":
-                period = params.get("period", 14)
-                values = indicators.calculate_atr(highs, lows, prices, period)
-                return {
-                    "atr": values,
-                    "current": values[-1] if values else None,
-                    "history_size": len(values),
-                    "timeframe": timeframe,
-                    "timestamps": timestamps[-len(values):] if values else []
-                }
+    async def scan_indicator(
+            self,
+            assets: list,
+            indicator: str,
+            params: dict = None,
+            history_size: int = 3600,
+            timeframe: int = 60,
+            candles: dict = None
+    ) -> dict:
+        """
+        Calcula un indicador para varios activos en una sola pasada
 
-            # ADX
-            elif indicator == "ADX":
-                period = params.get("period", 14)
-                adx_data = indicators.calculate_adx(highs, lows, prices, period)
-                adx_data["timeframe"] = timeframe
-                adx_data["timestamps"] = timestamps[-len(adx_data["adx"]):] if adx_data["adx"] else []
-                return adx_data
-
-            # ICHIMOKU
-            elif indicator == "ICHIMOKU":
-                tenkan_period = params.get("tenkan_period", 9)
-                kijun_period = params.get("kijun_period", 26)
-                senkou_b_period = params.get("senkou_b_period", 52)
-                ichimoku_data = indicators.calculate_ichimoku(highs, lows, tenkan_period, kijun_period, senkou_b_period)
-                ichimoku_data["timeframe"] = timeframe
-                ichimoku_data["timestamps"] = timestamps[-len(ichimoku_data["tenkan"]):] if ichimoku_data[
-                    "tenkan"] else []
-                return ichimoku_data
+        Las velas de todos los activos se alinean en una matriz activos × tiempo
+        y el indicador se calcula de una vez por el eje del tiempo.
 
-            else:
-                return {"error": f"Indicador '{indicator}' no soportado"}
+        Args:
+            assets (list): Nombres de los activos
+            indicator (str): Nombre del indicador
+            params (dict): Parámetros del indicador
+            history_size (int): Tamaño del histórico en segundos
+            timeframe (int): Temporalidad en segundos
+            candles (dict): Velas ya descargadas por activo; si se omite se descargan
 
-        except Exception as e:
-            return {"error": f"Error calculando el indicador: {str(e)}"}
+        Returns:
+            dict: El último valor de cada línea del indicador por activo
+        """
+        import numpy as np
+        from .utils.indicators import BatchIndicators
+        params = params or {}
+        if candles is None:
+            candles = {}
+            for asset in assets:
+                candles[asset] = await self.get_candles(asset, time.time(), history_size, timeframe, cached=True)
+
+        # Una matriz por longitud de histórico; normalmente todas coinciden
+        groups = {}
+        for asset in assets:
+            if candles.get(asset):
+                groups.setdefault(len(candles[asset]), {})[asset] = candles[asset]
+
+        result = {}
+        for group in groups.values():
+            names, closes, highs, lows = BatchIndicators.align(group)
+            try:
+                latest = BatchIndicators.latest(indicator, closes, highs, lows, **params)
+            except ValueError as e:
+                return {"error": str(e)}
+            for row, asset in enumerate(names):
+                result[asset] = {
+                    line: None if np.isnan(values[row]) else float(values[row])
+                    for line, values in latest.items()
+                }
+        return result
 
     async def subscribe_indicator(
             self, asset: str,
@@ -494,7 +728,8 @@ class Quotex:
 
         try:
             # Iniciar stream de velas
-            self.start_candles_stream(asset, timeframe)
+            self.api.current_asset = asset
+            self.subscriptions.acquire(asset, timeframe, owner="indicator")
 
             while True:
                 try:
@@ -511,26 +746,20 @@ class Quotex:
                         lows = [float(candle[1]["low"]) for candle in candles_list]
 
                         # Asegurar que tenemos suficientes datos
-                        min_periods = {
-                            "RSI": 14,
-                            "MACD": 26,
-                            "BOLLINGER": 20,
-                            "STOCHASTIC": 14,
-                            "ADX": 14,
-                            "ATR": 14,
-                            "SMA": 20,
-                            "EMA": 20,
-                            "ICHIMOKU": 52
-                        }
-
-                        required_periods = min_periods.get(indicator.upper(), 14)
+                        from .utils.indicators import TechnicalIndicators, get_indicator
+                        indicator = indicator.upper()
+                        try:
+                            required_periods = get_indicator(indicator).required_length(params)
+                        except ValueError:
+                            required_periods = 14
                         if len(prices) < required_periods:
                             # Si no hay suficientes datos, obtener histórico
                             historical_candles = await self.get_candles(
                                 asset,
                                 time.time(),
                                 timeframe * required_periods * 2,  # Doble del período requerido
-                                timeframe
+                                timeframe,
+                                cached=True
                             )
                             if historical_candles:
                                 # Combinar datos históricos con tiempo real
@@ -538,9 +767,6 @@ class Quotex:
                                 highs = [float(candle["high"]) for candle in historical_candles] + highs
                                 lows = [float(candle["low"]) for candle in historical_candles] + lows
 
-                        indicators = TechnicalIndicators()
-                        indicator = indicator.upper()
-
                         # Calcular el indicador con los datos actualizados
                         result = {
                             "time": candles_list[-1][0],
@@ -548,64 +774,19 @@ class Quotex:
                             "asset": asset
                         }
 
-                        if indicator == "RSI":
-                            period = params.get("period", 14)
-                            values = indicators.calculate_rsi(prices, period)
-                            result["value"] = values[-1] if values else None
-                            result["all_values"] = values
-                            result["indicator"] = "RSI"
-
-                        elif indicator == "MACD":
-                            fast_period = params.get("fast_period", 12)
-                            slow_period = params.get("slow_period", 26)
-                            signal_period = params.get("signal_period", 9)
-                            macd_data = indicators.calculate_macd(prices, fast_period, slow_period, signal_period)
-                            result["value"] = macd_data["current"]
-                            result["all_values"] = macd_data
-                            result["indicator"] = "MACD"
-
-                        # BOLLINGER
-                        elif indicator == "BOLLINGER":
-                            period = params.get("period", 20)
-                            num_std = params.get("std", 2)
-                            bb_data = indicators.calculate_bollinger_bands(prices, period, num_std)
-                            result["value"] = bb_data["current"]
-                            result["all_values"] = bb_data
-
-                        # STOCHASTIC
-                        elif indicator == "STOCHASTIC":
-                            k_period = params.get("k_period", 14)
-                            d_period = params.get("d_period", 3)
-                            stoch_data = indicators.calculate_stochastic(prices, highs, lows, k_period, d_period)
-                            result["value"] = stoch_data["current"]
-                            result["all_values"] = stoch_data
-
-                        # ADX
-                        elif indicator == "ADX":
-                            period = params.get("period", 14)
-                            adx_data = indicators.calculate_adx(highs, lows, prices, period)
-                            result["value"] = adx_data["current"]
-                            result["all_values"] = adx_data
-
-                        # ATR
-                        elif indicator == "ATR":
-                            period = params.get("period", 14)
-                            values = indicators.calculate_atr(highs, lows, prices, period)
-                            result["value"] = values[-1] if values else None
-                            result["all_values"] = values
-
-                        # ICHIMOKU
-                        elif indicator == "ICHIMOKU":
-                            tenkan_period = params.get("tenkan_period", 9)
-                            kijun_period = params.get("kijun_period", 26)
-                            senkou_b_period = params.get("senkou_b_period", 52)
-                            ichimoku_data = indicators.calculate_ichimoku(highs, lows, tenkan_period, kijun_period,
-                                                                          senkou_b_period)
-                            result["value"] = ichimoku_data["current"]
-                            result["all_values"] = ichimoku_data
-
-                        else:
+                        try:
+                            data = TechnicalIndicators.calculate_many(
+                                [(indicator, indicator, params or {})], prices, highs, lows
+                            )[indicator]
+                        except ValueError:
                             result["error"] = f"Indicador '{indicator}' no soportado para tiempo real"
+                        else:
+                            if isinstance(data, list):
+                                result["value"] = data[-1] if data else None
+                            else:
+                                result["value"] = data["current"]
+                            result["all_values"] = data
+                            result["indicator"] = indicator
 
                         # Llamar al callback con el resultado
                         await callback(result)
@@ -620,15 +801,51 @@ class Quotex:
         finally:
             # Limpiar suscripciones al salir
             try:
-                self.stop_candles_stream(asset)
+                self.subscriptions.release(asset, timeframe, owner="indicator")
             except:
                 pass
 
     async def get_profile(self):
-        return await self.api.get_profile()
+        profile = await self.api.get_profile()
+        self.profile_updated_at = time.time()
+        return profile
+
+    async def get_cached_profile(self):
+        """Return the profile, fetching the digest only when there is none yet.
+
+        A stale profile is returned as is while a refresh runs in the
+        background, so order placement never waits on the HTTP round trip.
+        """
+        if self.profile_updated_at is None:
+            return await self.get_profile()
+        if time.time() - self.profile_updated_at > self.profile_refresh_interval:
+            if self.profile_task is None or self.profile_task.done():
+                self.profile_task = asyncio.create_task(self._refresh_profile())
+        return self.api.profile
+
+    async def _refresh_profile(self):
+        try:
+            await self.get_profile()
+        except Exception as e:
+            logger.debug(f"Profile refresh failed: {e}")
+
+    async def start_time_sync(self):
+        """Keep the profile time zone and server clock offset fresh.
+
+        The clock offset is sampled from every tick by the websocket client;
+        this loop only refreshes the digest so order placement never waits
+        on an HTTP round trip.
+        """
+        while True:
+            try:
+                await self.get_profile()
+            except Exception as e:
+                logger.debug(f"Time sync refresh failed: {e}")
+            # Well before the profile counts as stale
+            await asyncio.sleep(self.profile_refresh_interval / 2)
 
     async def get_server_time(self):
-        user_settings = await self.get_profile()
+        user_settings = await self.get_cached_profile()
         offset_zone = user_settings.offset
         self.api.timesync.server_timestamp = expiration.get_server_timer(offset_zone)
         return self.api.timesync.server_timestamp
@@ -658,32 +875,136 @@ class Quotex:
 
         """
         self.api.buy_id = None
-        request_id = expiration.get_timestamp()
+        pending = self.api.pending_orders
+        request_id = pending.next_request_id()
+        # Registered like buy_many, so concurrent orders get their own response
+        future = pending.add(request_id, asset)
         is_fast_option = time_mode.upper() == "TIME"
-        self.start_candles_stream(asset, duration)
-        await self.get_server_time()
+        self.api.current_asset = asset
+        self.subscriptions.ensure(asset, duration)
+        self.api.timesync.server_timestamp = self.api.timesync.server_time()
         self.api.buy(amount, asset, direction, duration, request_id, is_fast_option)
 
-        count = 0.1
-        while self.api.buy_id is None:
-            count += 0.1
-            if count > duration:
-                status_buy = False
-                break
-            await asyncio.sleep(0.2)
-            if global_value.check_websocket_if_error:
-                return False, global_value.websocket_error_reason
-        else:
-            status_buy = True
+        try:
+            return await asyncio.wait_for(future, timeout=duration * 2)
+        except asyncio.TimeoutError:
+            pending.discard(request_id)
+            return False, self.api.buy_successful
+
+    def prepare_order(self, asset: str, direction: str, duration: int, time_mode: str = "TIME"):
+        """
+        Build and cache the frames of an order ahead of time
 
-        return status_buy, self.api.buy_successful
+        ``buy`` and ``buy_many`` reuse the cached frames, so preparing the
+        orders before a candle boundary leaves only the amount, expiration
+        and requestId to fill in when they are sent.
+
+        Args:
+            asset (str): Asset to buy.
+            direction (str): Direction to buy.
+            duration (int): Duration to buy.
+            time_mode (str): Time mode to buy.
+
+        Returns:
+            The prepared order.
+
+        """
+        return self.api.buy.prepare(asset, direction, duration, time_mode.upper() == "TIME")
+
+    def schedule_order(
+            self,
+            amount: float,
+            asset: str,
+            direction: str,
+            duration: int,
+            at: int = None,
+            period: int = None,
+            time_mode: str = "TIME"
+    ):
+        """
+        Schedule a Binary option to be bought at a candle boundary
+
+        The order frames are prepared now and sent when the server clock
+        reaches ``at``, by default the open of the next candle.
+
+        Args:
+            amount (float): Amount to buy.
+            asset (str): Asset to buy.
+            direction (str): Direction to buy.
+            duration (int): Duration to buy.
+            at (int): Server timestamp to send the order at.
+            period (int): Candle period used when ``at`` is not given.
+            Defaults to the duration.
+            time_mode (str): Time mode to buy.
+
+        Returns:
+            The scheduled order; await it for the buy result and read its
+            ``jitter`` for how late it was sent.
+
+        """
+        return self.scheduler.schedule(amount, asset, direction, duration, at, period, time_mode)
+
+    async def buy_many(self, orders, time_mode: str = "TIME", timeout: float = 10):
+        """
+        Buy several Binary options at once
+
+        All ``orders/open`` frames are sent back-to-back and the responses
+        are matched to their orders by requestId as they arrive, so every
+        order reaches the server within the same moment.
+
+        Args:
+            orders (list): Orders as dicts with amount, asset, direction and
+                duration keys, or as (amount, asset, direction, duration) tuples.
+            time_mode (str): Time mode to buy.
+            timeout (float): Seconds to wait for the responses.
+
+        Returns:
+            A list of (status, result) tuples in the order of ``orders``.
+
+        """
+        fields = ("amount", "asset", "direction", "duration")
+        orders = [o if isinstance(o, dict) else dict(zip(fields, o)) for o in orders]
+        if not orders:
+            return []
+        is_fast_option = time_mode.upper() == "TIME"
+        pending = self.api.pending_orders
+        self.api.timesync.server_timestamp = self.api.timesync.server_time()
+
+        request_ids, futures = [], []
+        for order in orders:
+            request_id = pending.next_request_id()
+            request_ids.append(request_id)
+            futures.append(pending.add(request_id, order["asset"]))
+
+        self.api.send_websocket_request('42["tick"]')
+        for order, request_id in zip(orders, request_ids):
+            self.api.buy(
+                order["amount"],
+                order["asset"],
+                order["direction"],
+                order["duration"],
+                request_id,
+                is_fast_option,
+                send_tick=False
+            )
+
+        done, _ = await asyncio.wait(futures, timeout=timeout)
+        results = []
+        for future, request_id in zip(futures, request_ids):
+            if future in done:
+                results.append(future.result())
+            else:
+                pending.discard(request_id)
+                future.cancel()
+                results.append((False, "timeout"))
+        return results
 
     async def open_pending(self, amount: float, asset: str, direction: str, duration: int, open_time: str = None):
         self.api.pending_id = None
-        user_settings = await self.get_profile()
+        user_settings = await self.get_cached_profile()
         offset_zone = user_settings.offset
         open_time = expiration.get_next_timeframe(
-            int(time.time()),
+            int(self.api.timesync.server_time()),
             offset_zone,
             duration,
             open_time
@@ -761,31 +1082,55 @@ class Quotex:
             print(f"\rRemaining {remaing_time if remaing_time > 0 else 0} seconds...", end="")
             await asyncio.sleep(1)
 
-    async def check_win(self, id_number: int):
-        """Check win based id"""
-        task = asyncio.create_task(
-            self.start_remaing_time()
-        )
-        while True:
-            data_dict = self.api.listinfodata.get(id_number)
-            if data_dict and data_dict.get("game_state") == 1:
-                break
-            await asyncio.sleep(0.2)
-        task.cancel()
-        self.api.listinfodata.delete(id_number)
-        return data_dict["win"]
+    async def check_win(self, id_number: int, countdown: bool = False, timeout: float = None):
+        """Check win based id
+
+        Args:
+            id_number (int): The id of the trade.
+            countdown (bool): Print the seconds left until expiration.
+            timeout (float): Maximum seconds to wait for the result.
+
+        Returns:
+            True on a win, False on a loss, None on timeout.
+        """
+        task = None
+        if countdown:
+            task = asyncio.create_task(
+                self.start_remaing_time()
+            )
+        try:
+            deal = await self.deal_results.wait(id_number, timeout)
+        finally:
+            if task:
+                task.cancel()
+        if deal is None:
+            return None
+        self.api.profit_in_operation = deal["profit"]
+        self.api.listinfodata.listinfodata_dict.pop(id_number, None)
+        return deal["win"]
+
+    async def iter_deals(self):
+        """Iterate over every trade result as it settles.
+
+        Yields:
+            dict: The deal, with its ``win`` flag and ``profit``.
+        """
+        async for deal in self.deal_results.stream():
+            yield deal
 
     def start_candles_stream(self, asset: str = "EURUSD", period: int = 0):
         """Start streaming candle data for a specified asset.
 
+        Streams are shared: the subscribe frames are only sent if the stream
+        is not active yet, and each call should be paired with a
+        ``stop_candles_stream(asset, period)``.
+
         Args:
             asset (str): The asset to stream data for.
             period (int, optional): The period for the candles. Defaults to 0.
         """
         self.api.current_asset = asset
-        self.api.subscribe_realtime_candle(asset, period)
-        self.api.chart_notification(asset)
-        self.api.follow_candle(asset)
+        self.subscriptions.acquire(asset, period)
 
     async def store_settings_apply(
             self,
@@ -841,9 +1186,84 @@ class Quotex:
 
         return investments_settings
 
-    def stop_candles_stream(self, asset):
-        self.api.unsubscribe_realtime_candle(asset)
-        self.api.unfollow_candle(asset)
+    def start_timeframes_stream(
+            self,
+            asset: str,
+            timeframes: list,
+            on_close=None,
+            period: int = 60,
+            history: list = None
+    ):
+        """Build candles of several timeframes from a single realtime stream.
+
+        One subscription per asset feeds every timeframe, so 1m, 5m, 15m
+        and 1h views need no extra network traffic.
+
+        Args:
+            asset (str): The asset to stream.
+            timeframes (list): Timeframes in seconds, e.g. [60, 300, 900, 3600].
+            on_close (callable, optional): Called as ``on_close(asset, timeframe, candle)``
+                on the event loop each time a candle closes. Coroutine functions
+                are scheduled as tasks.
+            period (int, optional): The period of the underlying stream. Defaults to 60.
+            history (list, optional): Base candles, e.g. from ``get_candles``, to
+                seed the higher timeframes with.
+
+        Returns:
+            TimeframeAggregator: The aggregator, to read candles from at any time.
+        """
+        callback = None
+        if on_close:
+            loop = asyncio.get_running_loop()
+
+            def run_callback(symbol, timeframe, candle):
+                result = on_close(symbol, timeframe, candle)
+                if asyncio.iscoroutine(result):
+                    asyncio.ensure_future(result)
+
+            def callback(symbol, timeframe, candle):
+                loop.call_soon_threadsafe(run_callback, symbol, timeframe, candle)
+
+        aggregator = TimeframeAggregator(timeframes, callback)
+        for candle in history or []:
+            aggregator.add_candle(candle, asset)
+        self.candle_aggregators[asset] = aggregator
+        self.api.current_asset = asset
+        self.subscriptions.acquire(asset, period, owner="timeframes")
+        return aggregator
+
+    async def subscribe_streams(self, assets: list, period: int = 0):
+        """Start the candle streams of many assets as fast as the subscribe budget allows.
+
+        Args:
+            assets (list): The assets to stream.
+            period (int, optional): The period for the candles. Defaults to 0.
+        """
+        for asset in assets:
+            # Up to three frames: instruments/update, chart_notification/get, depth/follow
+            await self.api.rate_limiter.wait("subscribe", 3)
+            self.start_candles_stream(asset, period)
+
+    def stop_timeframes_stream(self, asset: str, period: int = 60):
+        self.candle_aggregators.pop(asset, None)
+        self.subscriptions.release(asset, period, owner="timeframes")
+
+    def stop_candles_stream(self, asset, period: int = None):
+        """Stop streaming candle data for a specified asset.
+
+        Args:
+            asset (str): The asset to stop.
+            period (int, optional): Release the reference taken by
+                ``start_candles_stream`` with this period; the stream is
+                unsubscribed once nobody else uses it. If omitted, every
+                reference taken by ``start_candles_stream`` on the asset is
+                released, while the streams held by timeframe aggregators,
+                indicators or the crawler stay open.
+        """
+        if period is None:
+            self.subscriptions.stop(asset)
+        else:
+            self.subscriptions.release(asset, period)
 
     def start_signals_data(self):
         self.api.signals_subscribe()
@@ -861,22 +1281,42 @@ class Quotex:
         return candles_dict
 
 
+    def _hold_realtime(self, asset: str, period: int):
+        # One reference per stream however often it is started, so a
+        # single stop_realtime_price releases it
+        self.api.current_asset = asset
+        if not self.subscriptions.refs(asset, period, owner="realtime"):
+            self.subscriptions.acquire(asset, period, owner="realtime")
+
     async def start_realtime_price(self, asset: str, period: int = 0):
-        self.start_candles_stream(asset, period)
+        self._hold_realtime(asset, period)
         while True:
             if self.api.realtime_price.get(asset):
                 return self.api.realtime_price
             await asyncio.sleep(0.2)
 
+    async def stop_realtime_price(self, asset: str, period: int = None):
+        """Stop the streams started by the ``start_realtime_*`` methods.
+
+        Args:
+            asset (str): The asset to stop.
+            period (int, optional): Only stop this period; by default every
+                period of the asset.
+        """
+        if period is None:
+            self.subscriptions.stop(asset, owner="realtime")
+        else:
+            self.subscriptions.release(asset, period, owner="realtime")
+
     async def start_realtime_sentiment(self, asset: str, period: int = 0):
-        self.start_candles_stream(asset, period)
+        self._hold_realtime(asset, period)
         while True:
             if self.api.realtime_sentiment.get(asset):
                 return self.api.realtime_sentiment[asset]
             await asyncio.sleep(0.2)
 
     async def start_realtime_candle(self, asset: str, period: int = 0):
-        self.start_candles_stream(asset, period)
+        self._hold_realtime(asset, period)
         data = {}
         while True:
             print("Tá agarrado....")
@@ -915,8 +1355,13 @@ class Quotex:
             operation_id (str): The ID of the trade to check.
         Returns:
             str: win if the trade is a win, loss otherwise.
-            float: The profit from operations; returns 0 if no profit is recorded.
+            dict: The deal if it settled during this session, otherwise
+            the history item of the trade.
         """
+        deal = self.deal_results.get(operation_id)
+        if deal is not None:
+            return "win" if deal["win"] else "loss", deal
+
         data_history = await self.get_history()
         for item in data_history:
             if item.get("ticket") == operation_id:
@@ -930,22 +1375,14 @@ class Quotex:
         if not (str(asset + "," + str(size)) in self.subscribe_candle):
             self.subscribe_candle.append((asset + "," + str(size)))
         start = time.time()
-        self.api.candle_generated_check[str(asset)][int(size)] = {}
+        self.start_candles_stream(asset, int(size))
         while True:
             if time.time() - start > 20:
                 logger.error(
                     '**error** start_candles_one_stream late for 20 sec')
                 return False
-            try:
-                if self.api.candle_generated_check[str(asset)][int(size)]:
-                    return True
-            except:
-                pass
-            try:
-                self.api.follow_candle(self.codes_asset[asset])
-            except:
-                logger.error('**error** start_candles_stream reconnect')
-                await self.connect()
+            if self.api.realtime_price.get(asset):
+                return True
             await asyncio.sleep(0.2)
 
     async def start_candles_all_size_stream(self, asset):
@@ -983,4 +1420,17 @@ class Quotex:
                 await asyncio.sleep(0.2)
 
     async def close(self):
+        await self.scheduler.close()
+        if self.session_task:
+            self.session_task.cancel()
+            self.session_task = None
+        if self.time_sync_task:
+            self.time_sync_task.cancel()
+            self.time_sync_task = None
+        if self.profile_task:
+            self.profile_task.cancel()
+            self.profile_task = None
+        if self.supervisor:
+            await self.supervisor.stop()
+            self.supervisor = None
         return await self.api.close()
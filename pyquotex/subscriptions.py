@@ -0,0 +1,180 @@
+"""Module for Quotex realtime stream subscriptions."""
+import asyncio
+import logging
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class SubscriptionManager(object):
+    """Class to share realtime streams between their users.
+
+    Every (asset, period) stream is reference counted per owner, the
+    consumers that keep a stream open such as the user's own streams,
+    timeframe aggregators or the crawler. The subscribe frames are sent on
+    the first acquire only, and the asset is followed once whatever the
+    number of periods. After the last release the stream lingers for a
+    while before it is unsubscribed, so a consumer that comes back soon
+    does not resubscribe. One-off requests such as ``get_candles`` or
+    ``buy`` only :meth:`ensure` the stream: it is opened without an owner
+    and lingers, so repeated requests send nothing until it has been
+    idle for ``linger`` seconds. Live buffers are never cleared.
+    """
+
+    def __init__(self, client, linger=30):
+        """
+        :param client: The instance of :class:`Quotex
+            <pyquotex.stable_api.Quotex>`.
+        :param linger: Seconds an unused stream stays subscribed.
+        """
+        self.client = client
+        self.linger = linger
+        self._refs = {}
+        self._timers = {}
+
+    def __contains__(self, key):
+        return key in self._refs
+
+    def refs(self, asset, period=0, owner=...):
+        owners = self._refs.get((asset, period), {})
+        return sum(owners.values()) if owner is ... else owners.get(owner, 0)
+
+    def streams(self):
+        """Method to get the subscribed streams.
+
+        :returns: A dict of asset to the period it was last subscribed with.
+        """
+        return {asset: period for asset, period in self._refs}
+
+    def keys(self):
+        """Method to get every subscribed stream.
+
+        :returns: A list of ``(asset, period)`` pairs.
+        """
+        return list(self._refs)
+
+    def acquire(self, asset, period=0, owner=None):
+        """Method to take a reference on a stream, subscribing if needed.
+
+        :param str asset: The asset.
+        :param int period: The candle period in seconds.
+        :param owner: (optional) Who holds the reference; None is the user.
+        """
+        key = (asset, period)
+        timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+        if key not in self._refs:
+            followed = self._followed(asset)
+            self._refs[key] = {}
+            self._subscribe(asset, period, follow=not followed)
+        owners = self._refs[key]
+        owners[owner] = owners.get(owner, 0) + 1
+
+    def ensure(self, asset, period=0):
+        """Method to subscribe a stream for a one-off request.
+
+        Nothing is sent if the stream is already open. No reference is
+        taken: a stream nobody holds lingers from the last request, and
+        is unsubscribed after ``linger`` idle seconds.
+        """
+        key = (asset, period)
+        if key not in self._refs:
+            followed = self._followed(asset)
+            self._refs[key] = {}
+            self._subscribe(asset, period, follow=not followed)
+        if not self._refs[key]:
+            # Without a loop to expire it, the stream stays until released
+            self._linger(key, drop=False)
+
+    def release(self, asset, period=0, owner=None):
+        """Method to drop a reference on a stream.
+
+        The stream is unsubscribed after ``linger`` seconds without
+        references, or right away when no event loop is running.
+        """
+        key = (asset, period)
+        owners = self._refs.get(key)
+        if not owners or not owners.get(owner):
+            return
+        owners[owner] -= 1
+        if owners[owner]:
+            return
+        del owners[owner]
+        if not owners:
+            self._linger(key)
+
+    def stop(self, asset, owner=None):
+        """Method to release every reference an owner holds on the streams of an asset.
+
+        Streams other owners still hold stay subscribed.
+        """
+        for key in [key for key in self._refs if key[0] == asset]:
+            if self._refs[key].get(owner):
+                self._refs[key][owner] = 1
+                self.release(*key, owner=owner)
+
+    @contextmanager
+    def stream(self, asset, period=0, owner=None):
+        """Hold a stream for the duration of a ``with`` block."""
+        self.acquire(asset, period, owner)
+        try:
+            yield
+        finally:
+            self.release(asset, period, owner)
+
+    def replay(self):
+        """Method to send the subscribe frames of every stream again, e.g. after a reconnect."""
+        followed = set()
+        for asset, period in list(self._refs):
+            self._subscribe(asset, period, follow=asset not in followed)
+            followed.add(asset)
+
+    def close(self):
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        self._refs.clear()
+
+    def _linger(self, key, drop=True):
+        timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None or not self.linger:
+            if drop:
+                self._drop(key)
+        else:
+            self._timers[key] = loop.call_later(self.linger, self._drop, key)
+
+    def _followed(self, asset):
+        return any(stream == asset for stream, _ in self._refs)
+
+    def _subscribe(self, asset, period, follow):
+        api = self.client.api
+        api.subscribe_realtime_candle(asset, period)
+        if follow:
+            api.chart_notification(asset)
+            api.follow_candle(asset)
+
+    def _drop(self, key):
+        self._timers.pop(key, None)
+        if self._refs.get(key) != {}:
+            return
+        del self._refs[key]
+        asset = key[0]
+        if self._followed(asset):
+            return
+        logger.debug(f"Unsubscribing {asset} stream.")
+        api = self.client.api
+        if api is None:
+            return
+        # Runs from a loop timer: the socket may be gone by now
+        try:
+            api.unsubscribe_realtime_candle(asset)
+            api.unfollow_candle(asset)
+        except Exception as e:
+            logger.warning(f"Could not unsubscribe {asset} stream: {e}")
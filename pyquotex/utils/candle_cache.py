@@ -0,0 +1,146 @@
+"""Module for the Quotex candle history cache."""
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+
+# Rough size of one candle dict with its keys and float values
+CANDLE_BYTES = 400
+
+
+class CandleSeries(object):
+    """Class for the cached candles of one (asset, period)."""
+
+    def __init__(self):
+        self.candles = []
+        self.times = []
+        self.start = None
+        self.fetched_until = None
+
+    @property
+    def last_time(self):
+        return self.times[-1] if self.times else None
+
+    def merge(self, candles, start=None, end=None):
+        """Method to merge fetched candles, replacing the range they cover.
+
+        :param list candles: Candles sorted by time.
+        :param start: (optional) Earliest time the fetch covered.
+        :param end: (optional) Latest time the fetch covered.
+        """
+        if end is not None:
+            self.fetched_until = end if self.fetched_until is None else max(self.fetched_until, end)
+        if candles:
+            first, last = candles[0]["time"], candles[-1]["time"]
+            left = bisect_left(self.times, first)
+            right = bisect_right(self.times, last)
+            self.candles[left:right] = candles
+            self.times[left:right] = [candle["time"] for candle in candles]
+            start = first if start is None else min(start, first)
+        if start is not None:
+            self.start = start if self.start is None else min(self.start, start)
+
+    def covers(self, start):
+        return self.start is not None and self.start <= start
+
+    def slice(self, start, end):
+        """Method to get the cached candles between two times.
+
+        :returns: The candles with start <= time <= end.
+        """
+        return self.candles[bisect_left(self.times, start):bisect_right(self.times, end)]
+
+
+class CandleCache(object):
+    """Class for a per-(asset, period) candle history cache.
+
+    Series are kept in least recently used order and the oldest are
+    evicted when the estimated size goes over ``max_bytes``. Gaps the
+    server had no candles for, e.g. market closures, are remembered so
+    they are not requested again.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, refresh_interval=1.0):
+        """
+        :param max_bytes: Memory cap for all cached candles.
+        :param refresh_interval: Seconds a fetched tail is served from
+            memory before the still-open candle is requested again.
+        """
+        self.max_bytes = max_bytes
+        self.refresh_interval = refresh_interval
+        self.hits = 0
+        self.misses = 0
+        self.__series = OrderedDict()
+        self.__size = 0
+        self.__empty = {}
+
+    @property
+    def size(self):
+        """Property to get the estimated memory used by the cache.
+
+        :returns: The size in bytes.
+        """
+        return self.__size
+
+    def __len__(self):
+        return len(self.__series)
+
+    def get(self, asset, period):
+        """Method to get the cached series and mark it as recently used.
+
+        :returns: The :class:`CandleSeries`, or None.
+        """
+        series = self.__series.get((asset, period))
+        if series is not None:
+            self.__series.move_to_end((asset, period))
+        return series
+
+    def store(self, asset, period, candles, start=None, end=None):
+        """Method to merge fetched candles into the cache.
+
+        :param str asset: The asset name.
+        :param int period: The candle period in seconds.
+        :param list candles: Candles sorted by time.
+        :param start: (optional) Earliest time the fetch covered.
+        :param end: (optional) Latest time the fetch covered.
+        :returns: The :class:`CandleSeries`.
+        """
+        key = (asset, period)
+        series = self.__series.get(key)
+        if series is None:
+            series = self.__series[key] = CandleSeries()
+        self.__series.move_to_end(key)
+        before = len(series.candles)
+        series.merge(candles, start, end)
+        self.__size += (len(series.candles) - before) * CANDLE_BYTES
+        self._evict(keep=key)
+        return series
+
+    def mark_empty(self, asset, period, gap_start, gap_end):
+        """Method to remember a range the server returned no candles for."""
+        self.__empty.setdefault((asset, period), set()).add((gap_start, gap_end))
+
+    def known_empty(self, asset, period, gap_start, gap_end):
+        """Method to check whether a gap lies inside a range known to be empty."""
+        return any(
+            start <= gap_start and gap_end <= end
+            for start, end in self.__empty.get((asset, period), ())
+        )
+
+    def invalidate(self, asset=None, period=None):
+        """Method to drop cached series.
+
+        :param str asset: (optional) Only drop this asset.
+        :param int period: (optional) Only drop this period.
+        """
+        for key in list(self.__series):
+            if (asset is None or key[0] == asset) and (period is None or key[1] == period):
+                self.__size -= len(self.__series.pop(key).candles) * CANDLE_BYTES
+        for key in list(self.__empty):
+            if (asset is None or key[0] == asset) and (period is None or key[1] == period):
+                del self.__empty[key]
+
+    def _evict(self, keep=None):
+        while self.__size > self.max_bytes and len(self.__series) > 1:
+            key = next(iter(self.__series))
+            if key == keep:
+                break
+            self.__size -= len(self.__series.pop(key).candles) * CANDLE_BYTES
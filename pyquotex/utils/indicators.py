@@ -1,19 +1,396 @@
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from typing import List, Dict, Union, Tuple
 
+# Mayor exponente de decaimiento por bloque, lejos del desbordamiento de float64
+MAX_DECAY_EXPONENT = 460.0
+
+
+def linear_filter(values, alpha: float, seed) -> np.ndarray:
+    """Filtro recursivo y[i] = alpha * x[i] + (1 - alpha) * y[i - 1] sobre el último eje.
+
+    Se resuelve en forma cerrada con sumas acumuladas por bloques, sin bucle
+    por elemento: y[n] = d^n * (y[-1] + alpha * sum(x[k] / d^k)), con d = 1 - alpha.
+    Los bloques se cortan antes de que d^-k desborde; el error queda acotado
+    al de un float64 sobre la magnitud de los datos.
+
+    Args:
+        values: Serie (o matriz de series) en float64.
+        alpha: Factor de suavizado en (0, 1].
+        seed: Valor previo al primer elemento (escalar o uno por serie).
+
+    Returns:
+        np.ndarray: La serie filtrada, sin redondear.
+    """
+    x = np.asarray(values, dtype=np.float64)
+    out = np.empty_like(x)
+    decay = 1.0 - alpha
+    if decay <= 0.0:
+        out[...] = x
+        return out
+    n = x.shape[-1]
+    if n == 0:
+        return out
+
+    chunk = max(1, int(MAX_DECAY_EXPONENT / -np.log(decay)))
+    powers = decay ** np.arange(1, min(chunk, n) + 1, dtype=np.float64)
+    previous = np.asarray(seed, dtype=np.float64)[..., np.newaxis]
+    for start in range(0, n, chunk):
+        block = x[..., start:start + chunk]
+        scale = powers[:block.shape[-1]]
+        result = scale * (previous + alpha * np.cumsum(block / scale, axis=-1))
+        out[..., start:start + block.shape[-1]] = result
+        previous = result[..., -1:]
+    return out
+
+
+def ema(values, period: int) -> np.ndarray:
+    """EMA sembrada con la media simple de los primeros `period` valores.
+
+    Returns:
+        np.ndarray: len(values) - period + 1 valores, o vacío si no alcanzan.
+    """
+    x = np.asarray(values, dtype=np.float64)
+    if x.shape[-1] < period:
+        return np.empty(x.shape[:-1] + (0,))
+    seed = x[..., :period].mean(axis=-1)
+    smoothed = linear_filter(x[..., period:], 2.0 / (period + 1), seed)
+    return np.concatenate((seed[..., np.newaxis], smoothed), axis=-1)
+
+
+def wilder(values, period: int) -> np.ndarray:
+    """Suavizado de Wilder (RMA) sembrado con la media de los primeros `period` valores.
+
+    Returns:
+        np.ndarray: len(values) - period + 1 valores, o vacío si no alcanzan.
+    """
+    x = np.asarray(values, dtype=np.float64)
+    if x.shape[-1] < period:
+        return np.empty(x.shape[:-1] + (0,))
+    seed = x[..., :period].mean(axis=-1)
+    smoothed = linear_filter(x[..., period:], 1.0 / period, seed)
+    return np.concatenate((seed[..., np.newaxis], smoothed), axis=-1)
+
+
+def true_range(highs, lows, closes) -> np.ndarray:
+    """True Range desde la segunda vela (necesita el cierre anterior)."""
+    high = np.asarray(highs, dtype=np.float64)[..., 1:]
+    low = np.asarray(lows, dtype=np.float64)[..., 1:]
+    prev_close = np.asarray(closes, dtype=np.float64)[..., :-1]
+    return np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+
+
+class SeriesContext:
+    """Arrays de un conjunto de velas (o matriz activos × tiempo) y sus cálculos intermedios.
+
+    Los intermedios (EMAs, SMAs, True Range, suavizados de Wilder, máximos y
+    mínimos móviles) se guardan por parámetros, así que varios indicadores
+    evaluados sobre el mismo contexto los calculan una sola vez.
+    """
+
+    def __init__(self, closes, highs=None, lows=None):
+        self.closes = np.asarray(closes, dtype=np.float64)
+        self.highs = None if highs is None else np.asarray(highs, dtype=np.float64)
+        self.lows = None if lows is None else np.asarray(lows, dtype=np.float64)
+        self.cache = {}
+
+    @property
+    def length(self) -> int:
+        return self.closes.shape[-1]
+
+    def memo(self, key, compute):
+        if key not in self.cache:
+            self.cache[key] = compute()
+        return self.cache[key]
+
+    def windows(self, period: int) -> np.ndarray:
+        return self.memo(("windows", period), lambda: sliding_window_view(self.closes, period, axis=-1))
+
+    def sma(self, period: int) -> np.ndarray:
+        return self.memo(("sma", period), lambda: self.windows(period).mean(axis=-1))
+
+    def ema(self, period: int) -> np.ndarray:
+        return self.memo(("ema", period), lambda: ema(self.closes, period))
+
+    def deltas(self) -> np.ndarray:
+        return self.memo(("deltas",), lambda: np.diff(self.closes, axis=-1))
+
+    def true_range(self) -> np.ndarray:
+        return self.memo(("true_range",), lambda: true_range(self.highs, self.lows, self.closes))
+
+    def atr(self, period: int) -> np.ndarray:
+        return self.memo(("atr", period), lambda: wilder(self.true_range(), period))
+
+    def highest(self, period: int) -> np.ndarray:
+        return self.memo(("highest", period),
+                         lambda: sliding_window_view(self.highs, period, axis=-1).max(axis=-1))
+
+    def lowest(self, period: int) -> np.ndarray:
+        return self.memo(("lowest", period),
+                         lambda: sliding_window_view(self.lows, period, axis=-1).min(axis=-1))
+
+
+class Indicator:
+    """Entrada del registro: función de cálculo, líneas, parámetros por defecto e historia mínima."""
+
+    def __init__(self, name: str, func, lines: Tuple[str, ...], defaults: Dict, min_length):
+        self.name = name
+        self.func = func
+        self.lines = lines
+        self.defaults = defaults
+        self.min_length = min_length
+
+    @property
+    def primary(self) -> str:
+        return self.lines[0]
+
+    def resolve(self, params: Dict = None) -> Dict:
+        """Parámetros por defecto completados con los dados; se ignoran los desconocidos."""
+        return dict(self.defaults, **{k: v for k, v in (params or {}).items() if k in self.defaults})
+
+    def required_length(self, params: Dict = None) -> int:
+        return self.min_length(self.resolve(params))
+
+    def evaluate(self, context: SeriesContext, params: Dict = None) -> Dict[str, np.ndarray]:
+        """Calcula el indicador; con historia insuficiente devuelve líneas vacías."""
+        params = self.resolve(params)
+        if context.length < self.min_length(params):
+            empty = np.empty(context.closes.shape[:-1] + (0,))
+            return {line: empty for line in self.lines}
+        return self.func(context, **params)
+
+
+INDICATORS: Dict[str, Indicator] = {}
+
+
+def register(name: str, lines: Tuple[str, ...], defaults: Dict, min_length):
+    """Registra una función de indicador bajo `name` (en mayúsculas)."""
+
+    def decorator(func):
+        INDICATORS[name] = Indicator(name, func, lines, defaults, min_length)
+        return func
+
+    return decorator
+
+
+def get_indicator(name: str) -> Indicator:
+    indicator = INDICATORS.get(name.upper())
+    if indicator is None:
+        raise ValueError(f"Indicador '{name.upper()}' no soportado")
+    return indicator
+
+
+@register("SMA", ("sma",), {"period": 20}, lambda p: p["period"])
+def _sma(context: SeriesContext, period: int) -> Dict[str, np.ndarray]:
+    return {"sma": context.sma(period)}
+
+
+@register("EMA", ("ema",), {"period": 20}, lambda p: p["period"])
+def _ema(context: SeriesContext, period: int) -> Dict[str, np.ndarray]:
+    return {"ema": context.ema(period)}
+
+
+@register("RSI", ("rsi",), {"period": 14}, lambda p: p["period"] + 1)
+def _rsi(context: SeriesContext, period: int) -> Dict[str, np.ndarray]:
+    deltas = context.deltas()
+    avg_gain = wilder(np.maximum(deltas, 0.0), period)
+    avg_loss = wilder(np.maximum(-deltas, 0.0), period)
+    rs = avg_gain / np.where(avg_loss == 0, 0.00001, avg_loss)
+    return {"rsi": 100 - (100 / (1 + rs))}
+
+
+@register("MACD", ("macd", "signal", "histogram"),
+          {"fast_period": 12, "slow_period": 26, "signal_period": 9}, lambda p: p["slow_period"])
+def _macd(context: SeriesContext, fast_period: int, slow_period: int, signal_period: int) -> Dict[str, np.ndarray]:
+    fast_ema = context.ema(fast_period)
+    slow_ema = context.ema(slow_period)
+    macd_line = fast_ema[..., fast_ema.shape[-1] - slow_ema.shape[-1]:] - slow_ema
+    signal_line = ema(macd_line, signal_period)
+    histogram = macd_line[..., macd_line.shape[-1] - signal_line.shape[-1]:] - signal_line
+    return {"macd": macd_line, "signal": signal_line, "histogram": histogram}
+
+
+@register("BOLLINGER", ("middle", "upper", "lower"), {"period": 20, "std": 2}, lambda p: p["period"])
+def _bollinger(context: SeriesContext, period: int, std: float) -> Dict[str, np.ndarray]:
+    middle = context.sma(period)
+    deviation = context.windows(period).std(axis=-1)
+    return {"upper": middle + deviation * std, "middle": middle, "lower": middle - deviation * std}
+
+
+@register("STOCHASTIC", ("k", "d"), {"k_period": 14, "d_period": 3}, lambda p: p["k_period"])
+def _stochastic(context: SeriesContext, k_period: int, d_period: int) -> Dict[str, np.ndarray]:
+    close = context.closes[..., k_period - 1:]
+    window_low = context.lowest(k_period)
+    spread = context.highest(k_period) - window_low
+    k_values = np.full(spread.shape, 100.0)
+    np.divide((close - window_low) * 100, spread, out=k_values, where=spread != 0)
+    if k_values.shape[-1] < d_period:
+        return {"k": k_values, "d": np.empty(k_values.shape[:-1] + (0,))}
+    return {"k": k_values, "d": sma(k_values, d_period)}
+
+
+@register("ATR", ("atr",), {"period": 14}, lambda p: p["period"] + 1)
+def _atr(context: SeriesContext, period: int) -> Dict[str, np.ndarray]:
+    return {"atr": context.atr(period)}
+
+
+@register("ADX", ("adx", "plus_di", "minus_di"), {"period": 14}, lambda p: p["period"] + 1)
+def _adx(context: SeriesContext, period: int) -> Dict[str, np.ndarray]:
+    # Movimientos direccionales
+    up_move = np.diff(context.highs, axis=-1)
+    down_move = -np.diff(context.lows, axis=-1)
+    plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+    minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+
+    # Promedios de Wilder; el cociente DM/TR no depende de usar suma o media
+    tr_avg = context.atr(period)
+    safe_tr = np.where(tr_avg == 0, np.inf, tr_avg)
+    plus_di = 100 * wilder(plus_dm, period) / safe_tr
+    minus_di = 100 * wilder(minus_dm, period) / safe_tr
+
+    # DX y ADX
+    di_sum = plus_di + minus_di
+    dx = np.zeros_like(di_sum)
+    np.divide(100 * np.abs(plus_di - minus_di), di_sum, out=dx, where=di_sum != 0)
+    return {"adx": wilder(dx, period), "plus_di": plus_di, "minus_di": minus_di}
+
+
+@register("ICHIMOKU", ("tenkan", "kijun", "senkou_a", "senkou_b", "chikou"),
+          {"tenkan_period": 9, "kijun_period": 26, "senkou_b_period": 52}, lambda p: p["senkou_b_period"])
+def _ichimoku(context: SeriesContext, tenkan_period: int, kijun_period: int,
+              senkou_b_period: int) -> Dict[str, np.ndarray]:
+    def donchian(period: int) -> np.ndarray:
+        return (context.highest(period) + context.lowest(period)) / 2
+
+    tenkan = donchian(tenkan_period)
+    kijun = donchian(kijun_period)
+    size = min(tenkan.shape[-1], kijun.shape[-1])
+    return {
+        "tenkan": tenkan,
+        "kijun": kijun,
+        # Senkou Span A (Promedio de Tenkan y Kijun)
+        "senkou_a": (tenkan[..., :size] + kijun[..., :size]) / 2,
+        "senkou_b": donchian(senkou_b_period),
+        # Chikou Span (Precio de cierre desplazado 26 períodos hacia atrás)
+        "chikou": context.lows[..., kijun_period:]
+    }
+
+
+def spec_label(name: str, params: Dict) -> str:
+    """Nombre con el que se devuelve una especificación, p. ej. EMA_50."""
+    if not params:
+        return name.upper()
+    return "_".join([name.upper()] + [str(value) for value in params.values()])
+
+
+def normalize_specs(specs) -> List[Tuple[str, str, Dict]]:
+    """Acepta "RSI", ("EMA", {"period": 50}) o {"name": "MACD", "label": ..., ...}.
+
+    Las tuplas (etiqueta, nombre, parámetros) ya normalizadas se devuelven tal cual.
+
+    Returns:
+        List[Tuple]: (etiqueta, nombre, parámetros) por especificación.
+    """
+    normalized = []
+    for spec in specs:
+        if isinstance(spec, str):
+            name, params, label = spec, {}, None
+        elif isinstance(spec, dict):
+            params = dict(spec)
+            name = params.pop("name")
+            label = params.pop("label", None)
+        elif len(spec) == 3:
+            label, name, params = spec
+        else:
+            name, params = spec
+            params, label = dict(params or {}), None
+        get_indicator(name)
+        normalized.append((label or spec_label(name, params), name.upper(), params))
+    return normalized
+
+
+def evaluate_indicators(specs, closes, highs=None, lows=None) -> Dict[str, Dict[str, np.ndarray]]:
+    """Evalúa varias especificaciones sobre los mismos arrays, compartiendo intermedios.
+
+    Returns:
+        Dict: Por etiqueta, un array por línea del indicador.
+    """
+    context = SeriesContext(closes, highs, lows)
+    return {
+        label: get_indicator(name).evaluate(context, params)
+        for label, name, params in normalize_specs(specs)
+    }
+
+
+def sma(values, period: int) -> np.ndarray:
+    """Media móvil simple sobre el último eje."""
+    return sliding_window_view(np.asarray(values, dtype=np.float64), period, axis=-1).mean(axis=-1)
+
+
+def rsi(closes, period: int = 14) -> np.ndarray:
+    """RSI de Wilder sobre el último eje."""
+    return _rsi(SeriesContext(closes), period)["rsi"]
+
+
+def macd(closes, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> Dict[str, np.ndarray]:
+    """Líneas MACD, señal e histograma sobre el último eje."""
+    return _macd(SeriesContext(closes), fast_period, slow_period, signal_period)
+
+
+def bollinger_bands(closes, period: int = 20, num_std: float = 2) -> Dict[str, np.ndarray]:
+    """Bandas de Bollinger (desviación poblacional) sobre el último eje."""
+    return _bollinger(SeriesContext(closes), period, num_std)
+
+
+def stochastic(closes, highs, lows, k_period: int = 14, d_period: int = 3) -> Dict[str, np.ndarray]:
+    """Oscilador estocástico %K y %D sobre el último eje."""
+    return _stochastic(SeriesContext(closes, highs, lows), k_period, d_period)
+
+
+def atr(highs, lows, closes, period: int = 14) -> np.ndarray:
+    """Average True Range de Wilder sobre el último eje."""
+    return _atr(SeriesContext(closes, highs, lows), period)["atr"]
+
+
+def adx(highs, lows, closes, period: int = 14) -> Dict[str, np.ndarray]:
+    """ADX, +DI y -DI de Wilder sobre el último eje."""
+    return _adx(SeriesContext(closes, highs, lows), period)
+
+
+def ichimoku(highs, lows, tenkan_period: int = 9, kijun_period: int = 26,
+             senkou_b_period: int = 52) -> Dict[str, np.ndarray]:
+    """Líneas de Ichimoku sobre el último eje."""
+    return _ichimoku(SeriesContext(lows, highs, lows), tenkan_period, kijun_period, senkou_b_period)
+
+
+def _current(lines: Dict[str, list]) -> Dict[str, float]:
+    return {name: values[-1] if values else None for name, values in lines.items()}
+
 
 class TechnicalIndicators:
+    @staticmethod
+    def round_values(values, decimals: int = 2):
+        """Redondea para presentación una lista, array o dict de resultados.
+
+        Los cálculos devuelven valores sin redondear; usar solo al mostrar.
+        """
+        if isinstance(values, dict):
+            return {key: TechnicalIndicators.round_values(value, decimals) for key, value in values.items()}
+        if isinstance(values, np.ndarray):
+            return np.round(values, decimals)
+        if isinstance(values, (list, tuple)):
+            return [TechnicalIndicators.round_values(value, decimals) for value in values]
+        if isinstance(values, float):
+            return round(values, decimals)
+        return values
+
     @staticmethod
     def calculate_sma(prices: List[float], period: int) -> List[float]:
         """Calcula la Media Móvil Simple (SMA)"""
         if len(prices) < period:
             return []
 
-        sma_values = []
-        for i in range(len(prices) - period + 1):
-            sma = sum(prices[i:(i + period)]) / period
-            sma_values.append(round(sma, 2))
-        return sma_values
+        return sma(prices, period).tolist()
 
     @staticmethod
     def calculate_ema(prices: List[float], period: int) -> List[float]:
@@ -21,13 +398,7 @@ class TechnicalIndicators:
         if len(prices) < period:
             return []
 
-        multiplier = 2 / (period + 1)
-        ema_values = [sum(prices[:period]) / period]
-
-        for price in prices[period:]:
-            ema = (price * multiplier) + (ema_values[-1] * (1 - multiplier))
-            ema_values.append(round(ema, 2))
-        return ema_values
+        return ema(prices, period).tolist()
 
     @staticmethod
     def calculate_rsi(prices: List[float], period: int = 14) -> List[float]:
@@ -35,20 +406,7 @@ class TechnicalIndicators:
         if len(prices) < period + 1:
             return []
 
-        deltas = np.diff(prices)
-        gain = np.where(deltas > 0, deltas, 0)
-        loss = np.where(deltas < 0, -deltas, 0)
-
-        avg_gain = np.concatenate(([np.mean(gain[:period])], gain[period:]))
-        avg_loss = np.concatenate(([np.mean(loss[:period])], loss[period:]))
-
-        for i in range(1, len(avg_gain)):
-            avg_gain[i] = (avg_gain[i - 1] * (period - 1) + gain[period + i - 1]) / period
-            avg_loss[i] = (avg_loss[i - 1] * (period - 1) + loss[period + i - 1]) / period
-
-        rs = avg_gain / np.where(avg_loss == 0, 0.00001, avg_loss)
-        rsi = 100 - (100 / (1 + rs))
-        return [round(x, 2) for x in rsi.tolist()]
+        return rsi(prices, period).tolist()
 
     @staticmethod
     def calculate_macd(prices: List[float], fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> \
@@ -57,31 +415,9 @@ class TechnicalIndicators:
         if len(prices) < slow_period:
             return {"macd": [], "signal": [], "histogram": []}
 
-        fast_ema = TechnicalIndicators.calculate_ema(prices, fast_period)
-        slow_ema = TechnicalIndicators.calculate_ema(prices, slow_period)
-
-        macd_line = []
-        for i in range(len(slow_ema)):
-            macd = fast_ema[i + (len(fast_ema) - len(slow_ema))] - slow_ema[i]
-            macd_line.append(round(macd, 2))
-
-        signal_line = TechnicalIndicators.calculate_ema(macd_line, signal_period)
-
-        histogram = []
-        for i in range(len(signal_line)):
-            hist = macd_line[i + (len(macd_line) - len(signal_line))] - signal_line[i]
-            histogram.append(round(hist, 2))
-
-        return {
-            "macd": macd_line,
-            "signal": signal_line,
-            "histogram": histogram,
-            "current": {
-                "macd": macd_line[-1] if macd_line else None,
-                "signal": signal_line[-1] if signal_line else None,
-                "histogram": histogram[-1] if histogram else None
-            }
-        }
+        lines = {name: values.tolist() for name, values in
+                 macd(prices, fast_period, slow_period, signal_period).items()}
+        return dict(lines, current=_current(lines))
 
     @staticmethod
     def calculate_bollinger_bands(prices: List[float], period: int = 20, num_std: float = 2) -> Dict[str, List[float]]:
@@ -89,26 +425,8 @@ class TechnicalIndicators:
         if len(prices) < period:
             return {"upper": [], "middle": [], "lower": []}
 
-        sma = TechnicalIndicators.calculate_sma(prices, period)
-        std = []
-
-        for i in range(len(prices) - period + 1):
-            window = prices[i:(i + period)]
-            std.append(np.std(window))
-
-        upper_band = [sma[i] + (std[i] * num_std) for i in range(len(sma))]
-        lower_band = [sma[i] - (std[i] * num_std) for i in range(len(sma))]
-
-        return {
-            "upper": [round(x, 2) for x in upper_band],
-            "middle": [round(x, 2) for x in sma],
-            "lower": [round(x, 2) for x in lower_band],
-            "current": {
-                "upper": upper_band[-1] if upper_band else None,
-                "middle": sma[-1] if sma else None,
-                "lower": lower_band[-1] if lower_band else None
-            }
-        }
+        lines = {name: values.tolist() for name, values in bollinger_bands(prices, period, num_std).items()}
+        return dict(lines, current=_current(lines))
 
     @staticmethod
     def calculate_stochastic(prices: List[float], highs: List[float], lows: List[float], k_period: int = 14,
@@ -117,127 +435,27 @@ class TechnicalIndicators:
         if len(prices) < k_period:
             return {"k": [], "d": []}
 
-        k_values = []
-
-        for i in range(len(prices) - k_period + 1):
-            window_high = max(highs[i:i + k_period])
-            window_low = min(lows[i:i + k_period])
-
-            if window_high == window_low:
-                k = 100
-            else:
-                k = ((prices[i + k_period - 1] - window_low) / (window_high - window_low)) * 100
-            k_values.append(round(k, 2))
-
-        d_values = TechnicalIndicators.calculate_sma(k_values, d_period)
-
-        return {
-            "k": k_values,
-            "d": d_values,
-            "current": {
-                "k": k_values[-1] if k_values else None,
-                "d": d_values[-1] if d_values else None
-            }
-        }
+        lines = {name: values.tolist() for name, values in
+                 stochastic(prices, highs, lows, k_period, d_period).items()}
+        return dict(lines, current=_current(lines))
 
     @staticmethod
     def calculate_atr(highs: List[float], lows: List[float], closes: List[float], period: int = 14) -> List[float]:
         """Calcula el Average True Range (ATR)"""
-        if len(highs) < period:
+        if len(highs) < period + 1:
             return []
 
-        true_ranges = []
-        for i in range(1, len(highs)):
-            high = highs[i]
-            low = lows[i]
-            prev_close = closes[i - 1]
-
-            tr1 = high - low
-            tr2 = abs(high - prev_close)
-            tr3 = abs(low - prev_close)
-
-            true_range = max(tr1, tr2, tr3)
-            true_ranges.append(true_range)
-
-        atr_values = [sum(true_ranges[:period]) / period]
-
-        for i in range(period, len(true_ranges)):
-            atr = (atr_values[-1] * (period - 1) + true_ranges[i]) / period
-            atr_values.append(round(atr, 2))
-
-        return atr_values
+        return atr(highs, lows, closes, period).tolist()
 
     @staticmethod
     def calculate_adx(highs: List[float], lows: List[float], closes: List[float], period: int = 14) -> Dict[
         str, List[float]]:
-        """Calcula el Average Directional Index (ADX)"""
+        """Calcula el Average Directional Index (ADX) de Wilder"""
         if len(highs) < period + 1:
             return {"adx": [], "plus_di": [], "minus_di": []}
 
-        # Calcular True Range
-        tr = []
-        plus_dm = []
-        minus_dm = []
-
-        for i in range(1, len(highs)):
-            high = highs[i]
-            low = lows[i]
-            prev_high = highs[i - 1]
-            prev_low = lows[i - 1]
-            prev_close = closes[i - 1]
-
-            tr1 = high - low
-            tr2 = abs(high - prev_close)
-            tr3 = abs(low - prev_close)
-            tr.append(max(tr1, tr2, tr3))
-
-            plus_dm1 = high - prev_high
-            minus_dm1 = prev_low - low
-
-            if plus_dm1 > minus_dm1 and plus_dm1 > 0:
-                plus_dm.append(plus_dm1)
-            else:
-                plus_dm.append(0)
-
-            if minus_dm1 > plus_dm1 and minus_dm1 > 0:
-                minus_dm.append(minus_dm1)
-            else:
-                minus_dm.append(0)
-
-        # Calcular los promedios
-        tr_avg = [sum(tr[:period]) / period]
-        plus_di_avg = [sum(plus_dm[:period]) / period * 100 / tr_avg[0]]
-        minus_di_avg = [sum(minus_dm[:period]) / period * 100 / tr_avg[0]]
-
-        for i in range(period, len(tr)):
-            tr_avg.append((tr_avg[-1] * (period - 1) + tr[i]) / period)
-            plus_di = (plus_di_avg[-1] * (period - 1) + plus_dm[i]) / period
-            minus_di = (minus_di_avg[-1] * (period - 1) + minus_dm[i]) / period
-
-            plus_di_avg.append(plus_di * 100 / tr_avg[-1])
-            minus_di_avg.append(minus_di * 100 / tr_avg[-1])
-
-        # Calcular ADX
-        dx_values = []
-        for i in range(len(plus_di_avg)):
-            dx = abs(plus_di_avg[i] - minus_di_avg[i]) / (plus_di_avg[i] + minus_di_avg[i]) * 100
-            dx_values.append(dx)
-
-        adx_values = [sum(dx_values[:period]) / period]
-        for i in range(period, len(dx_values)):
-            adx = (adx_values[-1] * (period - 1) + dx_values[i]) / period
-            adx_values.append(round(adx, 2))
-
-        return {
-            "adx": adx_values,
-            "plus_di": [round(x, 2) for x in plus_di_avg],
-            "minus_di": [round(x, 2) for x in minus_di_avg],
-            "current": {
-                "adx": adx_values[-1] if adx_values else None,
-                "plus_di": plus_di_avg[-1] if plus_di_avg else None,
-                "minus_di": minus_di_avg[-1] if minus_di_avg else None
-            }
-        }
+        lines = {name: values.tolist() for name, values in adx(highs, lows, closes, period).items()}
+        return dict(lines, current=_current(lines))
 
     @staticmethod
     def calculate_ichimoku(highs: List[float], lows: List[float],
@@ -254,38 +472,94 @@ class TechnicalIndicators:
                 "chikou": []
             }
 
-        def donchian(high_prices: List[float], low_prices: List[float], period: int) -> List[float]:
-            result = []
-            for i in range(len(high_prices) - period + 1):
-                highest = max(high_prices[i:i + period])
-                lowest = min(low_prices[i:i + period])
-                result.append((highest + lowest) / 2)
-            return result
+        lines = {name: values.tolist() for name, values in
+                 ichimoku(highs, lows, tenkan_period, kijun_period, senkou_b_period).items()}
+        return dict(lines, current=_current(lines))
 
-        # Cálculo de las líneas
-        tenkan = donchian(highs, lows, tenkan_period)
-        kijun = donchian(highs, lows, kijun_period)
-        senkou_b = donchian(highs, lows, senkou_b_period)
+    @staticmethod
+    def calculate_many(specs, prices: List[float], highs: List[float] = None,
+                       lows: List[float] = None) -> Dict[str, Union[List[float], Dict]]:
+        """Calcula varios indicadores sobre las mismas velas de una vez
+
+        Los arrays se construyen una sola vez y los intermedios comunes (por
+        ejemplo las EMAs del MACD y de una EMA del mismo período) se reutilizan.
+
+        Args:
+            specs: Lista de "RSI", ("EMA", {"period": 50}) o {"name": "MACD", "label": "macd_rapido", ...}
+
+        Returns:
+            Dict: Por etiqueta, la lista de valores para indicadores de una línea
+            o el dict de líneas con "current" como en los métodos calculate_*.
+        """
+        results = {}
+        for label, lines in evaluate_indicators(specs, prices, highs, lows).items():
+            lines = {name: values.tolist() for name, values in lines.items()}
+            if len(lines) == 1:
+                results[label] = next(iter(lines.values()))
+            else:
+                results[label] = dict(lines, current=_current(lines))
+        return results
 
-        # Senkou Span A (Promedio de Tenkan y Kijun)
-        senkou_a = []
-        for i in range(min(len(tenkan), len(kijun))):
-            senkou_a.append((tenkan[i] + kijun[i]) / 2)
 
-        # Chikou Span (Precio de cierre desplazado 26 períodos hacia atrás)
-        chikou = lows[kijun_period:]
+class BatchIndicators:
+    """Indicadores para una matriz activos × tiempo en una sola pasada por el eje 1.
+
+    Cada fila es un activo y cada columna una vela, alineadas entre sí; los
+    resultados son matrices con una fila por activo.
+    """
 
+    @staticmethod
+    def align(candles: Dict[str, List[dict]], length: int = None) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+        """Construye las matrices de cierres, máximos y mínimos.
+
+        Se usan las últimas `length` velas de cada activo (por defecto las del
+        activo con menos historia); los activos sin velas suficientes se omiten.
+
+        Returns:
+            Tuple: (activos, cierres, máximos, mínimos).
+        """
+        candles = {asset: data for asset, data in candles.items() if data}
+        if not candles:
+            empty = np.empty((0, 0))
+            return [], empty, empty, empty
+        if length is None:
+            length = min(len(data) for data in candles.values())
+
+        assets = [asset for asset, data in candles.items() if len(data) >= length]
+        closes = np.empty((len(assets), length))
+        highs = np.empty((len(assets), length))
+        lows = np.empty((len(assets), length))
+        for row, asset in enumerate(assets):
+            window = candles[asset][len(candles[asset]) - length:]
+            closes[row] = [candle["close"] for candle in window]
+            highs[row] = [candle["high"] for candle in window]
+            lows[row] = [candle["low"] for candle in window]
+        return assets, closes, highs, lows
+
+    @staticmethod
+    def calculate(indicator: str, closes, highs=None, lows=None, **params) -> Dict[str, np.ndarray]:
+        """Calcula un indicador para todas las filas.
+
+        Args:
+            indicator: RSI, SMA, EMA, MACD, BOLLINGER, STOCHASTIC, ATR, ADX o ICHIMOKU.
+            closes, highs, lows: Matrices activos × tiempo.
+            params: Los mismos parámetros que `Quotex.calculate_indicator`.
+
+        Returns:
+            Dict[str, np.ndarray]: Una matriz por línea del indicador.
+        """
+        return get_indicator(indicator).evaluate(SeriesContext(closes, highs, lows), params)
+
+    @staticmethod
+    def latest(indicator: str, closes, highs=None, lows=None, **params) -> Dict[str, np.ndarray]:
+        """Como `calculate`, pero solo el último valor de cada línea por activo.
+
+        Returns:
+            Dict[str, np.ndarray]: Un vector por línea, NaN si no hay historia suficiente.
+        """
+        lines = BatchIndicators.calculate(indicator, closes, highs, lows, **params)
+        rows = np.shape(closes)[0]
         return {
-            "tenkan": [round(x, 2) for x in tenkan],
-            "kijun": [round(x, 2) for x in kijun],
-            "senkou_a": [round(x, 2) for x in senkou_a],
-            "senkou_b": [round(x, 2) for x in senkou_b],
-            "chikou": [round(x, 2) for x in chikou],
-            "current": {
-                "tenkan": tenkan[-1] if tenkan else None,
-                "kijun": kijun[-1] if kijun else None,
-                "senkou_a": senkou_a[-1] if senkou_a else None,
-                "senkou_b": senkou_b[-1] if senkou_b else None,
-                "chikou": chikou[-1] if chikou else None
-            }
-        }
\ No newline at end of file
+            name: values[..., -1] if values.shape[-1] else np.full(rows, np.nan)
+            for name, values in lines.items()
+        }
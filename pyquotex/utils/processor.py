@@ -1,5 +1,6 @@
 import time
-from pyquotex.utils.services import group_by_period
+import threading
+from collections import deque
 
 
 def get_color(candle):
@@ -53,62 +54,100 @@ def get_last_n_candles(pair, candles, n=3):
     return last_n_candles
 
 
-def process_candles(history, period):
-    candles = []
-    current_candle = {
-        'open': None,
-        'high': float('-inf'),
-        'low': float('inf'),
-        'close': None,
-        'start_time': None,
-        'end_time': None,
-        'ticks': 0
+def tick_columns(history):
+    """Split a tick history into time and price columns.
+
+    :param history: Ticks as ``{"time", "price"}`` dicts or
+        ``[time, price, ...]`` lists.
+    :returns: The times and prices lists.
+    """
+    if not history:
+        return [], []
+    if isinstance(history[0], dict):
+        return [tick['time'] for tick in history], [tick['price'] for tick in history]
+    return [tick[0] for tick in history], [tick[1] for tick in history]
+
+
+def resample_ticks(times, prices, period, fill_gaps=False, include_partial=True):
+    """Resample ticks into OHLC candles in one vectorized pass.
+
+    Ticks are binned by ``time // period``; open/close come from the
+    first/last tick of each bin and high/low from ``reduceat`` over the
+    bins.
+
+    :param times: Tick timestamps, sorted or not.
+    :param prices: Tick prices.
+    :param int period: The candle period in seconds.
+    :param bool fill_gaps: Whether to add flat candles with ``ticks == 0``
+        for intervals without ticks; otherwise they are left out.
+    :param bool include_partial: Whether to keep the last candle, which
+        may still be forming.
+    :returns: A dict of numpy arrays: time, open, high, low, close, ticks.
+    """
+    import numpy as np
+    times = np.asarray(times, dtype=np.float64)
+    prices = np.asarray(prices, dtype=np.float64)
+    if times.size and np.any(times[1:] < times[:-1]):
+        order = np.argsort(times, kind="stable")
+        times, prices = times[order], prices[order]
+
+    bins = (times // period).astype(np.int64)
+    starts = np.flatnonzero(np.r_[True, bins[1:] != bins[:-1]]) if bins.size else bins
+    bounds = np.r_[starts, bins.size]
+    candles = {
+        'time': bins[starts] * period,
+        'open': prices[starts],
+        'high': np.maximum.reduceat(prices, starts) if starts.size else prices[starts],
+        'low': np.minimum.reduceat(prices, starts) if starts.size else prices[starts],
+        'close': prices[bounds[1:] - 1],
+        'ticks': np.diff(bounds)
     }
+    if not include_partial:
+        candles = {key: values[:-1] for key, values in candles.items()}
+
+    if fill_gaps and candles['time'].size > 1:
+        slots = (candles['time'] - candles['time'][0]) // period
+        filled = np.zeros(slots[-1] + 1, dtype=bool)
+        filled[slots] = True
+        # Each slot points at the last candle with ticks up to it
+        source = np.cumsum(filled) - 1
+        previous_close = candles['close'][source]
+        gaps = {
+            'time': candles['time'][0] + np.arange(filled.size) * period,
+            'open': np.where(filled, candles['open'][source], previous_close),
+            'high': np.where(filled, candles['high'][source], previous_close),
+            'low': np.where(filled, candles['low'][source], previous_close),
+            'close': previous_close,
+            'ticks': np.where(filled, candles['ticks'][source], 0)
+        }
+        candles = gaps
+
+    return candles
+
 
-    start_time = None
-    timestamp = None
-    price = 0
-    for entry in history:
-        if isinstance(entry, dict):
-            timestamp = entry['time']
-            price = entry['price']
-        elif isinstance(entry, list):
-            timestamp, price, _ = entry
-        if start_time is None:
-            start_time = timestamp - (timestamp % period)
-
-        end_time = start_time + period
-        if timestamp >= end_time:
-
-            # Concluir a vela atual
-            candles.append(current_candle)
-
-            # Resetar para a próxima vela
-            start_time = timestamp - (timestamp % period)
-            current_candle = {
-                'open': price,
-                'high': price,
-                'low': price,
-                'close': price,
-                'start_time': start_time,
-                'end_time': start_time + period,
-                'ticks': 1
-            }
-
-        else:
-            if current_candle['open'] is None:
-                current_candle['open'] = price
-            current_candle['close'] = price
-            current_candle['high'] = max(current_candle['high'], price)
-            current_candle['low'] = min(current_candle['low'], price)
-            current_candle['end_time'] = end_time
-            current_candle['ticks'] += 1
-
-    # Adicionar a última vela se não estiver vazia
-    if current_candle['open'] is not None:
-        candles.append(current_candle)
-
-    return candles[:-1]
+def process_candles(history, period, include_partial=True):
+    times, prices = tick_columns(history)
+    resampled = resample_ticks(times, prices, period, include_partial=include_partial)
+    start_times = resampled['time'].tolist()
+    return [
+        {
+            'open': open_price,
+            'high': high_price,
+            'low': low_price,
+            'close': close_price,
+            'start_time': start_time,
+            'end_time': start_time + period,
+            'ticks': ticks
+        }
+        for start_time, open_price, high_price, low_price, close_price, ticks in zip(
+            start_times,
+            resampled['open'].tolist(),
+            resampled['high'].tolist(),
+            resampled['low'].tolist(),
+            resampled['close'].tolist(),
+            resampled['ticks'].tolist()
+        )
+    ]
 
 
 def process_candles_v2(history, asset, data):
@@ -118,27 +157,27 @@ def process_candles_v2(history, asset, data):
     return candles
 
 
-def calculate_candles(history, period):
-    grouped = group_by_period(history, period)
-    candles = []
-    for minute, ticks in grouped.items():
-        open_price = ticks[0][1]
-        close_price = ticks[-1][1]
-        high_price = max(tick[1] for tick in ticks)
-        low_price = min(tick[1] for tick in ticks)
-        num_ticks = len(ticks)
-        candle = {
-            'time': minute * period,
+def calculate_candles(history, period, include_partial=False):
+    times, prices = tick_columns(history)
+    resampled = resample_ticks(times, prices, period, include_partial=include_partial)
+    return [
+        {
+            'time': start_time,
             'open': open_price,
             'close': close_price,
             'high': high_price,
             'low': low_price,
-            'ticks': num_ticks
+            'ticks': ticks
         }
-        candles.append(candle)
-    candles = candles[:-1]
-
-    return candles
+        for start_time, open_price, close_price, high_price, low_price, ticks in zip(
+            resampled['time'].tolist(),
+            resampled['open'].tolist(),
+            resampled['close'].tolist(),
+            resampled['high'].tolist(),
+            resampled['low'].tolist(),
+            resampled['ticks'].tolist()
+        )
+    ]
 
 
 def merge_candles(candles_data):
@@ -153,8 +192,76 @@ def merge_candles(candles_data):
     return merged_list
 
 
-def aggregate_candle(tick, candles):
+def find_gaps(candles, period, start=None, end=None):
+    """Find the missing intervals of a candle series.
+
+    :param list candles: Candles sorted by time, without duplicates.
+    :param int period: The candle period in seconds.
+    :param start: (optional) Expected time of the first candle.
+    :param end: (optional) Expected time of the last candle.
+    :returns: ``(gap_start, gap_end)`` pairs: the candles with
+        ``gap_start <= time < gap_end`` are missing.
+    """
+    times = [candle['time'] for candle in candles]
+    if start is not None:
+        start = int(start // period * period)
+        times = [start - period] + [t for t in times if t >= start]
+    if end is not None:
+        end = int(end // period * period)
+        times = [t for t in times if t <= end] + [end + period]
+
+    gaps = []
+    for previous, current in zip(times, times[1:]):
+        if current - previous > period:
+            gaps.append((previous + period, current))
+    return gaps
+
+
+def merge_candles_with_gaps(candles_data, period, start=None, end=None):
+    """Like :func:`merge_candles`, also reporting the missing intervals.
+
+    :returns: The merged candles and the gaps from :func:`find_gaps`.
+    """
+    merged = merge_candles(candles_data)
+    return merged, find_gaps(merged, period, start, end)
+
+
+def fill_gaps_from_ticks(candles, gaps, ticks, period):
+    """Rebuild missing candles from archived ticks.
+
+    Only intervals fully covered by the archive are rebuilt, so a candle
+    is never made from part of its ticks.
+
+    :param list candles: The merged candles.
+    :param list gaps: The gaps from :func:`find_gaps`.
+    :param ticks: Archived ticks as ``{"time", "price"}`` dicts or lists.
+    :param int period: The candle period in seconds.
+    :returns: The candles with the rebuilt ones merged in, and the gaps
+        still missing.
+    """
+    if not gaps or not ticks:
+        return candles, gaps
+    times, _ = tick_columns(ticks)
+    first, last = min(times), max(times)
+    rebuilt = [
+        candle for candle in calculate_candles(ticks, period, include_partial=True)
+        if candle['time'] >= first and candle['time'] + period <= last
+        and any(gap_start <= candle['time'] < gap_end for gap_start, gap_end in gaps)
+    ]
+    if not rebuilt:
+        return candles, gaps
+    merged = merge_candles(candles + rebuilt)
+    remaining = []
+    for gap_start, gap_end in gaps:
+        inside = [candle for candle in rebuilt if gap_start <= candle['time'] < gap_end]
+        remaining.extend(find_gaps(inside, period, gap_start, gap_end - period))
+    return merged, remaining
+
+
+def aggregate_candle(tick, candles, interval=None):
     for timestamp, data in tick.items():
+        if interval:
+            timestamp = int(timestamp // interval * interval)
         candle = candles.setdefault(timestamp, {
             'symbol': data['symbol'],
             'open': data['open'],
@@ -167,4 +274,103 @@ def aggregate_candle(tick, candles):
         candle['high'] = max(candle['high'], data['high'])
         candle['low'] = min(candle['low'], data['low'])
 
-    return candles
\ No newline at end of file
+    return candles
+
+
+class TimeframeAggregator(object):
+    """Builds candles of several timeframes from one tick or candle stream.
+
+    Every tick (or base candle) updates the open candle of each timeframe
+    in place with :func:`process_tick` / :func:`aggregate_candle`. When
+    data for a later interval arrives, the previous candle of that
+    timeframe is closed, kept in its history and passed to ``on_close``.
+    Ticks arrive on the websocket thread while the candles are read from
+    the event loop, so both sides go through a lock.
+    """
+
+    def __init__(self, timeframes, on_close=None, max_candles=500):
+        """
+        :param timeframes: The timeframes in seconds, e.g. [60, 300, 900, 3600].
+        :param on_close: (optional) Called as ``on_close(symbol, timeframe, candle)``
+            for each closed candle.
+        :param max_candles: Closed candles kept per symbol and timeframe.
+        """
+        self.timeframes = sorted(set(timeframes))
+        self.on_close = on_close
+        self.max_candles = max_candles
+        self.open_candles = {}
+        self.closed_candles = {}
+        self.__lock = threading.Lock()
+
+    def add_tick(self, tick):
+        """Method to add a realtime tick.
+
+        :param tick: ``[symbol, timestamp, price, direction]`` as sent by the platform.
+        :returns: The ``(timeframe, candle)`` pairs closed by this tick.
+        """
+        symbol, timestamp = tick[0], tick[1]
+        closed = []
+        with self.__lock:
+            for timeframe in self.timeframes:
+                candles = self._roll(symbol, timeframe, timestamp, closed)
+                if candles is not None:
+                    process_tick(tick, timeframe, candles)
+        return self._emit(symbol, closed)
+
+    def add_candle(self, candle, symbol=None):
+        """Method to add a base candle, e.g. from a 5s/1m stream or history.
+
+        The same candle may be added again while it is still forming. Only
+        timeframes that are multiples of the base period give exact candles.
+
+        :param dict candle: Candle with ``time`` (or ``timestamp``), ``open``,
+            ``close``, ``high`` and ``low``.
+        :param str symbol: (optional) The asset, if the candle has no ``symbol``.
+        :returns: The ``(timeframe, candle)`` pairs closed by this candle.
+        """
+        symbol = candle.get('symbol', symbol)
+        timestamp = candle.get('time', candle.get('timestamp'))
+        data = {timestamp: dict(candle, symbol=symbol)}
+        closed = []
+        with self.__lock:
+            for timeframe in self.timeframes:
+                candles = self._roll(symbol, timeframe, timestamp, closed)
+                if candles is not None:
+                    aggregate_candle(data, candles, timeframe)
+        return self._emit(symbol, closed)
+
+    def candles(self, symbol, timeframe, include_open=False):
+        """Method to get the candles built so far.
+
+        :param str symbol: The asset.
+        :param int timeframe: The timeframe in seconds.
+        :param bool include_open: Whether to append the still open candle.
+        :returns: The candles, oldest first; the open candle is a copy.
+        """
+        with self.__lock:
+            candles = list(self.closed_candles.get((symbol, timeframe), ()))
+            if include_open:
+                candles.extend(dict(candle) for candle in self.open_candles.get((symbol, timeframe), {}).values())
+        return candles
+
+    def _roll(self, symbol, timeframe, timestamp, closed):
+        key = (symbol, timeframe)
+        interval_start = int(timestamp // timeframe * timeframe)
+        candles = self.open_candles.setdefault(key, {})
+        if candles:
+            current = next(iter(candles))
+            if interval_start < current:
+                # Late data for a candle that was already closed
+                return None
+            if interval_start > current:
+                candle = candles.pop(current)
+                history = self.closed_candles.setdefault(key, deque(maxlen=self.max_candles))
+                history.append(candle)
+                closed.append((timeframe, candle))
+        return candles
+
+    def _emit(self, symbol, closed):
+        if self.on_close:
+            for timeframe, candle in closed:
+                self.on_close(symbol, timeframe, candle)
+        return closed
\ No newline at end of file
@@ -1,52 +1,158 @@
+import re
 import json
 import time
+import logging
 from pyquotex.ws.channels.base import Base
 from pyquotex.expiration import get_expiration_time_quotex
 
+logger = logging.getLogger(__name__)
 
-class Buy(Base):
-    """Class for Quotex buy websocket channel."""
+FIELD_MARKER = re.compile(r'"__(\w+)__"')
 
-    name = "buy"
 
-    def __call__(self, price, asset, direction, duration, request_id, is_fast_option):
-        option_type = 1
+class FrameTemplate(object):
+    """Class for a pre-serialized websocket frame.
+
+    The payload is serialized once with ``"__name__"`` markers in place
+    of the values that change per send; rendering only joins the cached
+    text with the serialized values.
+    """
+
+    def __init__(self, event, payload):
+        """
+        :param str event: The websocket event name.
+        :param dict payload: The payload with markers for the variable fields.
+        """
+        text = f'42["{event}",{json.dumps(payload)}]'
+        parts = FIELD_MARKER.split(text)
+        self.literals = parts[0::2]
+        self.fields = parts[1::2]
+
+    def render(self, **values):
+        literals = self.literals
+        chunks = [literals[0]]
+        for field, literal in zip(self.fields, literals[1:]):
+            value = values[field]
+            chunks.append(str(value) if type(value) is int else json.dumps(value))
+            chunks.append(literal)
+        return "".join(chunks)
 
-        expiration_time = get_expiration_time_quotex(
-            int(time.time()),
-            duration
-        )
-        expiration = expiration_time
 
+class PreparedOrder(object):
+    """Class for an order whose frames are built ahead of time.
+
+    Only the amount, expiration and requestId are filled in when it is
+    sent. The API is passed in on every send rather than kept, so an
+    order prepared before a reconnect goes out on the current connection.
+    """
+
+    def __init__(self, api, asset, direction, duration, is_fast_option):
+        """
+        :param api: The instance of :class:`QuotexAPI
+            <pyquotex.api.QuotexAPI>` to build the settings frame with.
+        :param str asset: The asset to trade.
+        :param str direction: The direction, call or put.
+        :param int duration: The duration in seconds.
+        :param bool is_fast_option: Whether the order uses timer mode.
+        """
+        self.asset = asset
+        self.duration = duration
+        self.is_fast_option = is_fast_option
+        self.option_type = 1
         if asset.endswith("_otc") and not is_fast_option:
-            option_type = 100
-            expiration = duration
-
-        if option_type == 1 and duration < 60:
-            print(f"{duration}s duration is not allowed for this type of operation, except for OTC assets. "
-                  f"60 seconds will be added to meet Quotex requirements.")
-
-        self.api.settings_apply(
-            asset,
-            expiration,
-            is_fast_option=is_fast_option,
-            end_time=expiration_time,
-        )
+            self.option_type = 100
+
+        if self.option_type == 1 and duration < 60:
+            logger.warning(f"{duration}s duration is not allowed for this type of operation, except for OTC "
+                           f"assets. 60 seconds will be added to meet Quotex requirements.")
 
-        payload = {
+        settings = api.settings_payload(asset, "__time_period__", is_fast_option=is_fast_option)
+        settings["settings"]["currentExpirationTime"] = "__expiration_time__"
+        self.settings_frame = FrameTemplate("settings/store", settings)
+
+        self.order_frame = FrameTemplate("orders/open", {
             "asset": asset,
-            "amount": price,
-            "time": expiration,
+            "amount": "__amount__",
+            "time": "__time__",
             "action": direction,
-            "isDemo": self.api.account_type,
+            "isDemo": "__is_demo__",
             "tournamentId": 0,
-            "requestId": request_id,
-            "optionType": option_type
-        }
+            "requestId": "__request_id__",
+            "optionType": self.option_type
+        })
+
+    def expiration(self, timestamp):
+        """Method to get the expiration for an order sent at the given time.
+
+        :param int timestamp: The server timestamp.
+        :returns: The expiration timestamp and the order time field.
+        """
+        expiration_time = get_expiration_time_quotex(timestamp, self.duration)
+        if self.option_type == 100:
+            return expiration_time, self.duration
+        return expiration_time, expiration_time
+
+    def frames(self, api, amount, request_id, timestamp=None):
+        """Method to render the settings and order frames.
+
+        :param api: The instance of :class:`QuotexAPI
+            <pyquotex.api.QuotexAPI>` the order is sent on.
+        :param amount: The amount to invest.
+        :param request_id: The unique requestId of the order.
+        :param int timestamp: (optional) Server time to compute the
+            expiration from; defaults to now.
+        :returns: The settings frame and the order frame.
+        """
+        if timestamp is None:
+            timestamp = int(api.timesync.server_time())
+        expiration_time, expiration = self.expiration(timestamp)
+        settings = self.settings_frame.render(
+            time_period=expiration,
+            expiration_time=expiration_time if self.is_fast_option else int(time.time())
+        )
+        order = self.order_frame.render(
+            amount=amount,
+            time=expiration,
+            is_demo=api.account_type,
+            request_id=request_id
+        )
+        return settings, order
+
+    def send(self, api, amount, request_id, send_tick=True, timestamp=None):
+        """Method to send the settings and order frames.
+
+        :param api: The instance of :class:`QuotexAPI
+            <pyquotex.api.QuotexAPI>` to send on.
+        :param amount: The amount to invest.
+        :param request_id: The unique requestId of the order.
+        :param bool send_tick: Whether to send a tick frame first.
+        :param int timestamp: (optional) Server time to compute the
+            expiration from; defaults to now.
+        """
+        settings, order = self.frames(api, amount, request_id, timestamp)
+        api.send_websocket_request(settings)
+        if send_tick:
+            api.send_websocket_request('42["tick"]')
+        api.send_websocket_request(order)
+
+
+class Buy(Base):
+    """Class for Quotex buy websocket channel."""
+
+    name = "buy"
+
+    def prepare(self, asset, direction, duration, is_fast_option):
+        """Method to get the cached prepared order for these parameters.
 
-        data = f'42["tick"]'
-        self.send_websocket_request(data)
+        :returns: The instance of :class:`PreparedOrder
+            <pyquotex.ws.channels.buy.PreparedOrder>`.
+        """
+        key = (asset, direction, duration, is_fast_option)
+        prepared = self.api.prepared_orders.get(key)
+        if prepared is None:
+            prepared = PreparedOrder(self.api, asset, direction, duration, is_fast_option)
+            self.api.prepared_orders[key] = prepared
+        return prepared
 
-        data = f'42["orders/open",{json.dumps(payload)}]'
-        print(data)
-        self.send_websocket_request(data)
+    def __call__(self, price, asset, direction, duration, request_id, is_fast_option, send_tick=True):
+        self.prepare(asset, direction, duration, is_fast_option).send(self.api, price, request_id, send_tick)
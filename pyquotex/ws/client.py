@@ -4,6 +4,12 @@ import time
 import logging
 import websocket
 from .. import global_value
+from .objects.connection import (
+    CONNECTED,
+    AUTHORIZED,
+    REJECTED,
+    CLOSED
+)
 
 logger = logging.getLogger(__name__)
 
@@ -48,9 +54,11 @@ class WebsocketClient(object):
                 print("Token rejected, making automatic reconnection.")
                 logger.debug("Token rejected, making automatic reconnection.")
                 global_value.check_rejected_connection = 1
+                self.api.connection_state.set(REJECTED)
             elif "s_authorization" in str(message):
                 global_value.check_accepted_connection = 1
                 global_value.check_rejected_connection = 0
+                self.api.connection_state.set(AUTHORIZED)
             elif "instruments/list" in str(message):
                 global_value.started_listen_instruments = True
 
@@ -90,24 +98,30 @@ class WebsocketClient(object):
                     elif message.get("id") and not message.get("ticket"):
                         self.api.buy_successful = message
                         self.api.buy_id = message["id"]
+                        self.api.pending_orders.resolve(message)
+                        self.api.timesync.sample(message.get("openTimestamp"))
                         self.api.timesync.server_timestamp = message.get("closeTimestamp")
                     elif message.get("ticket") and not message.get("id"):
                         self.api.sold_options_respond = message
                     elif message.get("deals"):
                         for get_m in message["deals"]:
                             self.api.profit_in_operation = get_m["profit"]
-                            get_m["win"] = True if message["profit"] > 0 else False
+                            get_m["win"] = True if get_m["profit"] > 0 else False
                             get_m["game_state"] = 1
                             self.api.listinfodata.set(
                                 get_m["win"],
                                 get_m["game_state"],
                                 get_m["id"]
                             )
+                            self.api.deal_results.settle(get_m)
                     elif message.get("isDemo") and message.get("balance"):
                         self.api.training_balance_edit_request = message
                     elif message.get("error"):
                         global_value.websocket_error_reason = message.get("error")
                         global_value.check_websocket_if_error = True
+                        self.api.pending_orders.fail(message)
+                        if self.api.rate_limiter.throttled(global_value.websocket_error_reason):
+                            self.api.rate_limiter.penalize(global_value.websocket_error_reason)
                         if global_value.websocket_error_reason == "not_money":
                             self.api.account_balance = {"liveBalance": 0}
                     elif not message.get("list") == []:
@@ -118,12 +132,14 @@ class WebsocketClient(object):
             if str(message) == "41":
                 logger.info("Disconnection event triggered by the platform, causing automatic reconnection.")
                 global_value.check_websocket_if_connect = 0
+                self.api.connection_state.set(CLOSED)
             if "51-" in str(message):
                 self.api._temp_status = str(message)
             elif self.api._temp_status == """451-["settings/list",{"_placeholder":true,"num":0}]""":
                 self.api.settings_list = message
                 self.api._temp_status = ""
             elif self.api._temp_status == """451-["history/list/v2",{"_placeholder":true,"num":0}]""":
+                self.api.history_responses.resolve(message)
                 if message.get("asset") == self.api.current_asset:
                     self.api.candles.candles_data = message["history"]
                     self.api.candle_v2_data[message["asset"]] = message
@@ -141,7 +157,12 @@ class WebsocketClient(object):
                     "price": message[0][2]
                 }
                 self.api.realtime_price[message[0][0]].append(result)
+                self.api.last_tick_time[message[0][0]] = message[0][1]
+                self.api.timesync.sample(message[0][1])
                 self.api.realtime_candles[self.api.current_asset] = message[0]
+                aggregator = self.api.candle_aggregators.get(message[0][0])
+                if aggregator:
+                    aggregator.add_tick(message[0])
                 #print(self.api.realtime_candles)
             elif len(message[0]) == 2:
                 for i in message:
@@ -166,6 +187,7 @@ class WebsocketClient(object):
         """Method to process websocket open."""
         logger.info("Websocket client connected.")
         global_value.check_websocket_if_connect = 1
+        self.api.connection_state.set(CONNECTED)
         asset_name = self.api.current_asset
         period = self.api.current_period
         self.wss.send('42["tick"]')
@@ -181,6 +203,7 @@ class WebsocketClient(object):
         """Method to process websocket close."""
         logger.info("Websocket connection closed.")
         global_value.check_websocket_if_connect = 0
+        self.api.connection_state.set(CLOSED)
 
     def on_ping(self, wss, ping_msg):
         pass
@@ -0,0 +1,247 @@
+"""Module for the Quotex outbound websocket frame rate limiter."""
+import re
+import time
+import asyncio
+import logging
+import threading
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+EVENT_NAME = re.compile(r'^\d*\["([^"]+)"')
+
+# Error frame reasons that mean the server is throttling us. None has
+# been observed so far: an overloaded session is dropped with a "41"
+# disconnect, which penalizes through the connection state instead. The
+# only error reason seen, not_money, says nothing about the send rate.
+# Add reasons here once the server is seen sending them.
+THROTTLE_ERRORS = frozenset()
+
+EVENT_CLASSES = {
+    "instruments/update": "subscribe",
+    "instruments/follow": "subscribe",
+    "chart_notification/get": "subscribe",
+    "depth/follow": "subscribe",
+    "depth/unfollow": "subscribe",
+    "subfor": "subscribe",
+    "history/load": "history",
+    "history/load/line": "history",
+    "orders/open": "orders",
+    "orders/cancel": "orders",
+    "pending/create": "orders",
+    "settings/store": "orders",
+    "tick": "orders",
+}
+
+# (rate per second, burst) per class; orders are counted but never held back
+DEFAULT_BUDGETS = {
+    "subscribe": (10, 10),
+    "history": (5, 5),
+    "orders": (20, 20),
+}
+
+
+class TokenBucket(object):
+    """Class for the token bucket of one event class.
+
+    The rate follows additive increase, multiplicative decrease: it is
+    halved on every penalty and grows back by ``increase`` per second
+    up to the configured rate.
+    """
+
+    def __init__(self, rate, burst, min_rate=0.5, increase=0.1):
+        """
+        :param rate: The highest rate in frames per second.
+        :param burst: The most frames that can be sent back-to-back.
+        :param min_rate: The lowest rate backoff can bring it to.
+        :param increase: Frames per second regained every second.
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.increase = increase
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.sent = 0
+        self.waits = 0
+        self.waited = 0.0
+        self.penalties = 0
+
+    def refill(self, now):
+        elapsed = now - self.updated
+        self.updated = now
+        self.rate = min(self.max_rate, self.rate + self.increase * elapsed)
+        self.tokens = min(self.burst, self.tokens + self.rate * elapsed)
+
+    def delay(self, frames):
+        """Seconds until ``frames`` tokens are available."""
+        missing = frames - self.tokens
+        return missing / self.rate if missing > 0 else 0
+
+    def penalize(self):
+        self.rate = max(self.min_rate, self.rate / 2)
+        self.tokens = min(self.tokens, 0)
+        self.penalties += 1
+
+
+class RateLimiter(object):
+    """Class to pace outbound websocket frames per event class.
+
+    Every frame goes through :meth:`send`. A frame whose class has no
+    token left is queued and sent by a pacing thread as soon as the
+    budget allows, in order within its class. Orders are only counted and
+    go out at once, ahead of any queued frame. Bulk operations can await
+    :meth:`wait` before sending so they do not pile up in the queues.
+    Disconnects and throttling errors halve the rates, which then
+    recover slowly.
+    """
+
+    def __init__(self, budgets=None):
+        """
+        :param dict budgets: (optional) ``(rate, burst)`` per class,
+            merged over :data:`DEFAULT_BUDGETS`.
+        """
+        self.__lock = threading.Lock()
+        self.__ready = threading.Condition(self.__lock)
+        self.__thread = None
+        self.buckets = {
+            name: TokenBucket(rate, burst)
+            for name, (rate, burst) in dict(DEFAULT_BUDGETS, **(budgets or {})).items()
+        }
+        self.queues = {name: deque() for name in self.buckets}
+
+    @staticmethod
+    def classify(data):
+        """Method to get the event class of a frame.
+
+        :param str data: The websocket frame.
+        :returns: The class name, or None for frames that are not limited.
+        """
+        match = EVENT_NAME.match(data)
+        return EVENT_CLASSES.get(match.group(1)) if match else None
+
+    def send(self, data, send):
+        """Method to send a frame within the budget of its class.
+
+        :param str data: The websocket frame.
+        :param send: The callable that writes a frame to the socket.
+        :returns: True if the frame was sent now, False if it was queued.
+        """
+        event_class = self.classify(data)
+        bucket = self.buckets.get(event_class)
+        with self.__lock:
+            if bucket is not None:
+                bucket.refill(time.monotonic())
+                queue = self.queues[event_class]
+                if event_class != "orders" and (queue or bucket.tokens < 1):
+                    queue.append((data, send))
+                    self._start()
+                    self.__ready.notify()
+                    return False
+                bucket.tokens -= 1
+                bucket.sent += 1
+        send(data)
+        return True
+
+    def pending(self):
+        """Method to get the number of queued frames."""
+        with self.__lock:
+            return sum(len(queue) for queue in self.queues.values())
+
+    def clear(self):
+        """Method to drop the queued frames, e.g. when their socket closes."""
+        with self.__lock:
+            for queue in self.queues.values():
+                queue.clear()
+
+    def _start(self):
+        if self.__thread is None or not self.__thread.is_alive():
+            self.__thread = threading.Thread(target=self._pace, name="rate-limiter", daemon=True)
+            self.__thread.start()
+
+    def _pace(self):
+        while True:
+            ready = []
+            with self.__lock:
+                delay = None
+                now = time.monotonic()
+                for name, queue in self.queues.items():
+                    bucket = self.buckets[name]
+                    bucket.refill(now)
+                    while queue and bucket.tokens >= 1:
+                        bucket.tokens -= 1
+                        bucket.sent += 1
+                        ready.append(queue.popleft())
+                    if queue:
+                        wait = bucket.delay(1)
+                        delay = wait if delay is None else min(delay, wait)
+                if not ready:
+                    self.__ready.wait(delay)
+                    continue
+            for data, send in ready:
+                try:
+                    send(data)
+                except Exception as e:
+                    logger.debug(f"Queued frame not sent: {e}")
+
+    async def wait(self, event_class, frames=1):
+        """Wait until the class budget has room for the frames.
+
+        Orders never wait.
+
+        :param str event_class: subscribe, history or orders.
+        :param int frames: How many frames the caller is about to send.
+        """
+        bucket = self.buckets.get(event_class)
+        if bucket is None or event_class == "orders":
+            return
+        started = None
+        while True:
+            with self.__lock:
+                bucket.refill(time.monotonic())
+                delay = bucket.delay(min(frames, bucket.burst))
+            if delay <= 0:
+                break
+            started = started or time.monotonic()
+            await asyncio.sleep(delay)
+        if started:
+            waited = time.monotonic() - started
+            with self.__lock:
+                bucket.waits += 1
+                bucket.waited += waited
+
+    @staticmethod
+    def throttled(reason):
+        """Method to tell whether an error frame reason is one of :data:`THROTTLE_ERRORS`."""
+        return reason in THROTTLE_ERRORS
+
+    def penalize(self, reason=None):
+        """Method to back off every class after a disconnect or throttling error."""
+        with self.__lock:
+            for name, bucket in self.buckets.items():
+                if name != "orders":
+                    bucket.refill(time.monotonic())
+                    bucket.penalize()
+        logger.debug(f"Rate limits halved ({reason}).")
+
+    def stats(self):
+        """Method to get the limiter statistics.
+
+        :returns: Per class, the current and highest rate, the frames sent,
+            how many waits happened, the seconds spent waiting, the
+            number of penalties and the frames still queued.
+        """
+        with self.__lock:
+            return {
+                name: {
+                    "rate": round(bucket.rate, 3),
+                    "max_rate": bucket.max_rate,
+                    "sent": bucket.sent,
+                    "queued": len(self.queues[name]),
+                    "waits": bucket.waits,
+                    "waited": round(bucket.waited, 3),
+                    "penalties": bucket.penalties
+                }
+                for name, bucket in self.buckets.items()
+            }
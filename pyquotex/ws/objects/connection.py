@@ -0,0 +1,91 @@
+"""Module for Quotex connection state websocket object."""
+import asyncio
+import logging
+import threading
+from pyquotex.ws.objects.base import Base
+
+logger = logging.getLogger(__name__)
+
+CONNECTED = "connected"
+AUTHORIZED = "authorized"
+REJECTED = "rejected"
+CLOSED = "closed"
+
+
+class ConnectionState(Base):
+    """Class for Quotex connection state websocket object.
+
+    The state is written from the websocket thread and can be read
+    instantly or awaited from the event loop.
+    """
+
+    def __init__(self):
+        super(ConnectionState, self).__init__()
+        self.__name = "connectionState"
+        self.__state = None
+        self.__lock = threading.Lock()
+        self.__waiters = []
+        self.listeners = []
+
+    @property
+    def state(self):
+        """Property to get the current connection state.
+
+        :returns: One of connected, authorized, rejected, closed or None.
+        """
+        return self.__state
+
+    @property
+    def is_authorized(self):
+        return self.__state == AUTHORIZED
+
+    def set(self, state):
+        """Method to set the connection state and wake up its waiters.
+
+        :param str state: The new connection state.
+        """
+        with self.__lock:
+            if state == self.__state:
+                return
+            self.__state = state
+            ready = [w for w in self.__waiters if state in w[2]]
+            self.__waiters = [w for w in self.__waiters if state not in w[2]]
+
+        for loop, future, _ in ready:
+            loop.call_soon_threadsafe(self._resolve, future, state)
+
+        for listener in list(self.listeners):
+            try:
+                listener(state)
+            except Exception as e:
+                logger.error(f"Connection state listener failed: {e}")
+
+    @staticmethod
+    def _resolve(future, state):
+        if not future.done():
+            future.set_result(state)
+
+    async def wait_for(self, states=AUTHORIZED, timeout=None):
+        """Wait until the connection reaches one of the given states.
+
+        :param states: A state or a tuple of states to wait for.
+        :param timeout: (optional) Maximum seconds to wait.
+        :returns: The state reached, or None on timeout.
+        """
+        if isinstance(states, str):
+            states = (states,)
+        loop = asyncio.get_running_loop()
+        with self.__lock:
+            if self.__state in states:
+                return self.__state
+            future = loop.create_future()
+            waiter = (loop, future, states)
+            self.__waiters.append(waiter)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            with self.__lock:
+                if waiter in self.__waiters:
+                    self.__waiters.remove(waiter)
@@ -0,0 +1,97 @@
+"""Module for Quotex deal results websocket object."""
+import asyncio
+import threading
+from collections import OrderedDict
+from pyquotex.ws.objects.base import Base
+
+
+class DealResults(Base):
+    """Class for Quotex deal results websocket object.
+
+    Deals are settled from the websocket thread when a ``deals`` frame
+    arrives; waiters for a ticket and subscribers to all deals are woken
+    on their own event loop without any polling.
+    """
+
+    def __init__(self, max_settled=1000):
+        """
+        :param max_settled: How many settled deals to keep for late waiters.
+        """
+        super(DealResults, self).__init__()
+        self.__name = "dealResults"
+        self.__lock = threading.Lock()
+        self.__settled = OrderedDict()
+        self.__waiters = {}
+        self.__subscribers = []
+        self.max_settled = max_settled
+
+    def get(self, id_number):
+        """Method to get a deal settled in this session.
+
+        :param id_number: The deal id.
+        :returns: The deal, or None if it has not settled yet.
+        """
+        return self.__settled.get(id_number)
+
+    def settle(self, deal):
+        """Method to record a settled deal and wake up everyone waiting on it.
+
+        :param dict deal: A deal from the ``deals`` frame.
+        """
+        id_number = deal.get("id")
+        with self.__lock:
+            self.__settled[id_number] = deal
+            while len(self.__settled) > self.max_settled:
+                self.__settled.popitem(last=False)
+            waiters = self.__waiters.pop(id_number, [])
+            subscribers = list(self.__subscribers)
+
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(self._resolve, future, deal)
+        for loop, queue in subscribers:
+            loop.call_soon_threadsafe(queue.put_nowait, deal)
+
+    @staticmethod
+    def _resolve(future, deal):
+        if not future.done():
+            future.set_result(deal)
+
+    async def wait(self, id_number, timeout=None):
+        """Wait until a deal settles.
+
+        :param id_number: The deal id.
+        :param timeout: (optional) Maximum seconds to wait.
+        :returns: The deal, or None on timeout.
+        """
+        loop = asyncio.get_running_loop()
+        with self.__lock:
+            deal = self.__settled.get(id_number)
+            if deal is not None:
+                return deal
+            future = loop.create_future()
+            waiter = (loop, future)
+            self.__waiters.setdefault(id_number, []).append(waiter)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            with self.__lock:
+                waiters = self.__waiters.get(id_number)
+                if waiters and waiter in waiters:
+                    waiters.remove(waiter)
+                    if not waiters:
+                        del self.__waiters[id_number]
+
+    async def stream(self):
+        """Iterate over every deal settled from now on."""
+        queue = asyncio.Queue()
+        subscriber = (asyncio.get_running_loop(), queue)
+        with self.__lock:
+            self.__subscribers.append(subscriber)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            with self.__lock:
+                self.__subscribers.remove(subscriber)
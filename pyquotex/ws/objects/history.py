@@ -0,0 +1,112 @@
+"""Module for Quotex history responses websocket object."""
+import time
+import asyncio
+import logging
+import threading
+from collections import deque
+from pyquotex.ws.objects.base import Base
+
+logger = logging.getLogger(__name__)
+
+
+class HistoryResponses(Base):
+    """Class for Quotex history responses websocket object.
+
+    Waiters are queued per asset in the order their requests are sent,
+    each with a unique request index. A response is given to the waiter
+    whose index it echoes; an untagged response goes to the oldest
+    waiter, unless it holds candles newer than that request asked for.
+    Requests that timed out keep their place in the queue for a while, so
+    their late response is dropped instead of resolving the next waiter.
+    """
+
+    def __init__(self, stale_after=60):
+        """
+        :param stale_after: Seconds a timed out request waits for its
+            late response before it is forgotten.
+        """
+        super(HistoryResponses, self).__init__()
+        self.__name = "historyResponses"
+        self.__lock = threading.Lock()
+        self.__waiters = {}
+        self.__last_index = 0
+        self.stale_after = stale_after
+
+    def add(self, asset, end=None):
+        """Method to register a history request before its frame is sent.
+
+        :param str asset: The asset of the request.
+        :param end: (optional) The end time of the request, used to tell
+            an untagged late response apart.
+        :returns: The index to send the request with and the future
+            resolved with the ``history/list/v2`` message.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self.__lock:
+            # A timestamp like the other requests, but never reused
+            index = max(int(time.time()), self.__last_index + 1)
+            self.__last_index = index
+            waiters = self.__waiters.setdefault(asset, deque())
+            self._purge(waiters)
+            waiters.append({"index": index, "end": end, "loop": loop, "future": future, "abandoned": None})
+        return index, future
+
+    def discard(self, asset, index):
+        """Method to give up on a request, e.g. after a timeout.
+
+        :param str asset: The asset of the request.
+        :param int index: The index returned by :meth:`add`.
+        """
+        with self.__lock:
+            for waiter in self.__waiters.get(asset, ()):
+                if waiter["index"] == index:
+                    waiter["abandoned"] = time.monotonic()
+
+    def resolve(self, message):
+        """Method to resolve the request a history response belongs to.
+
+        :param dict message: The ``history/list/v2`` message.
+        """
+        asset = message.get("asset")
+        with self.__lock:
+            waiters = self.__waiters.get(asset)
+            waiter = self._match(waiters, message) if waiters else None
+        if waiter is None:
+            logger.debug(f"Dropped stale history response for {asset}.")
+            return
+        waiter["loop"].call_soon_threadsafe(self._set, waiter["future"], message)
+
+    def _match(self, waiters, message):
+        self._purge(waiters)
+        index = message.get("index")
+        if index is not None:
+            waiter = next((waiter for waiter in waiters if waiter["index"] == index), None)
+            if waiter is None:
+                return None
+        elif waiters:
+            waiter = waiters[0]
+            latest = self._latest_time(message)
+            if waiter["end"] is not None and latest is not None \
+                    and latest > waiter["end"] + (message.get("period") or 0):
+                return None
+        else:
+            return None
+        waiters.remove(waiter)
+        return None if waiter["abandoned"] else waiter
+
+    def _purge(self, waiters):
+        now = time.monotonic()
+        while waiters and waiters[0]["abandoned"] and now - waiters[0]["abandoned"] > self.stale_after:
+            waiters.popleft()
+
+    @staticmethod
+    def _latest_time(message):
+        times = [rows[-1][0] for rows in (message.get("candles"), message.get("history"))
+                 if rows and isinstance(rows[-1], (list, tuple))]
+        return max(times) if times else None
+
+    @staticmethod
+    def _set(future, message):
+        if not future.done():
+            future.set_result(message)
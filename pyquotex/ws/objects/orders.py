@@ -0,0 +1,101 @@
+"""Module for Quotex pending orders websocket object."""
+import asyncio
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from pyquotex.ws.objects.base import Base
+
+# Reasons observed in untagged error frames answering orders/open.
+# not_money (the balance does not cover the amount) concerns the account,
+# so without an asset it fails whichever order is oldest; any order
+# would have been refused alike
+ORDER_ERRORS = {"not_money"}
+
+
+class PendingOrders(Base):
+    """Class for Quotex pending orders websocket object.
+
+    Every ``orders/open`` frame gets a unique requestId and a future that
+    is resolved from the websocket thread when its response arrives, so
+    several orders can be in flight at the same time.
+    """
+
+    def __init__(self):
+        super(PendingOrders, self).__init__()
+        self.__name = "pendingOrders"
+        self.__lock = threading.Lock()
+        self.__orders = OrderedDict()
+        self.__counter = itertools.count(int(time.time() * 1000))
+
+    def next_request_id(self):
+        """Method to get a request id that is unique within this process.
+
+        :returns: The request id.
+        """
+        return next(self.__counter)
+
+    def add(self, request_id, asset):
+        """Method to register an order before its frame is sent.
+
+        :param request_id: The requestId of the order.
+        :param str asset: The asset of the order.
+        :returns: The future resolved with the order response.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self.__lock:
+            self.__orders[str(request_id)] = (loop, future, asset)
+        return future
+
+    def discard(self, request_id):
+        with self.__lock:
+            self.__orders.pop(str(request_id), None)
+
+    def __len__(self):
+        return len(self.__orders)
+
+    def _pop(self, request_id=None, asset=None):
+        with self.__lock:
+            if request_id is not None:
+                return self.__orders.pop(str(request_id), None)
+            for key, (_, _, order_asset) in self.__orders.items():
+                if asset is None or order_asset == asset:
+                    return self.__orders.pop(key)
+        return None
+
+    def resolve(self, message):
+        """Method to resolve the order a response belongs to.
+
+        The requestId is used when the server echoes it, otherwise the
+        oldest order in flight on the same asset.
+
+        :param dict message: The ``orders/open`` response.
+        """
+        order = self._pop(message.get("requestId"), message.get("asset"))
+        if order:
+            loop, future, _ = order
+            loop.call_soon_threadsafe(self._set, future, True, message)
+
+    def fail(self, message):
+        """Method to fail the order an error frame belongs to.
+
+        Errors without a requestId only fail an order when their reason
+        is one of :data:`ORDER_ERRORS`, and then the oldest order in
+        flight on the asset of the frame. Any other error leaves the
+        orders alone; they time out rather than take a stranger's error.
+
+        :param dict message: The error frame.
+        """
+        request_id = message.get("requestId")
+        if request_id is None and message.get("error") not in ORDER_ERRORS:
+            return
+        order = self._pop(request_id, message.get("asset"))
+        if order:
+            loop, future, _ = order
+            loop.call_soon_threadsafe(self._set, future, False, message.get("error"))
+
+    @staticmethod
+    def _set(future, status, result):
+        if not future.done():
+            future.set_result((status, result))
@@ -10,6 +10,11 @@ class TimeSync(Base):
         self.__name = "timeSync"
         self.__server_timestamp = time.time()
         self.__expiration_time_minutes = 1
+        self.__offset = None
+        self.__last_sample = None
+        self.__jump = None
+        self.drift_decay = 0.05
+        self.max_jump = 0.5
 
     @property
     def server_timestamp(self):
@@ -29,6 +34,60 @@ class TimeSync(Base):
             raise ValueError("The timestamp must be a number.")
         self.__server_timestamp = timestamp
 
+    @property
+    def offset(self):
+        """Get the smoothed difference between the server and local clocks.
+
+        :returns: The offset in seconds, or 0 before the first sample.
+        """
+        return self.__offset or 0
+
+    @property
+    def last_sample(self):
+        """Get the local time of the last clock sample.
+
+        :returns: The local timestamp, or None if never sampled.
+        """
+        return self.__last_sample
+
+    def sample(self, server_timestamp, received_at=None):
+        """Feed a server clock reading into the offset estimate.
+
+        A reading can only lag the real server clock (it was stamped before
+        it travelled to us), so larger offsets are taken at once and smaller
+        ones are blended in slowly to follow clock drift. A reading more
+        than ``max_jump`` seconds ahead of the estimate is held back until
+        the next reading confirms it, so a single bad timestamp cannot
+        shift the clock.
+
+        :param server_timestamp: Server time carried by a message.
+        :param received_at: (optional) Local time the message arrived.
+        """
+        if not isinstance(server_timestamp, (int, float)):
+            return
+        received_at = received_at or time.time()
+        offset = server_timestamp - received_at
+        if self.__offset is not None and offset > self.__offset + self.max_jump:
+            if self.__jump is None:
+                self.__jump = offset
+                return
+            # Two jumps in a row: the clock really moved, by at least the smaller
+            offset, self.__jump = min(offset, self.__jump), None
+        else:
+            self.__jump = None
+        if self.__offset is None or offset > self.__offset:
+            self.__offset = offset
+        else:
+            self.__offset += self.drift_decay * (offset - self.__offset)
+        self.__last_sample = received_at
+
+    def server_time(self):
+        """Get the current server time from the local clock and offset.
+
+        :returns: The estimated server timestamp.
+        """
+        return time.time() + self.offset
+
     @property
     def server_datetime(self):
         """Get the server date and time based on the timestamp.
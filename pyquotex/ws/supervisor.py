@@ -0,0 +1,122 @@
+"""Module for Quotex websocket reconnect supervisor."""
+import time
+import asyncio
+import inspect
+import logging
+from .objects.connection import CLOSED, REJECTED
+
+logger = logging.getLogger(__name__)
+
+
+class ReconnectSupervisor(object):
+    """Class to restore the Quotex session after a websocket disconnect."""
+
+    def __init__(self, client, base_delay=1, max_delay=60, relogin_after=3):
+        """
+        :param client: The instance of :class:`Quotex
+            <pyquotex.stable_api.Quotex>`.
+        :param base_delay: First backoff delay in seconds.
+        :param max_delay: Upper bound for the backoff delay in seconds.
+        :param relogin_after: Failed attempts after which the session
+            token is discarded and a new one obtained by logging in.
+        """
+        self.client = client
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.relogin_after = relogin_after
+        self.reconnect_count = 0
+        self.last_disconnect = None
+        self._task = None
+
+    @property
+    def running(self):
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+        return self._task
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            await self.client.api.connection_state.wait_for(CLOSED)
+            self.last_disconnect = time.time()
+            logger.info("Websocket disconnected, starting session restore.")
+            await self._restore()
+            await self._replay()
+            await self._backfill()
+
+    async def _restore(self):
+        """Reconnect with exponential backoff until the session is authorized.
+
+        A rejected token, or ``relogin_after`` failures in a row, hands
+        off to a new login before the next attempt.
+        """
+        api = self.client.api
+        attempt = 0
+        while True:
+            try:
+                await api.close()
+                check, reason = await api.connect(self.client.account_is_demo)
+                if check and await self.client.check_connect(timeout=10):
+                    self.reconnect_count += 1
+                    logger.info(f"Session restored after {attempt + 1} attempt(s).")
+                    return True
+                logger.warning(f"Reconnect attempt {attempt + 1} failed: {reason}")
+            except Exception as e:
+                logger.warning(f"Reconnect attempt {attempt + 1} failed: {e}")
+            attempt += 1
+            if api.connection_state.state == REJECTED or attempt % self.relogin_after == 0:
+                await self._relogin()
+            delay = min(self.base_delay * 2 ** (attempt - 1), self.max_delay)
+            await asyncio.sleep(delay)
+
+    async def _relogin(self):
+        """Discard the session token and log in again."""
+        logger.info("Session token rejected or stale, logging in again.")
+        try:
+            self.client.session_manager.invalidate()
+            await self.client.refresh_session()
+        except (Exception, SystemExit) as e:
+            # authenticate() exits the process on a failed login
+            logger.warning(f"Login during reconnect failed: {e}")
+
+    async def _replay(self):
+        """Send the subscription frames of every stream active before the drop."""
+        await self.client.re_subscribe_stream()
+
+    async def _backfill(self):
+        """Fetch the candles missed while disconnected for every active stream."""
+        api = self.client.api
+        for asset, period in self.client.subscriptions.keys():
+            if not period:
+                # Tick-only streams have no candle series to backfill
+                continue
+            since = api.last_tick_time.get(asset, self.last_disconnect)
+            since = min(since, self.last_disconnect)
+            offset = int(time.time() - since) + period
+            try:
+                candles = await self.client.get_candles(asset, time.time(), offset, period)
+            except Exception as e:
+                logger.warning(f"Backfill failed for {asset}: {e}")
+                continue
+            start = since - since % period
+            candles = [c for c in candles or [] if c.get("time", 0) >= start]
+            if not candles:
+                continue
+            logger.debug(f"Backfilled {len(candles)} candles for {asset} ({period}s).")
+            api.backfilled_candles[asset] = candles
+            callback = self.client.on_backfill
+            if callback:
+                result = callback(asset, period, candles)
+                if inspect.isawaitable(result):
+                    await result
@@ -0,0 +1,55 @@
+from pyquotex.utils.candle_cache import CANDLE_BYTES, CandleCache
+
+
+def candles_at(*times, close=1.0):
+    return [{"time": t, "open": 1.0, "close": close, "high": 1.0, "low": 1.0} for t in times]
+
+
+def test_store_merges_and_slices():
+    cache = CandleCache()
+    cache.store("EURUSD", 60, candles_at(0, 60, 120), start=0, end=150)
+    series = cache.store("EURUSD", 60, candles_at(120, 180, close=2.0), end=200)
+    assert series.times == [0, 60, 120, 180]
+    assert series.candles[2]["close"] == 2.0
+    assert series.fetched_until == 200
+    assert series.covers(0) and not series.covers(-60)
+    assert [c["time"] for c in series.slice(60, 120)] == [60, 120]
+
+
+def test_get_returns_none_for_unknown_series():
+    cache = CandleCache()
+    assert cache.get("EURUSD", 60) is None
+    assert len(cache) == 0
+
+
+def test_evicts_least_recently_used():
+    cache = CandleCache(max_bytes=4 * CANDLE_BYTES)
+    cache.store("A", 60, candles_at(0, 60))
+    cache.store("B", 60, candles_at(0, 60))
+    cache.get("A", 60)
+    cache.store("C", 60, candles_at(0, 60))
+    assert cache.get("B", 60) is None
+    assert cache.get("A", 60) is not None
+    assert cache.size <= 4 * CANDLE_BYTES
+
+
+def test_invalidate():
+    cache = CandleCache()
+    cache.store("A", 60, candles_at(0))
+    cache.store("A", 5, candles_at(0))
+    cache.store("B", 60, candles_at(0))
+    cache.invalidate("A", 60)
+    assert cache.get("A", 60) is None and cache.get("A", 5) is not None
+    cache.invalidate()
+    assert len(cache) == 0 and cache.size == 0
+
+
+def test_empty_gaps_are_remembered():
+    cache = CandleCache()
+    cache.mark_empty("A", 60, 1000, 5000)
+    assert cache.known_empty("A", 60, 1000, 5000)
+    assert cache.known_empty("A", 60, 2000, 3000)
+    assert not cache.known_empty("A", 60, 900, 3000)
+    assert not cache.known_empty("A", 5, 2000, 3000)
+    cache.invalidate("A")
+    assert not cache.known_empty("A", 60, 2000, 3000)
@@ -0,0 +1,18 @@
+from pyquotex.crawler import response_candles, split_range
+
+
+def test_split_range_aligns_chunks():
+    assert split_range(100, 250, 100) == [(100, 200), (200, 300)]
+    assert split_range(150, 250, 100) == [(100, 200), (200, 300)]
+    assert split_range(0, 300, 100) == [(0, 100), (100, 200), (200, 300)]
+
+
+def test_split_range_empty():
+    assert split_range(300, 300, 100) == []
+
+
+def test_response_candles_from_rows():
+    message = {"candles": [[120, 1, 2, 3, 0.5, 4], [60, 1, 1, 1, 1, 1]]}
+    candles = response_candles(message, 60)
+    assert [c["time"] for c in candles] == [60, 120]
+    assert candles[1] == {"time": 120, "open": 1, "close": 2, "high": 3, "low": 0.5, "ticks": 4}
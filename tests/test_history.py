@@ -0,0 +1,47 @@
+import asyncio
+
+from pyquotex.ws.objects.history import HistoryResponses
+
+
+def rows(*times):
+    return [[t, 1, 1, 1, 1, 1] for t in times]
+
+
+def test_tagged_response_goes_to_its_request():
+    async def run():
+        responses = HistoryResponses()
+        first_index, first = responses.add("EURUSD")
+        second_index, second = responses.add("EURUSD")
+        assert second_index > first_index
+        responses.resolve({"asset": "EURUSD", "index": second_index, "candles": []})
+        await asyncio.sleep(0.01)
+        assert second.done() and not first.done()
+
+    asyncio.run(run())
+
+
+def test_late_response_after_timeout_is_dropped():
+    async def run():
+        responses = HistoryResponses()
+        index, _ = responses.add("EURUSD", end=6000)
+        responses.discard("EURUSD", index)
+        _, retry = responses.add("EURUSD", end=3000)
+        responses.resolve({"asset": "EURUSD", "period": 60, "candles": rows(5880, 5940)})
+        await asyncio.sleep(0.01)
+        assert not retry.done()
+        responses.resolve({"asset": "EURUSD", "period": 60, "candles": rows(2880, 2940)})
+        await asyncio.sleep(0.01)
+        assert retry.result()["candles"] == rows(2880, 2940)
+
+    asyncio.run(run())
+
+
+def test_untagged_response_newer_than_the_request_is_dropped():
+    async def run():
+        responses = HistoryResponses()
+        _, future = responses.add("EURUSD", end=3000)
+        responses.resolve({"asset": "EURUSD", "period": 60, "candles": rows(5880)})
+        await asyncio.sleep(0.01)
+        assert not future.done()
+
+    asyncio.run(run())
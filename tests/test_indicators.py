@@ -0,0 +1,32 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyquotex.utils.indicators import linear_filter  # noqa: E402
+
+
+def reference(values, alpha, seed):
+    out, previous = [], seed
+    for value in values:
+        previous = alpha * value + (1 - alpha) * previous
+        out.append(previous)
+    return np.array(out)
+
+
+@pytest.mark.parametrize("alpha", [2 / 15, 0.5, 1 / 14, 0.001])
+def test_linear_filter_matches_recursion(alpha):
+    values = np.random.default_rng(1).normal(100, 5, 5000)
+    np.testing.assert_allclose(linear_filter(values, alpha, values[0]), reference(values, alpha, values[0]),
+                               rtol=1e-9)
+
+
+def test_linear_filter_rows_have_their_own_seed():
+    values = np.arange(20, dtype=float).reshape(2, 10)
+    out = linear_filter(values, 0.3, [0.0, 50.0])
+    np.testing.assert_allclose(out[0], reference(values[0], 0.3, 0.0))
+    np.testing.assert_allclose(out[1], reference(values[1], 0.3, 50.0))
+
+
+def test_linear_filter_alpha_one_and_empty():
+    np.testing.assert_array_equal(linear_filter([1.0, 2.0], 1.0, 0.0), [1.0, 2.0])
+    assert linear_filter([], 0.5, 0.0).size == 0
@@ -0,0 +1,76 @@
+import time
+
+from pyquotex.ws import limiter as limiter_module
+from pyquotex.ws.limiter import RateLimiter, TokenBucket
+
+
+def subscribe_frame(i):
+    return f'42["instruments/update",{{"asset":"A{i}","period":60}}]'
+
+
+def test_classify():
+    assert RateLimiter.classify(subscribe_frame(0)) == "subscribe"
+    assert RateLimiter.classify('42["history/load",{}]') == "history"
+    assert RateLimiter.classify('42["orders/open",{}]') == "orders"
+    assert RateLimiter.classify('42["tick"]') == "orders"
+    assert RateLimiter.classify("2") is None
+
+
+def test_bucket_penalty_halves_rate_and_recovers():
+    bucket = TokenBucket(10, 10, min_rate=1, increase=1)
+    bucket.penalize()
+    assert bucket.rate == 5
+    assert bucket.tokens == 0
+    bucket.refill(bucket.updated + 2)
+    assert bucket.rate == 7
+    for _ in range(5):
+        bucket.penalize()
+    assert bucket.rate == 1
+
+
+def test_burst_is_sent_and_the_rest_queued_in_order():
+    limiter = RateLimiter({"subscribe": (50, 3)})
+    sent = []
+    results = [limiter.send(subscribe_frame(i), sent.append) for i in range(6)]
+    assert results == [True, True, True, False, False, False]
+    assert limiter.pending() == 3
+
+    deadline = time.monotonic() + 2
+    while limiter.pending() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert sent == [subscribe_frame(i) for i in range(6)]
+    assert limiter.stats()["subscribe"]["sent"] == 6
+
+
+def test_orders_are_never_queued():
+    limiter = RateLimiter({"subscribe": (1, 1), "orders": (1, 1)})
+    sent = []
+    limiter.send(subscribe_frame(0), sent.append)
+    limiter.send(subscribe_frame(1), sent.append)
+    for _ in range(3):
+        assert limiter.send('42["orders/open",{}]', sent.append)
+    assert sent == [subscribe_frame(0)] + ['42["orders/open",{}]'] * 3
+    limiter.clear()
+    assert limiter.pending() == 0
+
+
+def test_unclassified_frames_pass_through():
+    limiter = RateLimiter()
+    sent = []
+    assert limiter.send("3", sent.append)
+    assert sent == ["3"]
+
+
+def test_penalize_skips_orders():
+    limiter = RateLimiter()
+    limiter.penalize("disconnect")
+    stats = limiter.stats()
+    assert stats["subscribe"]["rate"] < stats["subscribe"]["max_rate"]
+    assert stats["orders"]["penalties"] == 0
+
+
+def test_only_listed_throttling_errors_count(monkeypatch):
+    for reason in ("not_money", "Invalid asset", "deal limit exceeded", None):
+        assert not RateLimiter.throttled(reason)
+    monkeypatch.setattr(limiter_module, "THROTTLE_ERRORS", frozenset({"rate_limit"}))
+    assert RateLimiter.throttled("rate_limit")
@@ -0,0 +1,84 @@
+import asyncio
+
+from pyquotex.ws.objects.orders import PendingOrders
+
+
+def settle():
+    return asyncio.sleep(0.01)
+
+
+def test_resolve_by_request_id():
+    async def run():
+        orders = PendingOrders()
+        first = orders.add(1, "EURUSD")
+        second = orders.add(2, "EURUSD")
+        orders.resolve({"id": "b", "asset": "EURUSD", "requestId": 2})
+        await settle()
+        assert not first.done()
+        assert second.result() == (True, {"id": "b", "asset": "EURUSD", "requestId": 2})
+        assert len(orders) == 1
+
+    asyncio.run(run())
+
+
+def test_resolve_without_request_id_takes_oldest_on_asset():
+    async def run():
+        orders = PendingOrders()
+        other = orders.add(1, "GBPUSD")
+        first = orders.add(2, "EURUSD")
+        second = orders.add(3, "EURUSD")
+        orders.resolve({"id": "a", "asset": "EURUSD"})
+        await settle()
+        assert first.done() and not second.done() and not other.done()
+
+    asyncio.run(run())
+
+
+def test_untagged_errors_fail_only_known_order_errors():
+    async def run():
+        orders = PendingOrders()
+        future = orders.add(1, "EURUSD")
+        for reason in ("Asset subscription failed", "deal limit", "amount"):
+            orders.fail({"error": reason})
+        await settle()
+        assert not future.done()
+        orders.fail({"error": "not_money"})
+        await settle()
+        assert future.result() == (False, "not_money")
+
+    asyncio.run(run())
+
+
+def test_untagged_error_with_asset_fails_that_asset_only():
+    async def run():
+        orders = PendingOrders()
+        other = orders.add(1, "GBPUSD")
+        future = orders.add(2, "EURUSD")
+        orders.fail({"error": "not_money", "asset": "EURUSD"})
+        await settle()
+        assert future.done() and not other.done()
+
+    asyncio.run(run())
+
+
+def test_fail_by_request_id_whatever_the_reason():
+    async def run():
+        orders = PendingOrders()
+        future = orders.add(7, "EURUSD")
+        orders.fail({"error": "unknown", "requestId": 7})
+        await settle()
+        assert future.result() == (False, "unknown")
+
+    asyncio.run(run())
+
+
+def test_request_ids_are_unique_and_discard():
+    async def run():
+        orders = PendingOrders()
+        ids = {orders.next_request_id() for _ in range(1000)}
+        assert len(ids) == 1000
+        orders.add(1, "EURUSD")
+        orders.discard(1)
+        assert len(orders) == 0
+
+    asyncio.run(run())
@@ -0,0 +1,76 @@
+import pytest
+
+from pyquotex.utils.processor import (
+    fill_gaps_from_ticks,
+    find_gaps,
+    merge_candles_with_gaps,
+    resample_ticks,
+)
+
+np = pytest.importorskip("numpy")
+
+
+def candles_at(*times):
+    return [{"time": t, "open": 1, "close": 1, "high": 1, "low": 1} for t in times]
+
+
+def test_find_gaps_between_candles():
+    assert find_gaps(candles_at(0, 60, 240, 300), 60) == [(120, 240)]
+    assert find_gaps(candles_at(0, 60, 120), 60) == []
+
+
+def test_find_gaps_at_range_edges():
+    assert find_gaps(candles_at(120, 180), 60, start=0, end=300) == [(0, 120), (240, 360)]
+    assert find_gaps([], 60, start=0, end=60) == [(0, 120)]
+
+
+def test_merge_candles_with_gaps_drops_duplicates():
+    candles, gaps = merge_candles_with_gaps(candles_at(120, 0, 0, 240), 60)
+    assert [c["time"] for c in candles] == [0, 120, 240]
+    assert gaps == [(60, 120), (180, 240)]
+
+
+def test_fill_gaps_from_ticks_rebuilds_covered_candles():
+    ticks = [{"time": t, "price": p} for t, p in [(60, 1.0), (80, 1.5), (110, 0.5), (120, 0.8), (130, 0.9)]]
+    candles, gaps = fill_gaps_from_ticks(candles_at(0, 180), [(60, 180)], ticks, 60)
+    assert [c["time"] for c in candles] == [0, 60, 180]
+    rebuilt = candles[1]
+    assert (rebuilt["open"], rebuilt["high"], rebuilt["low"], rebuilt["close"]) == (1.0, 1.5, 0.5, 0.5)
+    # The 120 candle has only part of its ticks, so it stays missing
+    assert gaps == [(120, 180)]
+
+
+def test_fill_gaps_from_ticks_without_ticks():
+    candles = candles_at(0, 180)
+    assert fill_gaps_from_ticks(candles, [(60, 180)], [], 60) == (candles, [(60, 180)])
+
+
+def test_resample_ticks_ohlc():
+    times = [0, 10, 20, 65, 70, 130]
+    prices = [1.0, 3.0, 2.0, 5.0, 4.0, 6.0]
+    candles = resample_ticks(times, prices, 60)
+    assert candles["time"].tolist() == [0, 60, 120]
+    assert candles["open"].tolist() == [1.0, 5.0, 6.0]
+    assert candles["high"].tolist() == [3.0, 5.0, 6.0]
+    assert candles["low"].tolist() == [1.0, 4.0, 6.0]
+    assert candles["close"].tolist() == [2.0, 4.0, 6.0]
+    assert candles["ticks"].tolist() == [3, 2, 1]
+
+
+def test_resample_ticks_sorts_and_drops_partial():
+    candles = resample_ticks([65, 0, 10], [5.0, 1.0, 2.0], 60, include_partial=False)
+    assert candles["time"].tolist() == [0]
+    assert candles["close"].tolist() == [2.0]
+
+
+def test_resample_ticks_fills_gaps_with_flat_candles():
+    candles = resample_ticks([0, 10, 130], [1.0, 2.0, 3.0], 60, fill_gaps=True)
+    assert candles["time"].tolist() == [0, 60, 120]
+    assert candles["open"].tolist() == [1.0, 2.0, 3.0]
+    assert candles["close"].tolist() == [2.0, 2.0, 3.0]
+    assert candles["ticks"].tolist() == [2, 0, 1]
+
+
+def test_resample_ticks_empty():
+    candles = resample_ticks([], [], 60)
+    assert candles["time"].size == 0
@@ -0,0 +1,153 @@
+import asyncio
+
+from pyquotex.subscriptions import SubscriptionManager
+
+
+class FakeApi:
+
+    def __init__(self):
+        self.frames = []
+        self.closed = False
+
+    def subscribe_realtime_candle(self, asset, period):
+        self.frames.append(("subscribe", asset, period))
+
+    def chart_notification(self, asset):
+        self.frames.append(("chart", asset))
+
+    def follow_candle(self, asset):
+        self.frames.append(("follow", asset))
+
+    def unsubscribe_realtime_candle(self, asset):
+        if self.closed:
+            raise ConnectionError("socket is already closed")
+        self.frames.append(("unsubscribe", asset))
+
+    def unfollow_candle(self, asset):
+        self.frames.append(("unfollow", asset))
+
+
+class FakeClient:
+
+    def __init__(self):
+        self.api = FakeApi()
+
+
+def manager(linger=0):
+    return SubscriptionManager(FakeClient(), linger=linger)
+
+
+def test_first_acquire_subscribes_once():
+    subscriptions = manager()
+    subscriptions.acquire("EURUSD", 60)
+    subscriptions.acquire("EURUSD", 60)
+    subscriptions.acquire("EURUSD", 5)
+    assert subscriptions.client.api.frames == [
+        ("subscribe", "EURUSD", 60), ("chart", "EURUSD"), ("follow", "EURUSD"),
+        ("subscribe", "EURUSD", 5),
+    ]
+    assert subscriptions.refs("EURUSD", 60) == 2
+
+
+def test_last_release_unsubscribes_without_loop():
+    subscriptions = manager()
+    subscriptions.acquire("EURUSD", 60)
+    subscriptions.acquire("EURUSD", 60)
+    subscriptions.release("EURUSD", 60)
+    assert ("unsubscribe", "EURUSD") not in subscriptions.client.api.frames
+    subscriptions.release("EURUSD", 60)
+    assert subscriptions.client.api.frames[-2:] == [("unsubscribe", "EURUSD"), ("unfollow", "EURUSD")]
+    assert subscriptions.streams() == {}
+
+
+def test_release_lingers_and_acquire_cancels_it():
+    async def run():
+        subscriptions = manager(linger=0.05)
+        subscriptions.acquire("EURUSD", 60)
+        subscriptions.release("EURUSD", 60)
+        subscriptions.acquire("EURUSD", 60)
+        await asyncio.sleep(0.1)
+        assert "EURUSD" in subscriptions.streams()
+        subscriptions.release("EURUSD", 60)
+        await asyncio.sleep(0.1)
+        return subscriptions
+
+    subscriptions = asyncio.run(run())
+    assert subscriptions.streams() == {}
+    assert subscriptions.client.api.frames.count(("subscribe", "EURUSD", 60)) == 1
+
+
+def test_ensure_lingers_and_repeats_send_nothing():
+    async def run():
+        subscriptions = manager(linger=0.05)
+        frames = subscriptions.client.api.frames
+        subscriptions.ensure("EURUSD", 60)
+        assert frames == [("subscribe", "EURUSD", 60), ("chart", "EURUSD"), ("follow", "EURUSD")]
+        for _ in range(3):
+            await asyncio.sleep(0.03)
+            subscriptions.ensure("EURUSD", 60)
+        assert len(frames) == 3
+        assert subscriptions.refs("EURUSD", 60) == 0
+        await asyncio.sleep(0.1)
+        assert frames[-2:] == [("unsubscribe", "EURUSD"), ("unfollow", "EURUSD")]
+        assert subscriptions.streams() == {}
+
+    asyncio.run(run())
+
+
+def test_acquire_after_ensure_keeps_the_stream():
+    async def run():
+        subscriptions = manager(linger=0.02)
+        subscriptions.ensure("EURUSD", 60)
+        subscriptions.acquire("EURUSD", 60)
+        await asyncio.sleep(0.05)
+        assert subscriptions.client.api.frames == [
+            ("subscribe", "EURUSD", 60), ("chart", "EURUSD"), ("follow", "EURUSD"),
+        ]
+        assert subscriptions.refs("EURUSD", 60) == 1
+
+    asyncio.run(run())
+
+
+def test_stop_releases_only_the_owner():
+    subscriptions = manager()
+    subscriptions.acquire("EURUSD", 60)
+    subscriptions.acquire("EURUSD", 60)
+    subscriptions.acquire("EURUSD", 60, owner="timeframes")
+    subscriptions.stop("EURUSD")
+    assert subscriptions.refs("EURUSD", 60) == 1
+    assert subscriptions.refs("EURUSD", 60, owner="timeframes") == 1
+    subscriptions.stop("EURUSD", owner="timeframes")
+    assert subscriptions.streams() == {}
+
+
+def test_replay_resends_every_stream():
+    subscriptions = manager()
+    subscriptions.acquire("EURUSD", 60)
+    subscriptions.acquire("GBPUSD", 5)
+    subscriptions.client.api.frames.clear()
+    subscriptions.replay()
+    assert subscriptions.client.api.frames == [
+        ("subscribe", "EURUSD", 60), ("chart", "EURUSD"), ("follow", "EURUSD"),
+        ("subscribe", "GBPUSD", 5), ("chart", "GBPUSD"), ("follow", "GBPUSD"),
+    ]
+
+
+def test_drop_on_closed_socket_does_not_raise():
+    async def run():
+        subscriptions = manager(linger=0.01)
+        subscriptions.acquire("EURUSD", 60)
+        subscriptions.client.api.closed = True
+        subscriptions.release("EURUSD", 60)
+        await asyncio.sleep(0.05)
+        return subscriptions
+
+    assert asyncio.run(run()).streams() == {}
+
+
+def test_keys_lists_every_period_of_an_asset():
+    subscriptions = manager()
+    subscriptions.acquire("EURUSD", 60)
+    subscriptions.acquire("EURUSD", 300)
+
+    assert sorted(subscriptions.keys()) == [("EURUSD", 60), ("EURUSD", 300)]
@@ -0,0 +1,27 @@
+from pyquotex.ws.objects.timesync import TimeSync
+
+
+def test_larger_offset_is_taken_at_once():
+    timesync = TimeSync()
+    timesync.sample(100.0, received_at=100.0)
+    timesync.sample(100.25, received_at=100.0)
+
+    assert timesync.offset == 0.25
+
+
+def test_single_jump_is_ignored():
+    timesync = TimeSync()
+    timesync.sample(100.0, received_at=100.0)
+    timesync.sample(160.0, received_at=101.0)
+    timesync.sample(102.0, received_at=102.0)
+
+    assert timesync.offset == 0
+
+
+def test_confirmed_jump_is_adopted():
+    timesync = TimeSync()
+    timesync.sample(100.0, received_at=100.0)
+    timesync.sample(106.0, received_at=101.0)
+    timesync.sample(107.0, received_at=102.0)
+
+    assert timesync.offset == 5.0